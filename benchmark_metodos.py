@@ -0,0 +1,81 @@
+# Script de utilidad para medir el rendimiento de los métodos numéricos
+# Uso: python benchmark_metodos.py [--iteraciones N] [--tamanos 4 10 100 ...]
+
+import argparse
+import time
+
+import numpy as np
+
+from controllers.metodos import jacobi
+
+# Tamaños de sistema a medir por defecto
+TAMANOS_DEFAULT = [4, 10, 50, 100, 250, 500, 1000, 2000]
+
+
+def _jacobi_referencia(A, b, tol=1e-10, max_iter=1000):
+    """
+    Implementación original de Jacobi (doble ciclo en Python puro).
+    Se conserva aquí únicamente como referencia para el benchmark.
+    """
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    n = len(b)
+
+    x = np.zeros(n)
+    x_new = np.zeros(n)
+
+    for iter_count in range(max_iter):
+        for i in range(n):
+            suma = 0
+            for j in range(n):
+                if j != i:
+                    suma += A[i, j] * x[j]
+            x_new[i] = (b[i] - suma) / A[i, i]
+
+        if np.linalg.norm(x_new - x, ord=np.inf) < tol:
+            return x_new, iter_count + 1, True
+
+        x = x_new.copy()
+
+    return x, max_iter, False
+
+
+def sistema_diagonal_dominante(n, seed=0):
+    """Genera un sistema aleatorio estrictamente diagonal dominante."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1.0, 1.0, size=(n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    b = rng.uniform(-10.0, 10.0, size=n)
+    return A, b
+
+
+def medir(funcion, A, b, iteraciones):
+    """Ejecuta exactamente `iteraciones` barridos (tol=0) y devuelve el tiempo."""
+    inicio = time.perf_counter()
+    x, _, _ = funcion(A, b, tol=0.0, max_iter=iteraciones)
+    return time.perf_counter() - inicio, x
+
+
+def run_benchmark(tamanos, iteraciones):
+    print(f"⏱️  Jacobi: referencia vs vectorizado ({iteraciones} iteraciones por caso)\n")
+    print(f"{'n':>6} | {'referencia (s)':>15} | {'vectorizado (s)':>15} | {'speedup':>9} | {'error max':>10}")
+    print("-" * 68)
+
+    for n in tamanos:
+        A, b = sistema_diagonal_dominante(n)
+
+        t_ref, x_ref = medir(_jacobi_referencia, A, b, iteraciones)
+        t_vec, x_vec = medir(jacobi, A, b, iteraciones)
+
+        speedup = t_ref / t_vec if t_vec > 0 else float("inf")
+        error = np.max(np.abs(x_ref - x_vec))
+        print(f"{n:>6} | {t_ref:>15.4f} | {t_vec:>15.4f} | {speedup:>8.1f}x | {error:>10.2e}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark de los métodos de MatrixSolver")
+    parser.add_argument("--iteraciones", type=int, default=20, help="Barridos por caso (default: 20)")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS_DEFAULT, help="Tamaños n a medir")
+    args = parser.parse_args()
+
+    run_benchmark(args.tamanos, args.iteraciones)
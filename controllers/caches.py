@@ -0,0 +1,610 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from controllers.matriz_csr import MatrizCSR
+from controllers.fuera_de_memoria import _origen_memmap
+from controllers.metodos import HistorialIteraciones, ResultDetail, _filas_por_bloque, _residuo_inf, factorizar_lu, resolver_con_metodo, resolver_lu
+
+def huella_matriz(A):
+    '''
+    Huella rápida de una matriz: hash de sus bytes junto con su forma y tipo.
+    '''
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(memoryview(A).cast("B"), digest_size=16).hexdigest()
+    return (A.shape, A.dtype.str, digest)
+
+
+class CacheFactorizaciones:
+    '''
+    Caché LRU de factorizaciones LU indexada por la huella de A.
+    Permite resolver el mismo A contra muchos b haciendo solo el trabajo
+    triangular O(n^2) en las llamadas repetidas.
+    '''
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        '''
+        Parámetros:
+        - max_bytes (int): Presupuesto de memoria para las factorizaciones
+          guardadas. Las menos usadas recientemente se descartan al excederlo.
+        '''
+        self.max_bytes = max_bytes
+        self.entradas = OrderedDict()
+        self.bytes_usados = 0
+        self.hits = 0
+        self.misses = 0
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._desalojar()
+
+    def get_max_bytes(self):
+        return self.max_bytes
+
+    def obtener(self, A):
+        '''
+        Devuelve (LU, perm) para A, factorizando solo si no está en caché.
+        '''
+        A = np.asarray(A, dtype=float)
+        clave = huella_matriz(A)
+
+        if clave in self.entradas:
+            self.hits += 1
+            self.entradas.move_to_end(clave)
+            return self.entradas[clave]
+
+        self.misses += 1
+        LU, perm = factorizar_lu(A)
+
+        tamano = LU.nbytes + perm.nbytes
+        if tamano <= self.max_bytes:
+            self.entradas[clave] = (LU, perm)
+            self.bytes_usados += tamano
+            self._desalojar()
+
+        return LU, perm
+
+    def resolver(self, A, b):
+        '''
+        Resuelve Ax = b reutilizando la factorización de A si existe.
+        '''
+        LU, perm = self.obtener(A)
+        return resolver_lu(LU, perm, b)
+
+    def _desalojar(self):
+        while self.bytes_usados > self.max_bytes and len(self.entradas) > 0:
+            _, (LU, perm) = self.entradas.popitem(last=False)
+            self.bytes_usados -= LU.nbytes + perm.nbytes
+
+    def limpiar(self):
+        self.entradas.clear()
+        self.bytes_usados = 0
+
+    def reiniciar_contadores(self):
+        self.hits = 0
+        self.misses = 0
+
+    def estadisticas(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entradas": len(self.entradas),
+            "bytes_usados": self.bytes_usados,
+            "max_bytes": self.max_bytes
+        }
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+# Caché compartida por la aplicación
+cache_lu = CacheFactorizaciones()
+
+
+def lu_cacheado(A, b, cache=None, detail=None):
+    """
+    Resuelve Ax = b con LU, reutilizando la factorización de A si ya se
+    calculó antes (ver CacheFactorizaciones).
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n) o matriz (n x k)
+    cache : CacheFactorizaciones, opcional
+        Caché a utilizar (default: cache_lu)
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran los contadores de la caché
+
+    Retorna:
+    --------
+    x : ndarray
+        Solución con la misma forma que b
+    """
+    cache = cache_lu if cache is None else cache
+
+    A = np.array(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+
+    x = cache.resolver(A, b)
+
+    if detail is not None:
+        detail.set_info("cache LU hits", cache.hits)
+        detail.set_info("cache LU misses", cache.misses)
+        detail.set_info("cache LU memoria (bytes)", cache.bytes_usados)
+
+    return x
+
+
+# Una solución reciente se usa como vector inicial solo si su residuo en el
+# sistema nuevo es a lo más esta fracción del de arrancar en cero (||b||)
+UMBRAL_ARRANQUE_EN_CALIENTE = 0.5
+
+
+class SolucionesRecientes:
+    '''
+    Últimas soluciones convergidas, para arrancar en caliente los métodos
+    iterativos cuando el usuario resuelve un sistema parecido (p. ej. tras
+    cambiar un coeficiente). Cada una se guarda con el método que la
+    calculó y su tasa de convergencia (ver tasa_convergencia).
+
+    Un sistema está cerca de uno reciente si la solución de este casi lo
+    resuelve: elegir() mide el residuo de cada solución guardada del mismo
+    tamaño en el sistema nuevo (un producto matriz-vector por candidata, lo
+    mismo que una iteración de Jacobi) y toma la de menor residuo si es a
+    lo más UMBRAL_ARRANQUE_EN_CALIENTE veces el de arrancar en cero. Así no
+    hace falta guardar las matrices de los sistemas anteriores.
+    '''
+    def __init__(self, max_entradas=8, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entradas = deque(maxlen=max_entradas)
+
+    def agregar(self, x, metodo=None, tasa=None):
+        '''
+        Guarda una copia de una solución; las más antiguas se descartan al
+        exceder max_entradas o max_bytes.
+        '''
+        x = np.array(x, dtype=float).reshape(-1)
+        if x.nbytes > self.max_bytes or not np.all(np.isfinite(x)):
+            return
+
+        self.entradas.append((x, metodo, tasa))
+        while sum(e[0].nbytes for e in self.entradas) > self.max_bytes:
+            self.entradas.popleft()
+
+    def elegir(self, A, b):
+        '''
+        Busca la solución reciente más cercana al sistema Ax = b. Devuelve
+        (x0, residuo relativo, método, tasa), o None si ninguna sirve.
+        '''
+        b = np.asarray(b, dtype=float)
+        residuo_frio = float(np.abs(b).max(initial=0.0))
+        if residuo_frio == 0.0:
+            return None
+
+        A = A if isinstance(A, MatrizCSR) else np.asarray(A, dtype=float)
+        mejor, mejor_residuo = None, float("inf")
+
+        # Las más recientes primero: ante un empate gana la última
+        for entrada in reversed(list(self.entradas)):
+            if len(entrada[0]) != len(b):
+                continue
+            residuo = _residuo_inf(A, b, entrada[0])
+            if residuo < mejor_residuo:
+                mejor, mejor_residuo = entrada, residuo
+
+        if mejor is None or mejor_residuo > UMBRAL_ARRANQUE_EN_CALIENTE * residuo_frio:
+            return None
+
+        x, metodo, tasa = mejor
+        return x, mejor_residuo / residuo_frio, metodo, tasa
+
+    def limpiar(self):
+        self.entradas.clear()
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+# Soluciones recientes de la aplicación (ver resolver_con_metodo)
+soluciones_recientes = SolucionesRecientes()
+
+
+
+def _actualizar_huella(digest, arreglo):
+    '''
+    Agrega un arreglo en memoria a la huella. Si no es contiguo (p. ej. un
+    corte de la matriz aumentada) se recorre por bloques de filas en lugar
+    de copiarlo entero; los bytes, y por lo tanto la huella, son los mismos.
+    '''
+    digest.update(f"{arreglo.shape}{arreglo.dtype.str}".encode())
+
+    if arreglo.flags.c_contiguous:
+        digest.update(memoryview(arreglo).cast("B"))
+        return
+
+    filas_bloque = _filas_por_bloque(arreglo.shape[1] if arreglo.ndim > 1 else 1)
+    for inicio in range(0, arreglo.shape[0], filas_bloque):
+        digest.update(memoryview(np.ascontiguousarray(arreglo[inicio:inicio + filas_bloque])).cast("B"))
+
+
+def _actualizar_huella_origen(digest, origen):
+    '''
+    Agrega a la huella un arreglo mapeado desde disco por su ubicación (ver
+    _origen_memmap) y la versión del archivo, sin leerlo: leer una A más
+    grande que la RAM solo para calcular la clave anularía a los métodos
+    fuera de memoria.
+    '''
+    ruta, desplazamiento, forma, strides, tipo = origen
+    estado = os.stat(ruta)
+    digest.update(f"memmap|{os.path.realpath(ruta)}|{estado.st_size}|{estado.st_mtime_ns}|{desplazamiento}|{forma}|{strides}|{tipo}".encode())
+
+
+def clave_solucion(metodo, A, b, tol, max_iter):
+    '''
+    Clave de contenido de una resolución: hash de A (densa o MatrizCSR) y
+    de b junto con el método, la tolerancia y max_iter. Un np.memmap (o una
+    vista suya) se identifica por su archivo, su posición en él y la fecha
+    de modificación del archivo, en lugar de por su contenido.
+
+    Devuelve None si A es un np.memmap cuyo archivo no se puede ubicar: la
+    resolución no debe pasar por la caché.
+    '''
+    digest = hashlib.blake2b(f"{metodo}|{float(tol)!r}|{int(max_iter)}".encode(), digest_size=20)
+
+    for arreglo in (A, b):
+        origen = _origen_memmap(arreglo)
+
+        if isinstance(arreglo, MatrizCSR):
+            digest.update(b"csr")
+            for parte in (arreglo.valores, arreglo.col_idx, arreglo.row_ptr):
+                _actualizar_huella(digest, parte)
+            digest.update(f"{arreglo.shape}".encode())
+        elif origen is not None:
+            try:
+                _actualizar_huella_origen(digest, origen)
+            except OSError:
+                return None
+        elif isinstance(arreglo, np.memmap):
+            return None
+        else:
+            _actualizar_huella(digest, np.asarray(arreglo, dtype=float))
+
+    return digest.hexdigest()
+
+
+# Memoria máxima (en bytes) del historial de iterados que se guarda con
+# cada entrada de la caché de soluciones
+MAX_BYTES_HISTORIAL_CACHE = 1024 * 1024
+
+
+def _valor_json(valor):
+    '''
+    Convierte a JSON los valores de numpy que quedan en info y demás
+    campos de ResultDetail; cualquier otro objeto se guarda como texto.
+    '''
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    return str(valor)
+
+
+class CacheSoluciones:
+    '''
+    Caché LRU de soluciones (x, ResultDetail) indexada por clave_solucion.
+    Cada entrada se guarda serializada: su tamaño es exacto y cada acierto
+    devuelve copias nuevas, que la UI puede modificar sin afectar la caché.
+
+    Una entrada es un .npz con x, los iterados y el historial de residuos
+    como arreglos y el resto del ResultDetail como JSON; se lee sin
+    pickle, así que un archivo ajeno en la carpeta no puede ejecutar
+    código. El historial de iterados se recorta a MAX_BYTES_HISTORIAL_CACHE.
+
+    Con un directorio, las entradas también se escriben a disco (un archivo
+    por clave) y sobreviven a un reinicio de la aplicación; los aciertos en
+    disco vuelven a memoria. El disco tiene su propio presupuesto y se
+    desaloja por fecha de último uso.
+    '''
+    EXTENSION = ".npz"
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, directorio=None, max_bytes_disco=512 * 1024 * 1024):
+        '''
+        Parámetros:
+        - max_bytes (int): Presupuesto de memoria de las entradas.
+        - directorio (str, opcional): Carpeta para persistir las entradas.
+        - max_bytes_disco (int): Presupuesto de la carpeta.
+        '''
+        self.max_bytes = max_bytes
+        self.max_bytes_disco = max_bytes_disco
+        self.directorio = None
+        self.entradas = OrderedDict()
+        self.bytes_usados = 0
+        self.hits = 0
+        self.misses = 0
+        self.set_directorio(directorio)
+
+    def set_directorio(self, directorio):
+        '''
+        Activa (o con None desactiva) la persistencia en disco. Si la carpeta
+        no se puede crear la caché sigue funcionando solo en memoria.
+        '''
+        if directorio is not None:
+            try:
+                os.makedirs(directorio, exist_ok=True)
+            except OSError:
+                directorio = None
+        self.directorio = directorio
+        self._desalojar_disco()
+
+    def get_directorio(self):
+        return self.directorio
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._desalojar()
+
+    def get_max_bytes(self):
+        return self.max_bytes
+
+    def obtener(self, clave, con_historial=False):
+        '''
+        Devuelve (x, detail) guardados para la clave, o None si no están.
+        Con con_historial, una entrada guardada sin historial de iterados
+        cuenta como miss: no sirve a quien pidió el historial.
+        '''
+        datos = self.entradas.get(clave)
+        en_memoria = datos is not None
+
+        if en_memoria:
+            self.entradas.move_to_end(clave)
+        else:
+            datos = self._leer_disco(clave)
+
+        entrada = None if datos is None else self._deserializar(datos)
+        if entrada is None or (con_historial and entrada[1].iteration_history is None):
+            self.misses += 1
+            return None
+
+        if not en_memoria:
+            self._guardar_memoria(clave, datos)
+
+        self.hits += 1
+        return entrada
+
+    def guardar(self, clave, x, detail):
+        '''
+        Guarda una resolución. Las detenidas por cancelación o tiempo límite
+        no se guardan: su resultado depende de cuándo se detuvieron. Tampoco
+        las arrancadas en caliente que no convergieron, cuyo resultado
+        depende de x0, que no forma parte de la clave.
+        '''
+        if detail.cancelled or detail.timed_out or (detail.warm_start and not detail.converged):
+            return
+
+        datos = self._serializar(x, detail)
+        self._guardar_memoria(clave, datos)
+        self._escribir_disco(clave, datos)
+
+    @staticmethod
+    def _serializar(x, detail):
+        metadatos = detail.to_dict()
+        for campo in ("best_iterate", "iteration_history", "residual_history"):
+            del metadatos[campo]
+
+        # Un acierto responde también a pedidos en frío: el arranque en
+        # caliente de esta resolución no se guarda
+        for campo in ("warm_start", "warm_start_residual", "iterations_saved"):
+            del metadatos[campo]
+
+        arreglos = {
+            "x": np.asarray(x, dtype=float),
+            "residual_history": np.asarray(detail.residual_history, dtype=float)
+        }
+        if detail.best_iterate is not None:
+            arreglos["best_iterate"] = np.asarray(detail.best_iterate, dtype=float)
+        if detail.iteration_history is not None:
+            historial = detail.iteration_history.recortado(MAX_BYTES_HISTORIAL_CACHE)
+            arreglos["historial_iteraciones"] = historial.iteraciones[:len(historial)]
+            arreglos["historial_iterados"] = historial.iterados[:len(historial)]
+            metadatos["iteration_history"] = {"modo": historial.modo, "cada": historial.cada}
+
+        arreglos["detail"] = np.array(json.dumps(metadatos, default=_valor_json))
+        salida = io.BytesIO()
+        np.savez(salida, **arreglos)
+        return salida.getvalue()
+
+    @staticmethod
+    def _deserializar(datos):
+        '''
+        Reconstruye (x, detail) de una entrada, o None si está dañada o no
+        tiene el formato esperado.
+        '''
+        try:
+            with np.load(io.BytesIO(datos), allow_pickle=False) as arreglos:
+                metadatos = json.loads(str(arreglos["detail"]))
+                historial = metadatos.pop("iteration_history", None)
+
+                if historial is not None:
+                    historial = HistorialIteraciones.desde_filas(arreglos["historial_iteraciones"], arreglos["historial_iterados"],
+                                                                 historial["modo"], historial["cada"])
+
+                detail = ResultDetail(**metadatos,
+                                      residual_history=arreglos["residual_history"].tolist(),
+                                      best_iterate=arreglos["best_iterate"] if "best_iterate" in arreglos else None,
+                                      iteration_history=historial)
+                return arreglos["x"], detail
+        except (OSError, EOFError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            return None
+
+    def _guardar_memoria(self, clave, datos):
+        if len(datos) > self.max_bytes:
+            return
+
+        anterior = self.entradas.pop(clave, None)
+        if anterior is not None:
+            self.bytes_usados -= len(anterior)
+
+        self.entradas[clave] = datos
+        self.bytes_usados += len(datos)
+        self._desalojar()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + self.EXTENSION)
+
+    def _leer_disco(self, clave):
+        if self.directorio is None:
+            return None
+
+        try:
+            with open(self._ruta(clave), "rb") as archivo:
+                datos = archivo.read()
+            # La fecha de modificación marca el último uso
+            os.utime(self._ruta(clave))
+            return datos
+        except OSError:
+            return None
+
+    def _escribir_disco(self, clave, datos):
+        if self.directorio is None or len(datos) > self.max_bytes_disco:
+            return
+
+        # Se escribe a un temporal y se renombra: un lector (u otro proceso)
+        # nunca ve una entrada a medio escribir
+        try:
+            descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(datos)
+            os.replace(temporal, self._ruta(clave))
+        except OSError:
+            return
+
+        self._desalojar_disco()
+
+    def _desalojar(self):
+        while self.bytes_usados > self.max_bytes and len(self.entradas) > 0:
+            _, datos = self.entradas.popitem(last=False)
+            self.bytes_usados -= len(datos)
+
+    def _entradas_disco(self):
+        '''
+        Lista (fecha de último uso, bytes, ruta) de las entradas en disco.
+        '''
+        if self.directorio is None:
+            return []
+
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(self.EXTENSION):
+                ruta = os.path.join(self.directorio, nombre)
+                try:
+                    estado = os.stat(ruta)
+                except OSError:
+                    continue
+                entradas.append((estado.st_mtime, estado.st_size, ruta))
+        return entradas
+
+    def _desalojar_disco(self):
+        entradas = sorted(self._entradas_disco())
+        total = sum(tamano for _, tamano, _ in entradas)
+
+        for _, tamano, ruta in entradas:
+            if total <= self.max_bytes_disco:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+            total -= tamano
+
+    def limpiar(self, disco=False):
+        '''
+        Vacía la caché en memoria y, si disco es True, también la carpeta.
+        '''
+        self.entradas.clear()
+        self.bytes_usados = 0
+
+        if disco:
+            for _, _, ruta in self._entradas_disco():
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    pass
+
+    def reiniciar_contadores(self):
+        self.hits = 0
+        self.misses = 0
+
+    def estadisticas(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entradas": len(self.entradas),
+            "bytes_usados": self.bytes_usados,
+            "max_bytes": self.max_bytes,
+            "entradas_disco": len(self._entradas_disco()),
+            "directorio": self.directorio
+        }
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+# Caché de soluciones compartida por la aplicación (solo en memoria hasta
+# que se le asigne un directorio)
+cache_soluciones = CacheSoluciones()
+
+
+def resolver_con_cache(metodo, A, b, tol=1e-10, max_iter=1000, cache=None, detail=None, registrar_historial=False, **control):
+    """
+    resolver_con_metodo con una caché de soluciones delante: si el mismo
+    sistema ya se resolvió con el mismo método, tolerancia y max_iter, se
+    devuelve la solución guardada sin volver a resolver.
+
+    Parámetros:
+    -----------
+    metodo, A, b, tol, max_iter, detail, registrar_historial
+        Igual que en resolver_con_metodo
+    cache : CacheSoluciones, opcional
+        Caché a utilizar (default: cache_soluciones)
+    **control
+        cancelacion, tiempo_limite, progreso, x0, arranque_en_caliente e
+        incremental de resolver_con_metodo; no forman parte de la clave
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    detail : ResultDetail
+        El detalle guardado (con su tiempo de ejecución original y el
+        historial de iterados recortado, ver CacheSoluciones) o el de la
+        nueva resolución; info["cache soluciones"] indica cuál
+    """
+    cache = cache_soluciones if cache is None else cache
+    clave = clave_solucion(metodo, A, b, tol, max_iter)
+
+    if clave is None:
+        x, detail = resolver_con_metodo(metodo, A, b, tol=tol, max_iter=max_iter, detail=detail, registrar_historial=registrar_historial, **control)
+        detail.set_info("cache soluciones", "no aplica (A en disco)")
+        return x, detail
+
+    guardado = cache.obtener(clave, con_historial=registrar_historial)
+    if guardado is not None:
+        x, detail_guardado = guardado
+        if detail is not None:
+            vars(detail).update(vars(detail_guardado))
+            detail_guardado = detail
+        detail_guardado.set_info("cache soluciones", "hit")
+        return x, detail_guardado
+
+    x, detail = resolver_con_metodo(metodo, A, b, tol=tol, max_iter=max_iter, detail=detail, registrar_historial=registrar_historial, **control)
+    cache.guardar(clave, x, detail)
+    detail.set_info("cache soluciones", "miss")
+    return x, detail
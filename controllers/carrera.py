@@ -0,0 +1,275 @@
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from controllers.fuera_de_memoria import _mapear_origen, _origen_memmap
+from controllers.matriz_csr import MatrizCSR
+from controllers.metodos import METODO_CARRERA, METODOS, ResultDetail, TokenCancelacion, _residuo_inf, resolver_con_metodo
+
+# Métodos que compiten por defecto en una carrera: dos iterativos baratos
+# por iteración y la solución directa
+METODOS_CARRERA = ("Jacobi", "Gauss-Seidel", "LU")
+
+# Segundos que se espera a los perdedores tras la cancelación antes de
+# terminarlos (los métodos directos no revisan la cancelación)
+PLAZO_CANCELACION_CARRERA = 0.5
+
+# Segundos entre dos revisiones de la cola de resultados de la carrera
+PERIODO_CARRERA = 0.01
+
+
+def _compartir_arreglo(arreglo, bloques):
+    '''
+    Copia un arreglo a un bloque de memoria compartida nuevo (que se agrega
+    a bloques) y devuelve su descriptor (nombre, forma, tipo).
+    '''
+    arreglo = np.ascontiguousarray(arreglo)
+    bloque = shared_memory.SharedMemory(create=True, size=max(1, arreglo.nbytes))
+    bloques.append(bloque)
+    np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=bloque.buf)[...] = arreglo
+    return (bloque.name, arreglo.shape, arreglo.dtype.str)
+
+
+def _abrir_arreglo(descriptor, bloques):
+    '''
+    Vista sobre un arreglo compartido con _compartir_arreglo. El bloque se
+    agrega a bloques para cerrarlo cuando la vista ya no se use.
+    '''
+    nombre, forma, tipo = descriptor
+    bloque = shared_memory.SharedMemory(name=nombre)
+    bloques.append(bloque)
+    return np.ndarray(forma, dtype=tipo, buffer=bloque.buf)
+
+
+def _compartir_sistema(A, b, bloques):
+    '''
+    Descriptor del sistema para los procesos de la carrera. Una A densa y
+    los arreglos de una MatrizCSR se copian una sola vez a memoria
+    compartida; un np.memmap, o una vista suya, se vuelve a mapear desde su
+    archivo (ver _origen_memmap), así los procesos comparten las páginas
+    del sistema operativo.
+    '''
+    origen = _origen_memmap(A)
+
+    if isinstance(A, MatrizCSR):
+        matriz = ("csr", A.shape, [_compartir_arreglo(v, bloques) for v in (A.valores, A.col_idx, A.row_ptr)])
+    elif origen is not None:
+        matriz = ("memmap", origen)
+    else:
+        matriz = ("densa", _compartir_arreglo(np.asarray(A, dtype=float), bloques))
+
+    return matriz, _compartir_arreglo(np.asarray(b, dtype=float), bloques)
+
+
+def _abrir_sistema(compartido, bloques):
+    '''
+    Reconstruye (A, b) a partir del descriptor de _compartir_sistema.
+    '''
+    matriz, descriptor_b = compartido
+
+    if matriz[0] == "csr":
+        valores, col_idx, row_ptr = (_abrir_arreglo(d, bloques) for d in matriz[2])
+        A = MatrizCSR(valores, col_idx, row_ptr, matriz[1])
+    elif matriz[0] == "memmap":
+        A = _mapear_origen(matriz[1])
+    else:
+        A = _abrir_arreglo(matriz[1], bloques)
+
+    return A, _abrir_arreglo(descriptor_b, bloques)
+
+
+def _resolver_compartido(metodo, compartido, bloques, tol, max_iter, evento, registrar_historial):
+    A, b = _abrir_sistema(compartido, bloques)
+    return resolver_con_metodo(metodo, A, b, tol=tol, max_iter=max_iter, cancelacion=TokenCancelacion(evento),
+                               registrar_historial=registrar_historial)
+
+
+def _competir(metodo, compartido, tol, max_iter, evento, cola, registrar_historial):
+    '''
+    Cuerpo de cada proceso de la carrera: resuelve el sistema compartido
+    con un método y deja (metodo, x, detail, error) en la cola.
+    '''
+    bloques = []
+    try:
+        x, detail = _resolver_compartido(metodo, compartido, bloques, tol, max_iter, evento, registrar_historial)
+        cola.put((metodo, x, detail, None))
+    except Exception as e:
+        cola.put((metodo, None, None, f"{type(e).__name__}: {e}"))
+    finally:
+        for bloque in bloques:
+            bloque.close()
+
+
+def resolver_en_carrera(A, b, tol=1e-10, max_iter=1000, metodos=METODOS_CARRERA, detail=None, cancelacion=None, tiempo_limite=None,
+                        registrar_historial=False):
+    """
+    Resuelve Ax = b corriendo varios métodos a la vez, cada uno en su
+    propio proceso sobre una misma copia de A y b en memoria compartida.
+    Gana el primero que converge: los demás se cancelan (los iterativos
+    revisan el token entre iteraciones; los que no responden dentro de
+    PLAZO_CANCELACION_CARRERA se terminan).
+
+    Los procesos se crean con el método "spawn", que funciona igual en
+    todas las plataformas y no copia los hilos de la interfaz; arrancar
+    cada uno cuesta unas décimas de segundo, así que la carrera conviene
+    en sistemas grandes, donde no se sabe de antemano qué método es el
+    más rápido.
+
+    Parámetros:
+    -----------
+    A : array_like, MatrizCSR o np.memmap
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia para los métodos iterativos (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    metodos : tuple[str], opcional
+        Métodos que compiten, por su nombre en METODOS (default:
+        METODOS_CARRERA)
+    detail : ResultDetail, opcional
+        Detalle a completar; si no se da se crea uno nuevo
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la carrera desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de la carrera en segundos
+    registrar_historial : bool, opcional
+        Si es True cada método registra sus iterados; queda el del ganador
+
+    Retorna:
+    --------
+    x : ndarray
+        Solución del ganador. Si ninguno converge, la de menor residuo
+    detail : ResultDetail
+        El detalle del ganador, con detail.metodo = ganador,
+        execution_time = tiempo hasta su respuesta y race_results con el
+        estado, tiempo e iteraciones de cada participante
+
+    Raises:
+    -------
+    ValueError
+        Si no hay métodos válidos o todos fallan
+    """
+    detail = ResultDetail() if detail is None else detail
+
+    metodos = list(dict.fromkeys(metodos))
+    desconocidos = [m for m in metodos if m not in METODOS or m == METODO_CARRERA]
+    if len(metodos) == 0 or len(desconocidos) > 0:
+        raise ValueError(f"Métodos inválidos para la carrera: {desconocidos or metodos}")
+
+    contexto = multiprocessing.get_context("spawn")
+    evento = contexto.Event()
+    cola = contexto.Queue()
+    bloques = []
+    procesos = {}
+    resultados = {}     # metodo -> (x, detail, error, segundos desde el inicio)
+    ganador = None
+    motivo = None
+    fin_plazo = None
+
+    inicio = time.perf_counter()
+    limite = None if tiempo_limite is None else inicio + tiempo_limite
+
+    try:
+        compartido = _compartir_sistema(A, b, bloques)
+        for metodo in metodos:
+            procesos[metodo] = contexto.Process(target=_competir, args=(metodo, compartido, tol, max_iter, evento, cola, registrar_historial),
+                                                daemon=True)
+            procesos[metodo].start()
+
+        while len(resultados) < len(procesos):
+            ahora = time.perf_counter()
+            if fin_plazo is None:
+                if cancelacion is not None and cancelacion.cancelado():
+                    motivo = "cancelado"
+                elif limite is not None and ahora >= limite:
+                    motivo = "tiempo agotado"
+                if motivo is not None:
+                    evento.set()
+                    fin_plazo = ahora + PLAZO_CANCELACION_CARRERA
+            elif ahora >= fin_plazo:
+                break
+
+            try:
+                metodo, x, detail_metodo, error = cola.get(timeout=PERIODO_CARRERA)
+            except queue.Empty:
+                # Un proceso que murió sin responder (p. ej. sin memoria)
+                for metodo, proceso in procesos.items():
+                    if metodo not in resultados and proceso.exitcode not in (None, 0):
+                        resultados[metodo] = (None, None, f"el proceso terminó con código {proceso.exitcode}", time.perf_counter() - inicio)
+                continue
+
+            resultados[metodo] = (x, detail_metodo, error, time.perf_counter() - inicio)
+            if ganador is None and motivo is None and detail_metodo is not None and detail_metodo.converged:
+                ganador = metodo
+                evento.set()
+                fin_plazo = time.perf_counter() + PLAZO_CANCELACION_CARRERA
+
+    finally:
+        evento.set()
+        for proceso in procesos.values():
+            if proceso.is_alive():
+                proceso.terminate()
+        for proceso in procesos.values():
+            proceso.join()
+        cola.close()
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+
+    terminado = time.perf_counter() - inicio
+
+    # Sin ganador: el resultado de menor residuo entre los que respondieron
+    if ganador is None:
+        respondieron = [m for m in metodos if m in resultados and resultados[m][0] is not None]
+        if len(respondieron) == 0 and motivo is None:
+            errores = "; ".join(f"{m}: {resultados[m][2]}" for m in metodos if m in resultados)
+            raise ValueError(f"Ningún método de la carrera pudo resolver el sistema ({errores})")
+        if len(respondieron) > 0:
+            ganador = min(respondieron, key=lambda m: _residuo_inf(A, np.asarray(b, dtype=float), resultados[m][0]))
+
+    if ganador is not None:
+        x, detail_ganador, _, tiempo_ganador = resultados[ganador]
+        # El detalle devuelto es el del ganador (iteraciones, historial, info)
+        vars(detail).update(vars(detail_ganador))
+    else:
+        x, tiempo_ganador = np.zeros(len(b)), terminado
+        detail.metodo = METODO_CARRERA
+
+    for metodo in metodos:
+        if metodo not in resultados:
+            detail.set_race_result(metodo, "terminado", terminado, None)
+            continue
+
+        _, detail_metodo, error, tiempo = resultados[metodo]
+        if error is not None:
+            estado = f"error: {error}"
+        elif metodo == ganador and detail_metodo.converged:
+            estado = "ganó"
+        elif detail_metodo.converged:
+            estado = "convergió"
+        elif detail_metodo.cancelled:
+            estado = "cancelado"
+        elif detail_metodo.stop_reason:
+            # Abandonado por el monitor de divergencia: liberó su núcleo antes
+            estado = f"no convergió ({detail_metodo.stop_reason})"
+        else:
+            estado = "no convergió"
+        detail.set_race_result(metodo, estado, tiempo if detail_metodo is None else detail_metodo.execution_time,
+                               None if detail_metodo is None else detail_metodo.total_iterations)
+
+    detail.converged = ganador is not None and resultados[ganador][1].converged
+    detail.cancelled = motivo == "cancelado"
+    detail.timed_out = motivo == "tiempo agotado"
+    detail.execution_time = tiempo_ganador
+
+    if detail.converged:
+        detail.set_info("carrera", f"ganó {ganador} entre {len(metodos)} métodos")
+    else:
+        detail.set_info("carrera", f"ninguno de {len(metodos)} métodos convergió" + ("" if ganador is None else f"; menor residuo: {ganador}"))
+
+    return x, detail
@@ -0,0 +1,454 @@
+import mmap
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+
+import numpy as np
+
+from controllers.metodos import TAM_BLOQUE_GAUSS_JORDAN, _ControlEjecucion, _MonitorDivergencia, _factorizar_lu_paneles
+
+# Memoria (en bytes) que ocupan a la vez las teselas de los métodos fuera
+# de memoria cuando no se indica el tamaño de tesela
+MEMORIA_TESELAS = 1024 * 1024 * 1024
+
+# Teselas que se leen por adelantado mientras se procesa la actual
+ANTICIPACION_TESELAS = 1
+
+
+# Bytes de una página de memoria: al leer por adelantado se toca un
+# elemento de cada página para que el sistema la traiga del disco
+BYTES_PAGINA = 4096
+
+
+def _origen_memmap(A):
+    '''
+    Ubica un np.memmap (o una vista suya, como el corte M[:, :-1] de un
+    .npy importado) dentro de su archivo. Devuelve (ruta, desplazamiento,
+    forma, strides, tipo): A es la vista con esa forma y strides que empieza
+    en el byte desplazamiento del archivo. Devuelve None si A no proviene
+    de un archivo mapeado o tiene strides negativos.
+    '''
+    if not isinstance(A, np.memmap):
+        return None
+
+    # Las vistas de un memmap heredan filename y offset del original, que
+    # no ubican a la vista: se sube por .base hasta el mapeo del archivo
+    raiz = A
+    while isinstance(raiz, np.memmap) and not isinstance(raiz.base, mmap.mmap):
+        raiz = raiz.base
+    if not isinstance(raiz, np.memmap) or raiz.filename is None or any(paso < 0 for paso in A.strides):
+        return None
+
+    delta = A.__array_interface__["data"][0] - raiz.__array_interface__["data"][0]
+    return (raiz.filename, raiz.offset + delta, A.shape, A.strides, A.dtype.str)
+
+
+def _mapear_origen(origen):
+    '''
+    Vuelve a mapear, de solo lectura, la vista descrita por _origen_memmap.
+    El resultado sigue siendo un np.memmap, así los métodos fuera de memoria
+    la reconocen.
+    '''
+    ruta, desplazamiento, forma, strides, tipo = origen
+    tipo = np.dtype(tipo)
+    extension = tipo.itemsize + sum((largo - 1) * paso for largo, paso in zip(forma, strides)) if all(forma) else 0
+
+    plano = np.memmap(ruta, dtype=np.uint8, mode="r", offset=desplazamiento, shape=(max(extension, tipo.itemsize),))
+    inicio = plano[:tipo.itemsize].view(tipo)
+    return np.lib.stride_tricks.as_strided(inicio, shape=forma, strides=strides, subok=True, writeable=False)
+
+
+
+def _leer_tesela(fuente, corte):
+    '''
+    Trae a memoria las páginas de una tesela de fuente (normalmente un
+    np.memmap) tocando un elemento por página, sin copiarla. Devuelve la
+    vista de la tesela y sus bytes.
+    '''
+    vista = fuente[corte]
+    if vista.size > 0:
+        paso = max(1, BYTES_PAGINA // vista.itemsize)
+        vista[:, ::paso].sum()
+        vista[:, -1].sum()
+    return vista, vista.nbytes
+
+
+class _LectorTeselas:
+    '''
+    Lee en orden una secuencia de teselas de solo lectura, dadas como pares
+    (fuente, corte), y entrega vistas sin copiar. Con anticipacion > 0 un
+    hilo aparte trae del disco las siguientes mientras el método procesa
+    la actual, así la espera de E/S se solapa con el cálculo. Cuenta los
+    bytes leídos.
+    '''
+    def __init__(self, anticipacion=ANTICIPACION_TESELAS):
+        self.anticipacion = max(0, int(anticipacion))
+        self.bytes_leidos = 0
+        self.hilo = ThreadPoolExecutor(max_workers=1) if self.anticipacion > 0 else None
+
+    def leer(self, teselas):
+        teselas = iter(teselas)
+
+        if self.hilo is None:
+            for fuente, corte in teselas:
+                tesela, leidos = _leer_tesela(fuente, corte)
+                self.bytes_leidos += leidos
+                yield tesela
+            return
+
+        pendientes = deque(self.hilo.submit(_leer_tesela, *siguiente) for siguiente in islice(teselas, self.anticipacion))
+        while pendientes:
+            lectura = pendientes.popleft()
+
+            # Encargar la siguiente antes de esperar la actual
+            siguiente = next(teselas, None)
+            if siguiente is not None:
+                pendientes.append(self.hilo.submit(_leer_tesela, *siguiente))
+
+            tesela, leidos = lectura.result()
+            self.bytes_leidos += leidos
+            yield tesela
+
+    def copiar(self, fuente, corte):
+        '''
+        Copia a RAM una tesela que el método va a modificar.
+        '''
+        vista = fuente[corte]
+        self.bytes_leidos += vista.nbytes
+        return np.array(vista, dtype=float)
+
+    def cerrar(self):
+        if self.hilo is not None:
+            self.hilo.shutdown(wait=True, cancel_futures=True)
+
+
+def _tam_tesela(n, tam_tesela, teselas_en_memoria):
+    '''
+    Filas (o columnas) por tesela: las indicadas o, si es None, las que
+    caben en MEMORIA_TESELAS con teselas_en_memoria teselas de n elementos
+    por fila cargadas a la vez.
+    '''
+    if tam_tesela is None:
+        tam_tesela = MEMORIA_TESELAS // (teselas_en_memoria * n * 8)
+    return int(min(max(1, tam_tesela), n))
+
+
+def _validar_fuera_de_memoria(A, b):
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+    if A.shape[0] != len(b):
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+
+def jacobi_fuera_de_memoria(A, b, tol=1e-10, max_iter=1000, tam_tesela=None, anticipacion=ANTICIPACION_TESELAS, detail=None,
+                            cancelacion=None, tiempo_limite=None, progreso=None, historial=None):
+    """
+    Método de Jacobi por teselas de filas para matrices que no caben en RAM
+    (e.g. un np.memmap). A nunca se copia: cada barrido la recorre una vez,
+    tesela por tesela, directamente sobre el mapeo, y actualiza ese bloque
+    de x con x_new = x + (b - A x) / D. Mientras se procesa una tesela, un
+    hilo trae del disco las siguientes.
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n), normalmente un np.memmap
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia para el criterio de convergencia (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    tam_tesela : int, opcional
+        Filas por tesela; si es None se usan las que caben en
+        MEMORIA_TESELAS con 2 + anticipacion teselas en memoria a la vez
+        (default: None)
+    anticipacion : int, opcional
+        Teselas que se leen por adelantado en otro hilo; 0 lee cada tesela
+        justo cuando se necesita (default: ANTICIPACION_TESELAS)
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el tamaño de tesela, los bytes
+        leídos por barrido y, si la resolución se detiene antes, el motivo
+        y el mejor iterado
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo (se revisa en cada
+        tesela)
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos (se revisa en cada tesela)
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con la norma infinito del paso
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución (el mejor iterado si se canceló, agotó el tiempo
+        o divergió; ver _MonitorDivergencia)
+    iter_count : int
+        Número de iteraciones realizadas
+    converged : bool
+        True si el método convergió, False en caso contrario
+
+    Raises:
+    -------
+    ValueError
+        Si A no es cuadrada o tiene ceros en la diagonal
+    """
+    b = np.array(b, dtype=float)
+    _validar_fuera_de_memoria(A, b)
+
+    n = len(b)
+    filas = _tam_tesela(n, tam_tesela, 2 + anticipacion)
+    cortes = [(A, slice(inicio, min(inicio + filas, n))) for inicio in range(0, n, filas)]
+    bytes_por_barrido = sum(A[corte].nbytes for _, corte in cortes)
+
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, historial=historial)
+    lector = _LectorTeselas(anticipacion)
+    # Las teselas se leen en ciclo: la primera del siguiente barrido se
+    # anticipa mientras se procesa la última del actual
+    teselas = lector.leer(cycle(cortes))
+
+    x = np.zeros(n)
+    x_new = np.empty(n)
+    monitor = _MonitorDivergencia(tol, max_iter, x)
+    resultado = None
+
+    try:
+        for iter_count in range(max_iter):
+            for inicio, tesela in zip(range(0, n, filas), teselas):
+                fin = inicio + len(tesela)
+                diagonal = tesela[np.arange(fin - inicio), np.arange(inicio, fin)]
+                if np.any(diagonal == 0.0):
+                    raise ValueError("La matriz tiene ceros en la diagonal; el método de Jacobi no se puede aplicar.")
+
+                with np.errstate(over="ignore", invalid="ignore"):
+                    x_new[inicio:fin] = x[inicio:fin] + (b[inicio:fin] - tesela @ x) / diagonal
+
+                if control.interrumpido():
+                    # El barrido quedó a medias: se descarta
+                    resultado = control.detener(x, iter_count, detail)
+                    break
+
+            if resultado is not None:
+                break
+
+            # Verificar convergencia (norma infinito del paso)
+            with np.errstate(over="ignore", invalid="ignore"):
+                paso = np.abs(x_new - x).max(initial=0.0)
+            if paso < tol:
+                resultado = (x_new, iter_count + 1, True)
+                break
+
+            x, x_new = x_new, x
+
+            # Cada barrido relee A del disco: abandonar pronto ahorra E/S
+            if monitor.observar(iter_count, paso, x):
+                resultado = monitor.abandonar(x, iter_count + 1, detail)
+                break
+
+            if control.revisar(iter_count, x, paso=paso):
+                resultado = control.detener(x, iter_count + 1, detail)
+                break
+    finally:
+        teselas.close()
+        lector.cerrar()
+
+    if resultado is None:
+        resultado = (x, max_iter, False)
+
+    if detail is not None:
+        detail.set_info("A en disco (bytes)", A.nbytes)
+        detail.set_info("tesela (filas)", filas)
+        detail.set_info("anticipación (teselas)", lector.anticipacion)
+        detail.set_info("memoria de teselas (bytes)", (2 + lector.anticipacion) * filas * n * A.itemsize)
+        detail.set_bytes_read(lector.bytes_leidos, bytes_por_barrido)
+
+    return resultado
+
+
+class FactorizacionLUFueraDeMemoria:
+    '''
+    Factorización LU con pivoteo parcial guardada en disco por paneles de
+    columnas. El panel k (n x w) guarda U sobre la diagonal y L debajo, y
+    sus intercambios de filas se aplican en orden al resolver
+    (A = P1 L1 P2 L2 ... U), así un panel ya escrito no se reescribe
+    cuando pivotea uno posterior.
+
+    Los paneles son archivos en un directorio temporal que cerrar() borra.
+    '''
+    def __init__(self, n, ancho, directorio=None):
+        self.n = n
+        self.ancho = ancho
+        self.inicios = list(range(0, n, ancho))
+
+        try:
+            self.directorio = tempfile.mkdtemp(prefix="lu_fuera_de_memoria_", dir=directorio)
+        except OSError:
+            # Directorio sin permiso de escritura: usar el temporal del sistema
+            self.directorio = tempfile.mkdtemp(prefix="lu_fuera_de_memoria_")
+
+        self.paneles = []
+        self.intercambios = []
+        self.bytes_escritos = 0
+
+    def agregar_panel(self, panel, destino, origen):
+        '''
+        Escribe en disco el siguiente panel ya factorizado, con sus
+        intercambios de filas como X[destino] = X[origen].
+        '''
+        ruta = os.path.join(self.directorio, f"panel_{len(self.paneles)}.bin")
+        mapa = np.memmap(ruta, dtype=float, mode="w+", shape=panel.shape)
+        mapa[:] = panel
+        mapa.flush()
+
+        self.paneles.append(mapa)
+        self.intercambios.append((destino, origen))
+        self.bytes_escritos += mapa.nbytes
+
+    def resolver(self, b, lector: _LectorTeselas):
+        '''
+        Resuelve Ax = b leyendo cada panel una vez por sustitución.
+        '''
+        y = np.array(b, dtype=float)
+
+        # Sustitución hacia adelante: y = L^-1 P b, panel por panel
+        teselas = lector.leer((panel, slice(inicio, None)) for panel, inicio in zip(self.paneles, self.inicios))
+        for (destino, origen), inicio, L in zip(self.intercambios, self.inicios, teselas):
+            y[destino] = y[origen]
+            ancho = L.shape[1]
+            fin = inicio + ancho
+            L11 = np.tril(L[:ancho], -1) + np.eye(ancho)
+            y[inicio:fin] = np.linalg.solve(L11, y[inicio:fin])
+            y[fin:] -= L[ancho:] @ y[inicio:fin]
+
+        # Sustitución hacia atrás: U x = y, del último panel al primero
+        x = np.empty(self.n)
+        teselas = lector.leer((self.paneles[k], slice(None, inicio + self.paneles[k].shape[1]))
+                              for k, inicio in reversed(list(enumerate(self.inicios))))
+        for inicio, U in zip(reversed(self.inicios), teselas):
+            fin = inicio + U.shape[1]
+            x[inicio:fin] = np.linalg.solve(np.triu(U[inicio:fin]), y[inicio:fin])
+            y[:inicio] -= U[:inicio] @ x[inicio:fin]
+
+        return x
+
+    def cerrar(self):
+        self.paneles = []
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+
+def lu_fuera_de_memoria(A, b, tam_tesela=None, anticipacion=ANTICIPACION_TESELAS, directorio=None, detail=None,
+                        cancelacion=None, tiempo_limite=None):
+    """
+    Resuelve Ax = b con una LU por paneles de columnas que no necesita
+    tener A ni sus factores en RAM (e.g. A es un np.memmap). Para cada
+    panel se leen sus columnas de A y los paneles de L anteriores (variante
+    "left-looking"), se factoriza con pivoteo parcial y se escribe a disco
+    (ver FactorizacionLUFueraDeMemoria).
+
+    Los bytes leídos crecen como n^3 / ancho del panel, así que conviene el
+    panel más ancho que quepa en memoria: se usan a la vez hasta
+    4 + anticipacion paneles de n x tam_tesela (el panel en RAM, un
+    temporal del mismo tamaño y los paneles de L que se están leyendo).
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n), normalmente un np.memmap
+    b : array_like
+        Vector de términos independientes (n)
+    tam_tesela : int, opcional
+        Columnas por panel; si es None se usan las que caben en
+        MEMORIA_TESELAS (default: None)
+    anticipacion : int, opcional
+        Paneles que se leen por adelantado en otro hilo (default:
+        ANTICIPACION_TESELAS)
+    directorio : str, opcional
+        Dónde guardar los factores; por defecto junto al archivo de A si es
+        un np.memmap, si no en el directorio temporal del sistema
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el ancho de panel y los bytes leídos
+        y escritos
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la factorización desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución (ceros si se canceló o agotó el tiempo)
+    iter_count : int
+        1 si se resolvió, 0 si se detuvo antes
+    converged : bool
+        True si se resolvió, False si se detuvo antes
+
+    Raises:
+    -------
+    ValueError
+        Si A no es cuadrada o es singular
+    """
+    b = np.array(b, dtype=float)
+    _validar_fuera_de_memoria(A, b)
+
+    n = len(b)
+    ancho = _tam_tesela(n, tam_tesela, 4 + anticipacion)
+
+    if directorio is None and getattr(A, "filename", None):
+        directorio = os.path.dirname(A.filename)
+
+    control = _ControlEjecucion(cancelacion, tiempo_limite)
+    lector = _LectorTeselas(anticipacion)
+    factorizacion = FactorizacionLUFueraDeMemoria(n, ancho, directorio)
+    resultado = None
+
+    try:
+        for k, inicio in enumerate(factorizacion.inicios):
+            fin = min(inicio + ancho, n)
+
+            # Columnas del panel (en RAM, se modifican) y los paneles de L ya
+            # factorizados, que se leen por adelantado
+            X = lector.copiar(A, (slice(None), slice(inicio, fin)))
+            teselas = lector.leer((factorizacion.paneles[j], slice(factorizacion.inicios[j], None)) for j in range(k))
+
+            for (destino, origen), inicio_j, L in zip(factorizacion.intercambios, factorizacion.inicios, teselas):
+                # Intercambios del panel j, U_jk = L_jj^-1 X_j y complemento de Schur
+                X[destino] = X[origen]
+                ancho_j = L.shape[1]
+                fin_j = inicio_j + ancho_j
+                L11 = np.tril(L[:ancho_j], -1) + np.eye(ancho_j)
+                X[inicio_j:fin_j] = np.linalg.solve(L11, X[inicio_j:fin_j])
+                X[fin_j:] -= L[ancho_j:] @ X[inicio_j:fin_j]
+
+                if control.interrumpido():
+                    break
+
+            if control.interrumpido():
+                resultado = control.detener(np.zeros(n), 0, detail)
+                break
+
+            perm = np.arange(n - inicio)
+            _factorizar_lu_paneles(X[inicio:], perm, TAM_BLOQUE_GAUSS_JORDAN)
+            cambiadas = np.nonzero(perm != np.arange(n - inicio))[0]
+            factorizacion.agregar_panel(X, inicio + cambiadas, inicio + perm[cambiadas])
+
+        if resultado is None:
+            resultado = (factorizacion.resolver(b, lector), 1, True)
+    finally:
+        lector.cerrar()
+        factorizacion.cerrar()
+
+    if detail is not None:
+        detail.set_info("A en disco (bytes)", A.nbytes)
+        detail.set_info("panel (columnas)", ancho)
+        detail.set_info("anticipación (paneles)", lector.anticipacion)
+        detail.set_info("memoria de paneles (bytes)", (4 + lector.anticipacion) * ancho * n * 8)
+        detail.set_info("bytes escritos", factorizacion.bytes_escritos)
+        detail.set_bytes_read(lector.bytes_leidos, lector.bytes_leidos)
+
+    return resultado
@@ -0,0 +1,388 @@
+import os
+import struct
+import time
+import zipfile
+from itertools import islice
+
+import numpy as np
+
+from controllers.matriz_csr import MatrizCSR
+
+# Filas de CSV que se convierten de una sola vez, sin pasar de
+# VALORES_POR_BLOQUE_CSV números por bloque en sistemas muy anchos
+FILAS_POR_BLOQUE_CSV = 4096
+VALORES_POR_BLOQUE_CSV = 1 << 18
+
+# Entradas de Matrix Market que se convierten de una sola vez
+LINEAS_POR_BLOQUE_MTX = 65536
+
+FORMATOS_IMPORTACION = (".csv", ".npy", ".npz", ".mtx")
+
+
+def formatear_bytes(n_bytes):
+    '''
+    Texto legible para una cantidad de bytes (e.g. "7.6 MB").
+    '''
+    for unidad in ("B", "KB", "MB", "GB"):
+        if n_bytes < 1024 or unidad == "GB":
+            return f"{n_bytes:.0f} {unidad}" if unidad == "B" else f"{n_bytes:.1f} {unidad}"
+        n_bytes /= 1024
+
+
+class SistemaImportado:
+    '''
+    Sistema Ax = b cargado desde un archivo, junto con lo que costó cargarlo.
+
+    - A (ndarray, np.memmap o MatrizCSR) y b (ndarray).
+    - tiempo_carga (float): segundos que tomó la carga.
+    - memoria (int): bytes que la carga reservó en RAM.
+    - bytes_mapeados (int): bytes del archivo mapeados en memoria sin copiar.
+    - nota (str): aclaraciones de la carga (e.g. de dónde salió b).
+    '''
+    def __init__(self, A, b, ruta, formato, tiempo_carga=0.0, memoria=0, bytes_mapeados=0, nota=""):
+        self.A = A
+        self.b = b
+        self.ruta = ruta
+        self.formato = formato
+        self.tiempo_carga = tiempo_carga
+        self.memoria = memoria
+        self.bytes_mapeados = bytes_mapeados
+        self.nota = nota
+
+    @property
+    def n(self):
+        return len(self.b)
+
+    def es_dispersa(self):
+        return isinstance(self.A, MatrizCSR)
+
+    def resumen(self):
+        '''
+        Descripción de una línea para mostrar en la interfaz.
+        '''
+        partes = [os.path.basename(self.ruta), f"{self.n} incógnitas"]
+
+        if self.es_dispersa():
+            partes.append(f"dispersa (nnz = {self.A.nnz})")
+
+        partes.append(f"carga {self.tiempo_carga:.3f} s")
+        partes.append(f"memoria {formatear_bytes(self.memoria)}")
+
+        if self.bytes_mapeados > 0:
+            partes.append(f"{formatear_bytes(self.bytes_mapeados)} mapeados sin copiar")
+
+        if self.nota:
+            partes.append(self.nota)
+
+        return " · ".join(partes)
+
+
+def _separar_aumentada(M):
+    '''
+    Separa una matriz aumentada [A | b] de n x (n + 1) en vistas de A y b.
+    '''
+    if M.ndim != 2 or M.shape[1] != M.shape[0] + 1:
+        raise ValueError(f"Se esperaba una matriz aumentada de n x (n + 1) y se encontró una de {M.shape}.")
+    return M[:, :-1], M[:, -1]
+
+
+def _detectar_delimitador(linea):
+    for delimitador in (",", ";", "\t"):
+        if delimitador in linea:
+            return delimitador
+    # Separado por espacios
+    return None
+
+
+def cargar_csv(ruta, delimitador="auto", filas_por_bloque=FILAS_POR_BLOQUE_CSV):
+    '''
+    Carga la matriz aumentada [A | b] de un CSV denso, convirtiendo el texto
+    por bloques de hasta filas_por_bloque filas directamente en un arreglo
+    preasignado (n filas y n + 1 columnas, n se deduce de la primera fila).
+    Se ignoran las líneas vacías, las que empiezan con "#" y un encabezado
+    no numérico en la primera línea.
+
+    Raises:
+        ValueError: si el archivo no tiene la forma de un sistema n x n.
+    '''
+    inicio = time.perf_counter()
+
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        lineas = (linea for linea in archivo if linea.strip() and not linea.lstrip().startswith("#"))
+
+        primera = next(lineas, None)
+        if primera is None:
+            raise ValueError("El archivo CSV está vacío.")
+
+        detectar = delimitador == "auto"
+        if detectar:
+            delimitador = _detectar_delimitador(primera)
+
+        try:
+            fila = np.loadtxt([primera], delimiter=delimitador, ndmin=2)
+        except ValueError:
+            # La primera línea es un encabezado; el delimitador se deduce
+            # de la primera fila de datos
+            primera = next(lineas, None)
+            if primera is None:
+                raise ValueError("El archivo CSV no tiene filas numéricas.")
+            if detectar:
+                delimitador = _detectar_delimitador(primera)
+            try:
+                fila = np.loadtxt([primera], delimiter=delimitador, ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"No se pudo leer la primera fila del CSV: {e}")
+
+        columnas = fila.shape[1]
+        n = columnas - 1
+        if n < 1:
+            raise ValueError("Cada fila del CSV debe tener los n coeficientes y el término independiente.")
+
+        M = np.empty((n, columnas))
+        M[0] = fila[0]
+        leidas = 1
+        filas_por_bloque = max(1, min(filas_por_bloque, VALORES_POR_BLOQUE_CSV // columnas))
+
+        while True:
+            bloque = list(islice(lineas, filas_por_bloque))
+            if not bloque:
+                break
+
+            try:
+                datos = np.loadtxt(bloque, delimiter=delimitador, ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"No se pudieron leer las filas {leidas + 1} a {leidas + len(bloque)} del CSV: {e}")
+
+            if datos.shape[1] != columnas:
+                raise ValueError(f"Las filas del CSV deben tener {columnas} columnas; se encontraron {datos.shape[1]}.")
+            if leidas + len(datos) > n:
+                raise ValueError(f"El CSV tiene más de {n} filas para {columnas} columnas.")
+
+            M[leidas:leidas + len(datos)] = datos
+            leidas += len(datos)
+
+    if leidas != n:
+        raise ValueError(f"El CSV tiene {leidas} filas; un sistema de {columnas} columnas necesita {n}.")
+
+    A, b = _separar_aumentada(M)
+    return SistemaImportado(A, b, ruta, "csv", time.perf_counter() - inicio, memoria=M.nbytes)
+
+
+def cargar_npy(ruta):
+    '''
+    Mapea en memoria (sin copiar) la matriz aumentada [A | b] de un .npy.
+    '''
+    inicio = time.perf_counter()
+
+    M = np.load(ruta, mmap_mode="r")
+    A, b = _separar_aumentada(M)
+
+    return SistemaImportado(A, b, ruta, "npy", time.perf_counter() - inicio, bytes_mapeados=M.nbytes)
+
+
+def _mapear_miembro_npz(ruta, info: zipfile.ZipInfo):
+    '''
+    Mapea en memoria un arreglo guardado sin comprimir dentro de un .npz,
+    ubicando sus datos dentro del zip. Devuelve None si no se puede (miembro
+    comprimido o formato de encabezado desconocido).
+    '''
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with open(ruta, "rb") as archivo:
+        # Encabezado local del zip: 30 bytes fijos + nombre + campo extra
+        archivo.seek(info.header_offset)
+        local = archivo.read(30)
+        if local[:4] != b"PK\x03\x04":
+            return None
+        largo_nombre, largo_extra = struct.unpack("<HH", local[26:30])
+        archivo.seek(info.header_offset + 30 + largo_nombre + largo_extra)
+
+        version = np.lib.format.read_magic(archivo)
+        if version == (1, 0):
+            forma, fortran, dtype = np.lib.format.read_array_header_1_0(archivo)
+        elif version == (2, 0):
+            forma, fortran, dtype = np.lib.format.read_array_header_2_0(archivo)
+        else:
+            return None
+        offset = archivo.tell()
+
+    if dtype.hasobject:
+        return None
+
+    return np.memmap(ruta, dtype=dtype, mode="r", offset=offset, shape=forma, order="F" if fortran else "C")
+
+
+def cargar_npz(ruta):
+    '''
+    Carga un .npz con los arreglos "A" y "b", o con un único arreglo que es
+    la matriz aumentada [A | b]. Los arreglos guardados sin comprimir
+    (np.savez) se mapean en memoria sin copiar; los comprimidos
+    (np.savez_compressed) se descomprimen en RAM.
+    '''
+    inicio = time.perf_counter()
+
+    with zipfile.ZipFile(ruta) as zip_npz:
+        miembros = {os.path.splitext(info.filename)[0]: info for info in zip_npz.infolist() if info.filename.endswith(".npy")}
+
+    if "A" in miembros and "b" in miembros:
+        nombres = ["A", "b"]
+    elif len(miembros) == 1:
+        nombres = list(miembros)
+    else:
+        raise ValueError("El .npz debe tener los arreglos 'A' y 'b' o una sola matriz aumentada.")
+
+    arreglos = []
+    memoria = 0
+    bytes_mapeados = 0
+    with np.load(ruta) as npz:
+        for nombre in nombres:
+            arreglo = _mapear_miembro_npz(ruta, miembros[nombre])
+            if arreglo is None:
+                arreglo = npz[nombre]
+                memoria += arreglo.nbytes
+            else:
+                bytes_mapeados += arreglo.nbytes
+            arreglos.append(arreglo)
+
+    if len(arreglos) == 2:
+        A, b = arreglos
+        if A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape != (A.shape[0],):
+            raise ValueError(f"A debe ser n x n y b de n elementos; se encontró A {A.shape} y b {b.shape}.")
+    else:
+        A, b = _separar_aumentada(arreglos[0])
+
+    nota = "comprimido: se copió a RAM" if memoria > 0 else ""
+    return SistemaImportado(A, b, ruta, "npz", time.perf_counter() - inicio, memoria=memoria, bytes_mapeados=bytes_mapeados, nota=nota)
+
+
+def _leer_encabezado_mtx(archivo):
+    '''
+    Lee la línea %%MatrixMarket, los comentarios y la línea de tamaños.
+    Devuelve (formato, campo, simetria, tamaños).
+    '''
+    encabezado = archivo.readline().lower().split()
+    if len(encabezado) < 5 or encabezado[0] != "%%matrixmarket" or encabezado[1] != "matrix":
+        raise ValueError("El archivo no tiene un encabezado %%MatrixMarket matrix válido.")
+    formato, campo, simetria = encabezado[2:5]
+
+    if campo not in ("real", "integer", "pattern"):
+        raise ValueError(f"No se soportan matrices Matrix Market de tipo '{campo}'.")
+    if simetria not in ("general", "symmetric", "skew-symmetric"):
+        raise ValueError(f"No se soporta la simetría Matrix Market '{simetria}'.")
+
+    linea = archivo.readline()
+    while linea and (linea.startswith("%") or not linea.strip()):
+        linea = archivo.readline()
+
+    return formato, campo, simetria, [int(valor) for valor in linea.split()]
+
+
+def _leer_vector_mtx(ruta):
+    '''
+    Lee un vector columna guardado como Matrix Market "array".
+    '''
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        formato, _, _, tamanos = _leer_encabezado_mtx(archivo)
+        if formato != "array" or len(tamanos) != 2 or tamanos[1] != 1:
+            raise ValueError(f"{os.path.basename(ruta)} debe ser un vector columna en formato array.")
+        b = np.loadtxt(archivo, comments="%", ndmin=1)
+
+    if len(b) != tamanos[0]:
+        raise ValueError(f"{os.path.basename(ruta)} tiene {len(b)} valores y debería tener {tamanos[0]}.")
+    return b
+
+
+def cargar_mtx(ruta, lineas_por_bloque=LINEAS_POR_BLOQUE_MTX):
+    '''
+    Carga la matriz A de un archivo Matrix Market en formato coordinate,
+    leyendo las entradas por bloques directamente en arreglos de tripletas
+    preasignados (nnz) y armando una MatrizCSR, sin pasar por una matriz
+    densa. Las matrices simétricas se completan con su otra mitad.
+
+    b se toma del archivo hermano <nombre>_b.mtx si existe (convención de
+    SuiteSparse); si no, se usa b = A·1 para que la solución exacta sea el
+    vector de unos.
+    '''
+    inicio = time.perf_counter()
+
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        formato, campo, simetria, tamanos = _leer_encabezado_mtx(archivo)
+        if formato != "coordinate":
+            raise ValueError("Solo se pueden importar matrices Matrix Market en formato coordinate.")
+        n_filas, n_columnas, nnz = tamanos
+        if n_filas != n_columnas:
+            raise ValueError(f"La matriz debe ser cuadrada; es de {n_filas} x {n_columnas}.")
+
+        filas = np.empty(nnz, dtype=np.int64)
+        columnas = np.empty(nnz, dtype=np.int64)
+        valores = np.ones(nnz)
+        leidas = 0
+
+        while leidas < nnz:
+            bloque = list(islice(archivo, lineas_por_bloque))
+            if not bloque:
+                break
+
+            datos = np.loadtxt(bloque, comments="%", ndmin=2)
+            if leidas + len(datos) > nnz:
+                raise ValueError(f"El archivo tiene más de las {nnz} entradas declaradas.")
+
+            filas[leidas:leidas + len(datos)] = datos[:, 0]
+            columnas[leidas:leidas + len(datos)] = datos[:, 1]
+            if campo != "pattern":
+                valores[leidas:leidas + len(datos)] = datos[:, 2]
+            leidas += len(datos)
+
+    if leidas != nnz:
+        raise ValueError(f"El archivo declara {nnz} entradas y tiene {leidas}.")
+
+    # Matrix Market numera desde 1
+    filas -= 1
+    columnas -= 1
+
+    if simetria != "general":
+        # Solo viene un triángulo: agregar el reflejo de lo que no es diagonal
+        fuera = filas != columnas
+        signo = -1.0 if simetria == "skew-symmetric" else 1.0
+        filas, columnas, valores = (np.concatenate([filas, columnas[fuera]]),
+                                    np.concatenate([columnas, filas[fuera]]),
+                                    np.concatenate([valores, signo * valores[fuera]]))
+
+    A = MatrizCSR.desde_tripletas(filas, columnas, valores, (n_filas, n_columnas))
+
+    ruta_b = os.path.splitext(ruta)[0] + "_b.mtx"
+    if os.path.exists(ruta_b):
+        b = _leer_vector_mtx(ruta_b)
+        nota = f"b de {os.path.basename(ruta_b)}"
+    else:
+        b = A @ np.ones(n_filas)
+        nota = "b = A·1 (no hay archivo _b.mtx)"
+
+    return SistemaImportado(A, b, ruta, "mtx", time.perf_counter() - inicio, memoria=A.nbytes + b.nbytes, nota=nota)
+
+
+def importar_sistema(ruta):
+    '''
+    Carga un sistema Ax = b según la extensión del archivo:
+
+    - .csv: matriz aumentada [A | b] densa (ver cargar_csv).
+    - .npy: matriz aumentada mapeada en memoria (ver cargar_npy).
+    - .npz: arreglos "A" y "b" o matriz aumentada (ver cargar_npz).
+    - .mtx: matriz dispersa Matrix Market (ver cargar_mtx).
+
+    Raises:
+        ValueError: si el formato no se reconoce o el archivo no es válido.
+    '''
+    extension = os.path.splitext(ruta)[1].lower()
+
+    if extension == ".csv":
+        return cargar_csv(ruta)
+    if extension == ".npy":
+        return cargar_npy(ruta)
+    if extension == ".npz":
+        return cargar_npz(ruta)
+    if extension == ".mtx":
+        return cargar_mtx(ruta)
+
+    raise ValueError(f"Formato de archivo no soportado: {extension or ruta}. Use uno de {', '.join(FORMATOS_IMPORTACION)}.")
@@ -1,98 +1,108 @@
-from PyQt5.QtWidgets import QStackedWidget, QLabel, QLineEdit
+import numpy as np
 
-HIDDEN_MATRIX = "na"
+from controllers.modelos_tabla import ModeloMatriz
+from controllers.importar_matriz import SistemaImportado, importar_sistema
 
-class MatrixController:
-    def __init__(self):
-        self.matrix_fields = []
-
-    def set_matriz_fields(self, matriz : list[list[QLineEdit]]):
-        self.matrix_fields : list[list[QLineEdit]] = matriz
+DEFAULT_SIZE = 4
 
-    def get_matriz_fields(self):
-        return self.matrix_fields
-    
-    def get_matriz_values(self):
-        values = []
+# Tamaño máximo que se edita celda por celda; los sistemas importados más
+# grandes (o dispersos) se resuelven sin pasar por el editor
+MAX_SIZE = 2000
 
-        for row in self.matrix_fields:
-            values_row = []
+class MatrixController:
+    '''
+    Maneja la matriz aumentada [A | b] que edita el usuario. Los valores
+    viven en un ndarray dentro de un ModeloMatriz, que la vista de la página
+    muestra directamente.
 
-            for field in row:
-                if(field.text() == HIDDEN_MATRIX):
-                    continue
+    Un sistema importado que no cabe en el editor se conserva aparte (ver
+    importar) y es el que se resuelve hasta que se limpia la matriz o se
+    cambia su tamaño.
+    '''
+    def __init__(self, size: int = DEFAULT_SIZE):
+        self.modelo = ModeloMatriz(size)
+        self.sistema_importado : SistemaImportado = None
 
-                try:
-                    value = float(field.text())
-                except ValueError:
-                    value = 0.0
+    def get_modelo(self) -> ModeloMatriz:
+        return self.modelo
 
-                values_row.append(value)
+    def get_size(self):
+        return self.modelo.rowCount()
 
-            if(len(values_row) > 0):
-                values.append(values_row)
+    def get_matriz_values(self):
+        '''
+        Matriz aumentada n x (n + 1) como ndarray (sin copiar).
+        '''
+        return self.modelo.get_valores()
+
+    def set_matriz_values(self, valores):
+        self.modelo.set_valores(valores)
+
+    def get_sistema_importado(self) -> SistemaImportado:
+        return self.sistema_importado
+
+    def importar(self, ruta) -> SistemaImportado:
+        '''
+        Carga un sistema desde un archivo (ver importar_sistema). Si es denso
+        y de a lo más MAX_SIZE incógnitas se copia al editor; si no, se
+        conserva tal como se cargó (mapeado en memoria o disperso) sin
+        crear la matriz aumentada.
+
+        Raises:
+            ValueError: si el archivo no es un sistema válido.
+            OSError: si el archivo no se puede leer.
+        '''
+        sistema = importar_sistema(ruta)
+
+        if not sistema.es_dispersa() and sistema.n <= MAX_SIZE:
+            valores = np.empty((sistema.n, sistema.n + 1))
+            valores[:, :-1] = sistema.A
+            valores[:, -1] = sistema.b
+            self.modelo.set_valores(valores)
+            self.sistema_importado = None
+        else:
+            self.sistema_importado = sistema
+
+        return sistema
 
-        return values
-    
     def clear_matriz(self):
-        for row in self.matrix_fields:
-            for field in row:
-                field.clear()
+        self.sistema_importado = None
+        self.modelo.limpiar()
 
     def print_matriz(self):
+        if self.sistema_importado is not None:
+            print("Sistema importado:", self.sistema_importado.resumen())
+            return
+
         print("Matriz actual:")
-        for row in self.get_matriz_values():
-            print(row)
+        print(self.get_matriz_values())
 
     def change_size(self, new_size: int):
-        if(new_size == 2):
-            # ocultar fila 2 y 3
-            for j in range(5):
-                self.matrix_fields[2][j].setText(HIDDEN_MATRIX)
-                self.matrix_fields[3][j].setText(HIDDEN_MATRIX)
-
-            # ocultar columna 2 y 3
-            for i in range(4):
-                self.matrix_fields[i][2].setText(HIDDEN_MATRIX)
-                self.matrix_fields[i][3].setText(HIDDEN_MATRIX)
+        if new_size < 1:
+            raise ValueError("El tamaño de la matriz debe ser un entero positivo.")
 
-        elif(new_size == 3):
-            self.clear_matriz()
-
-            # ocultar la fila 4
-            for j in range(5):
-                self.matrix_fields[3][j].setText(HIDDEN_MATRIX)
-
-            # ocultar la columna 4
-            for i in range(4):
-                self.matrix_fields[i][3].setText(HIDDEN_MATRIX)
-
-        elif(new_size == 4):
-            # mostrar todo
-            self.clear_matriz()
-
-        self.is_hidden_for_value()
+        self.sistema_importado = None
+        if new_size != self.get_size():
+            self.modelo.redimensionar(new_size)
 
     def set_size_to_default(self):
-        self.change_size(4)
+        self.change_size(DEFAULT_SIZE)
 
-    def is_hidden_for_value(self):
-        for i in range(4):
-            for j in range(5):
-                if self.matrix_fields[i][j].text() == HIDDEN_MATRIX:
-                    self.matrix_fields[i][j].setVisible(False)
-                else:
-                    self.matrix_fields[i][j].setVisible(True)
+    def separate_A_b(self):
+        '''
+        Separa la matriz aumentada en A y b con un corte del arreglo, sin
+        convertir texto. Se devuelven copias porque la resolución corre en
+        otro hilo mientras el usuario puede seguir editando.
 
-    # Aquí puedes agregar métodos específicos para manejar la lógica relacionada con matrices
-    # Por ejemplo, métodos para resolver sistemas de ecuaciones, realizar operaciones matriciales, etc.
+        Un sistema importado se devuelve sin copiar: el mapeo en memoria es
+        de solo lectura y la MatrizCSR no se modifica.
+        '''
+        if self.sistema_importado is not None:
+            return self.sistema_importado.A, self.sistema_importado.b
 
-    def separate_A_b(self):
-        A = [] # Matriz de coeficientes
-        b = [] # Vector de términos independientes
+        valores = self.get_matriz_values()
 
-        for i, row in enumerate(self.get_matriz_values()):
-            A.append(row[:-1])  # Todos los elementos excepto el último
-            b.append(row[-1])   # Solo el último elemento
+        A = valores[:, :-1].copy() # Matriz de coeficientes
+        b = valores[:, -1].copy()  # Vector de términos independientes
 
-        return A, b
\ No newline at end of file
+        return A, b
@@ -0,0 +1,439 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from collections import deque
+
+# Pivotes menores a este valor se consideran cero (matriz singular)
+TOL_PIVOTE = 1e-10
+
+
+class FilaDispersa:
+    '''
+    Vista ligera de una fila dispersa: sus columnas y valores.
+    Expone dot(x) como las filas de una matriz densa.
+    '''
+    __slots__ = ("columnas", "valores")
+
+    def __init__(self, columnas, valores):
+        self.columnas = columnas
+        self.valores = valores
+
+    def dot(self, x):
+        return self.valores @ x[self.columnas]
+
+
+class MatrizCSR:
+    '''
+    Matriz dispersa en formato CSR (Compressed Sparse Row).
+
+    Solo se guardan los nnz elementos distintos de cero:
+    - valores (float64): los valores, fila por fila.
+    - col_idx (int64): la columna de cada valor.
+    - row_ptr (int64): los valores de la fila i están en valores[row_ptr[i]:row_ptr[i + 1]].
+    '''
+    def __init__(self, valores, col_idx, row_ptr, forma):
+        '''
+        Construye la matriz directamente a partir de los arreglos CSR.
+        Para otras entradas usar desde_tripletas o desde_densa.
+        '''
+        self.valores = np.ascontiguousarray(valores, dtype=np.float64)
+        self.col_idx = np.ascontiguousarray(col_idx, dtype=np.int64)
+        self.row_ptr = np.ascontiguousarray(row_ptr, dtype=np.int64)
+        self.shape = (int(forma[0]), int(forma[1]))
+
+        if len(self.row_ptr) != self.shape[0] + 1:
+            raise ValueError("row_ptr debe tener n + 1 elementos")
+
+        if len(self.valores) != len(self.col_idx) or self.row_ptr[-1] != len(self.valores):
+            raise ValueError("Los arreglos CSR no son consistentes")
+
+    @classmethod
+    def desde_tripletas(cls, filas, columnas, valores, forma):
+        '''
+        Construye la matriz a partir de tripletas (fila, columna, valor).
+        Las tripletas repetidas se suman y los ceros explícitos se descartan.
+        '''
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=np.float64)
+        n_filas, n_columnas = int(forma[0]), int(forma[1])
+
+        if not (len(filas) == len(columnas) == len(valores)):
+            raise ValueError("Las tripletas deben tener la misma longitud")
+
+        if len(filas) > 0 and (filas.min() < 0 or filas.max() >= n_filas or columnas.min() < 0 or columnas.max() >= n_columnas):
+            raise ValueError("Hay tripletas fuera de la forma de la matriz")
+
+        # Ordenar por (fila, columna) y sumar los duplicados
+        claves = filas * n_columnas + columnas
+        orden = np.argsort(claves, kind="stable")
+        claves = claves[orden]
+        valores = valores[orden]
+
+        unicas, inicio = np.unique(claves, return_index=True)
+        valores = np.add.reduceat(valores, inicio) if len(valores) > 0 else valores
+
+        no_cero = valores != 0.0
+        unicas = unicas[no_cero]
+        valores = valores[no_cero]
+
+        filas = unicas // n_columnas
+        columnas = unicas % n_columnas
+
+        row_ptr = np.zeros(n_filas + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=n_filas), out=row_ptr[1:])
+
+        return cls(valores, columnas, row_ptr, (n_filas, n_columnas))
+
+    @classmethod
+    def desde_densa(cls, A):
+        '''
+        Construye la matriz a partir de una matriz densa (lista o ndarray).
+        '''
+        A = np.asarray(A, dtype=np.float64)
+        if A.ndim != 2:
+            raise ValueError("La matriz debe ser bidimensional")
+
+        filas, columnas = np.nonzero(A)
+        row_ptr = np.zeros(A.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.count_nonzero(A, axis=1), out=row_ptr[1:])
+
+        return cls(A[filas, columnas], columnas, row_ptr, A.shape)
+
+    # ==================== PROPIEDADES ====================
+    @property
+    def nnz(self):
+        return len(self.valores)
+
+    @property
+    def nbytes(self):
+        return self.valores.nbytes + self.col_idx.nbytes + self.row_ptr.nbytes
+
+    @property
+    def ndim(self):
+        return 2
+
+    def indices_fila(self):
+        '''
+        Devuelve la fila de cada elemento guardado (nnz).
+        '''
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.row_ptr))
+
+    def diagonal(self):
+        filas = self.indices_fila()
+        en_diagonal = filas == self.col_idx
+        d = np.zeros(min(self.shape))
+        np.add.at(d, filas[en_diagonal], self.valores[en_diagonal])
+        return d
+
+    def filas_fuera_de_diagonal(self):
+        '''
+        Devuelve una FilaDispersa por fila con los elementos fuera de la
+        diagonal (la parte R de A = D + R).
+        '''
+        filas = []
+        for i in range(self.shape[0]):
+            inicio, fin = self.row_ptr[i], self.row_ptr[i + 1]
+            columnas = self.col_idx[inicio:fin]
+            fuera = columnas != i
+            filas.append(FilaDispersa(columnas[fuera], self.valores[inicio:fin][fuera]))
+        return filas
+
+    # ==================== OPERACIONES ====================
+    def dot(self, x):
+        '''
+        Producto matriz-vector en O(nnz).
+        '''
+        x = np.asarray(x, dtype=np.float64)
+        return np.bincount(self.indices_fila(), weights=self.valores * x[self.col_idx], minlength=self.shape[0])
+
+    def __matmul__(self, x):
+        return self.dot(x)
+
+    def transpuesta(self):
+        return MatrizCSR.desde_tripletas(self.col_idx, self.indices_fila(), self.valores, (self.shape[1], self.shape[0]))
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.indices_fila(), self.col_idx] = self.valores
+        return A
+
+    def __array__(self, dtype=None, copy=None):
+        # Densificar en silencio reserva n^2 elementos (80 GB con n = 100k):
+        # quien realmente necesite la matriz densa debe pedirla con toarray()
+        raise ValueError(f"Este método requiere una matriz densa y A es dispersa ({self.shape[0]} x {self.shape[1]}, nnz = {self.nnz}); "
+                         "usa un método con soporte disperso (Jacobi, Gauss-Seidel, SOR, Gauss-Jordan, LU, Gradiente conjugado, GMRES, BiCGSTAB).")
+
+    def __repr__(self):
+        return f"MatrizCSR(forma={self.shape}, nnz={self.nnz})"
+
+
+def orden_cuthill_mckee_inverso(A: MatrizCSR):
+    '''
+    Ordenamiento de Cuthill-McKee inverso (RCM) sobre el patrón de A + A^T.
+    Reduce el ancho de banda, de modo que la factorización LU en banda
+    solo genera relleno dentro de esa banda.
+
+    Retorna:
+    - perm (ndarray): nuevo orden de las incógnitas.
+    '''
+    n = A.shape[0]
+    patron = MatrizCSR.desde_tripletas(
+        np.concatenate([A.indices_fila(), A.col_idx]),
+        np.concatenate([A.col_idx, A.indices_fila()]),
+        np.ones(2 * A.nnz),
+        A.shape
+    )
+    grados = np.diff(patron.row_ptr)
+    visitado = np.zeros(n, dtype=bool)
+    orden = []
+
+    # Se recorre cada componente conexa desde su nodo de menor grado
+    for inicio in np.argsort(grados, kind="stable"):
+        if visitado[inicio]:
+            continue
+        visitado[inicio] = True
+        pendientes = deque([inicio])
+
+        while pendientes:
+            i = pendientes.popleft()
+            orden.append(i)
+
+            vecinos = patron.col_idx[patron.row_ptr[i]:patron.row_ptr[i + 1]]
+            vecinos = vecinos[~visitado[vecinos]]
+            vecinos = vecinos[np.argsort(grados[vecinos], kind="stable")]
+            visitado[vecinos] = True
+            pendientes.extend(vecinos.tolist())
+
+    return np.array(orden[::-1], dtype=np.int64)
+
+
+class FactorizacionLUDispersa:
+    '''
+    Factorización LU con pivoteo parcial de una matriz dispersa, previamente
+    reordenada con Cuthill-McKee inverso.
+
+    Los factores se guardan en formato de banda (como LAPACK gbtrf): con
+    anchos de banda kl (inferior) y ku (superior), el pivoteo solo puede
+    generar relleno hasta kl + ku por encima de la diagonal, así que la
+    memoria es O(n (2 kl + ku)) en lugar de O(n^2).
+    '''
+    def __init__(self, A: MatrizCSR):
+        n = A.shape[0]
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("La matriz A debe ser cuadrada")
+
+        self.n = n
+        self.perm = orden_cuthill_mckee_inverso(A)
+
+        # Posición de cada incógnita original en el nuevo orden
+        inversa = np.empty(n, dtype=np.int64)
+        inversa[self.perm] = np.arange(n)
+        filas = inversa[A.indices_fila()]
+        columnas = inversa[A.col_idx]
+
+        self.kl = int(max(0, (filas - columnas).max(initial=0)))
+        self.ku = int(max(0, (columnas - filas).max(initial=0)))
+        self.ldab = 2 * self.kl + self.ku + 1
+
+        # Banda en orden columna: el elemento (r, c) está en
+        # banda[kl + ku + r + c * (ldab - 1)], por lo que cualquier ventana
+        # rectangular dentro de la banda es una vista con strides fijos
+        self.banda = np.zeros(self.ldab * n + self.ldab)
+        np.add.at(self.banda, self.kl + self.ku + filas + columnas * (self.ldab - 1), A.valores)
+        self.pivotes = np.arange(n)
+
+        self._factorizar()
+
+    def _vista(self):
+        '''
+        Vista (n x n) de la matriz reordenada. Solo es válida dentro de la banda.
+        '''
+        item = self.banda.itemsize
+        return as_strided(self.banda[self.kl + self.ku:], shape=(self.n, self.n), strides=(item, item * (self.ldab - 1)))
+
+    def _factorizar(self):
+        M = self._vista()
+        n, kl, ku = self.n, self.kl, self.ku
+
+        for i in range(n):
+            fin_filas = min(n, i + kl + 1)
+            fin_columnas = min(n, i + kl + ku + 1)
+
+            p = i + int(np.argmax(np.abs(M[i:fin_filas, i])))
+            self.pivotes[i] = p
+            if p != i:
+                fila_i = M[i, i:fin_columnas].copy()
+                M[i, i:fin_columnas] = M[p, i:fin_columnas]
+                M[p, i:fin_columnas] = fila_i
+
+            if abs(M[i, i]) < TOL_PIVOTE:
+                raise ValueError("La matriz es singular o casi singular. No se puede resolver el sistema.")
+
+            if fin_filas > i + 1:
+                M[i + 1:fin_filas, i] /= M[i, i]
+                M[i + 1:fin_filas, i + 1:fin_columnas] -= np.outer(M[i + 1:fin_filas, i], M[i, i + 1:fin_columnas])
+
+    @property
+    def nbytes(self):
+        return self.banda.nbytes + self.perm.nbytes + self.pivotes.nbytes
+
+    def resolver(self, b):
+        '''
+        Resuelve Ax = b con dos sustituciones en banda, O(n (kl + ku)).
+        '''
+        b = np.asarray(b, dtype=np.float64)
+        if b.shape[0] != self.n:
+            raise ValueError("Las dimensiones de A y b no son compatibles")
+
+        M = self._vista()
+        n, kl, ku = self.n, self.kl, self.ku
+        y = b[self.perm].copy()
+
+        # L y = P b, aplicando los intercambios en el orden en que ocurrieron
+        for i in range(n):
+            p = self.pivotes[i]
+            if p != i:
+                y[[i, p]] = y[[p, i]]
+            fin_filas = min(n, i + kl + 1)
+            y[i + 1:fin_filas] -= np.multiply.outer(M[i + 1:fin_filas, i], y[i])
+
+        # U x = y
+        for i in range(n - 1, -1, -1):
+            fin_columnas = min(n, i + kl + ku + 1)
+            y[i] -= M[i, i + 1:fin_columnas] @ y[i + 1:fin_columnas]
+            y[i] /= M[i, i]
+
+        # Volver al orden original de las incógnitas
+        x = np.empty_like(y)
+        x[self.perm] = y
+        return x
+
+
+def cholesky_incompleto(A: MatrizCSR):
+    '''
+    Factorización de Cholesky incompleta sin relleno, IC(0): L L^T ~ A con L
+    restringida al patrón de la parte triangular inferior de A. Se asume que
+    A es simétrica.
+
+    Retorna:
+    - L (MatrizCSR): factor triangular inferior, con la diagonal incluida.
+
+    Raises:
+    - ValueError: si aparece un pivote no positivo.
+    '''
+    n = A.shape[0]
+    filas_L = []
+
+    for i in range(n):
+        inicio, fin = A.row_ptr[i], A.row_ptr[i + 1]
+        fila = {}
+        diagonal = 0.0
+
+        for c, v in zip(A.col_idx[inicio:fin].tolist(), A.valores[inicio:fin].tolist()):
+            if c < i:
+                fila[c] = fila.get(c, 0.0) + v
+            elif c == i:
+                diagonal += v
+
+        # L[i, k] = (A[i, k] - sum_j L[i, j] L[k, j]) / L[k, k], solo en el patrón
+        for k in sorted(fila):
+            suma = fila[k]
+            fila_k = filas_L[k]
+            for j, l_kj in fila_k.items():
+                if j < k and j in fila:
+                    suma -= fila[j] * l_kj
+            fila[k] = suma / fila_k[k]
+
+        pivote = diagonal - sum(l * l for l in fila.values())
+        if pivote <= 0.0:
+            raise ValueError("La factorización IC(0) encontró un pivote no positivo; la matriz no es definida positiva.")
+
+        fila[i] = np.sqrt(pivote)
+        filas_L.append(fila)
+
+    filas = [i for i, fila in enumerate(filas_L) for _ in fila]
+    columnas = [c for fila in filas_L for c in fila]
+    valores = [v for fila in filas_L for v in fila.values()]
+
+    return MatrizCSR.desde_tripletas(filas, columnas, valores, (n, n))
+
+
+class TriangularDispersa:
+    '''
+    Matriz triangular dispersa preparada para sustituciones repetidas
+    (por ejemplo, aplicar un precondicionador en cada iteración).
+    '''
+    def __init__(self, T: MatrizCSR, inferior=True):
+        self.inferior = inferior
+        self.diagonal = T.diagonal()
+        self.filas = T.filas_fuera_de_diagonal()
+
+        if np.any(self.diagonal == 0.0):
+            raise ValueError("La matriz triangular tiene ceros en la diagonal")
+
+    def resolver(self, b):
+        '''
+        Resuelve T x = b por sustitución hacia adelante (inferior) o hacia
+        atrás (superior), en O(nnz).
+        '''
+        x = np.array(b, dtype=np.float64)
+        n = len(x)
+        orden = range(n) if self.inferior else range(n - 1, -1, -1)
+
+        for i in orden:
+            x[i] = (x[i] - self.filas[i].dot(x)) / self.diagonal[i]
+
+        return x
+
+
+def lu_incompleto(A: MatrizCSR):
+    '''
+    Factorización LU incompleta sin relleno, ILU(0): L U ~ A con L y U
+    restringidas al patrón de A (variante IKJ por filas).
+
+    Retorna:
+    - L (MatrizCSR): factor triangular inferior con diagonal unitaria.
+    - U (MatrizCSR): factor triangular superior.
+
+    Raises:
+    - ValueError: si aparece un pivote nulo.
+    '''
+    n = A.shape[0]
+    filas_LU = []
+
+    for i in range(n):
+        inicio, fin = A.row_ptr[i], A.row_ptr[i + 1]
+        fila = {}
+        for c, v in zip(A.col_idx[inicio:fin].tolist(), A.valores[inicio:fin].tolist()):
+            fila[c] = fila.get(c, 0.0) + v
+
+        # Eliminar con las filas anteriores, descartando lo que caiga fuera del patrón
+        for k in sorted(c for c in fila if c < i):
+            fila_k = filas_LU[k]
+            fila[k] /= fila_k[k]
+            for j, u_kj in fila_k.items():
+                if j > k and j in fila:
+                    fila[j] -= fila[k] * u_kj
+
+        if abs(fila.get(i, 0.0)) < TOL_PIVOTE:
+            raise ValueError("La factorización ILU(0) encontró un pivote nulo.")
+
+        filas_LU.append(fila)
+
+    filas_L, columnas_L, valores_L = list(range(n)), list(range(n)), [1.0] * n
+    filas_U, columnas_U, valores_U = [], [], []
+
+    for i, fila in enumerate(filas_LU):
+        for c, v in fila.items():
+            if c < i:
+                filas_L.append(i)
+                columnas_L.append(c)
+                valores_L.append(v)
+            else:
+                filas_U.append(i)
+                columnas_U.append(c)
+                valores_U.append(v)
+
+    L = MatrizCSR.desde_tripletas(filas_L, columnas_L, valores_L, (n, n))
+    U = MatrizCSR.desde_tripletas(filas_U, columnas_U, valores_U, (n, n))
+    return L, U
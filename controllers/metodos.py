@@ -1,5 +1,13 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+from controllers.matriz_csr import MatrizCSR, FactorizacionLUDispersa, TriangularDispersa, cholesky_incompleto, lu_incompleto, TOL_PIVOTE
+
 class ResultDetail:
     '''
     Clase para almacenar los detalles del resultado de la solución.
@@ -13,11 +21,60 @@ class ResultDetail:
         - execution_time (float): Tiempo de ejecución en segundos.
         - total_iterations (int): Número total de iteraciones realizadas.
         - converged (bool): Indica si el método convergió o no.
+        - info (dict): Métricas adicionales propias del método (e.g., número
+          de colores o speedup por barrido), se muestran tal cual en la UI.
+        - residual_history (list[float]): Norma infinito del residuo en cada
+          iteración, para los métodos que la calculan.
+        - cancelled (bool): La resolución se detuvo por una cancelación.
+        - timed_out (bool): La resolución se detuvo por agotar su tiempo límite.
+        - best_iterate (ndarray): Mejor iterado alcanzado antes de detenerse.
+        - best_iteration (int): Iteración en la que se alcanzó best_iterate.
+        - iteration_history (HistorialIteraciones): Iterados registrados
+          durante la resolución, si se pidió registrarlos.
+        - bytes_read (int): Bytes de A leídos desde disco, para los métodos
+          fuera de memoria.
+        - bytes_read_per_iteration (int): Bytes de A leídos en cada iteración.
+        - race_results (dict): En una carrera de métodos, el resultado de
+          cada participante ({metodo: {"estado", "tiempo", "iteraciones"}}).
+        - warm_start (str): Origen del vector inicial si no fue cero
+          ("x0" o "solución reciente"); vacío en un arranque en frío.
+        - warm_start_residual (float): Residuo del vector inicial relativo
+          al de arrancar en cero (norma infinito de b).
+        - iterations_saved (int): Iteraciones ahorradas por el arranque en
+          caliente, estimadas con la tasa de convergencia observada (None
+          si no se pudo estimar).
+        - matrix_analysis (dict): Con el método "Auto", propiedades de A
+          medidas antes de elegir el método (ver
+          seleccion_automatica.analizar_matriz).
+        - method_choice (str): Con el método "Auto", el método elegido y
+          los costos estimados que llevaron a elegirlo.
+        - stop_reason (str): Motivo por el que un método estacionario se
+          abandonó antes de max_iter (ver _MonitorDivergencia): "diverged"
+          (el paso crece sostenidamente), "stagnated" (con el factor de
+          contracción observado no alcanza la tolerancia en las
+          iteraciones restantes) o "nan" (valores no finitos); vacío si no
+          se abandonó.
         '''
         self.metodo = kwargs.get("metodo", "")
         self.execution_time = kwargs.get("execution_time", 0.0)
         self.total_iterations = kwargs.get("total_iterations", 0)
         self.converged = kwargs.get("converged", False)
+        self.info = dict(kwargs.get("info", {}))
+        self.residual_history = list(kwargs.get("residual_history", []))
+        self.cancelled = kwargs.get("cancelled", False)
+        self.timed_out = kwargs.get("timed_out", False)
+        self.best_iterate = kwargs.get("best_iterate", None)
+        self.best_iteration = kwargs.get("best_iteration", 0)
+        self.iteration_history = kwargs.get("iteration_history", None)
+        self.bytes_read = kwargs.get("bytes_read", 0)
+        self.bytes_read_per_iteration = kwargs.get("bytes_read_per_iteration", 0)
+        self.race_results = dict(kwargs.get("race_results", {}))
+        self.warm_start = kwargs.get("warm_start", "")
+        self.warm_start_residual = kwargs.get("warm_start_residual", None)
+        self.iterations_saved = kwargs.get("iterations_saved", 0)
+        self.matrix_analysis = dict(kwargs.get("matrix_analysis", {}))
+        self.method_choice = kwargs.get("method_choice", "")
+        self.stop_reason = kwargs.get("stop_reason", "")
 
     # Setters and getters can be added as needed
     def set_metodo(self, metodo):
@@ -43,13 +100,115 @@ class ResultDetail:
 
     def get_converged(self):
         return self.converged
+
+    def set_info(self, clave, valor):
+        self.info[clave] = valor
+
+    def get_info(self):
+        return self.info
+
+    def set_residual_history(self, residual_history):
+        self.residual_history = residual_history
+
+    def get_residual_history(self):
+        return self.residual_history
+
+    def set_cancelled(self, cancelled):
+        self.cancelled = cancelled
+
+    def get_cancelled(self):
+        return self.cancelled
+
+    def set_timed_out(self, timed_out):
+        self.timed_out = timed_out
+
+    def get_timed_out(self):
+        return self.timed_out
+
+    def set_best_iterate(self, best_iterate, best_iteration):
+        self.best_iterate = best_iterate
+        self.best_iteration = best_iteration
+
+    def get_best_iterate(self):
+        return self.best_iterate
+
+    def get_best_iteration(self):
+        return self.best_iteration
+
+    def set_iteration_history(self, iteration_history):
+        self.iteration_history = iteration_history
+
+    def get_iteration_history(self):
+        return self.iteration_history
+
+    def set_bytes_read(self, bytes_read, bytes_read_per_iteration):
+        self.bytes_read = bytes_read
+        self.bytes_read_per_iteration = bytes_read_per_iteration
+
+    def get_bytes_read(self):
+        return self.bytes_read
+
+    def get_bytes_read_per_iteration(self):
+        return self.bytes_read_per_iteration
+
+    def set_race_result(self, metodo, estado, tiempo, iteraciones):
+        self.race_results[metodo] = {"estado": estado, "tiempo": tiempo, "iteraciones": iteraciones}
+
+    def get_race_results(self):
+        return self.race_results
+
+    def set_warm_start(self, origen, residuo_relativo, iteraciones_ahorradas):
+        self.warm_start = origen
+        self.warm_start_residual = residuo_relativo
+        self.iterations_saved = iteraciones_ahorradas
+
+    def get_warm_start(self):
+        return self.warm_start
+
+    def get_warm_start_residual(self):
+        return self.warm_start_residual
+
+    def get_iterations_saved(self):
+        return self.iterations_saved
+
+    def set_method_choice(self, matrix_analysis, method_choice):
+        self.matrix_analysis = matrix_analysis
+        self.method_choice = method_choice
+
+    def get_matrix_analysis(self):
+        return self.matrix_analysis
+
+    def get_method_choice(self):
+        return self.method_choice
+
+    def set_stop_reason(self, stop_reason):
+        self.stop_reason = stop_reason
+
+    def get_stop_reason(self):
+        return self.stop_reason
     
     def to_dict(self):
         return {
             "metodo": self.metodo,
             "execution_time": self.execution_time,
             "total_iterations": self.total_iterations,
-            "converged": self.converged
+            "converged": self.converged,
+            "info": dict(self.info),
+            "residual_history": list(self.residual_history),
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+            "best_iterate": None if self.best_iterate is None else np.asarray(self.best_iterate).tolist(),
+            "best_iteration": self.best_iteration,
+            "iteration_history": None if self.iteration_history is None else self.iteration_history.to_dict(),
+            "bytes_read": self.bytes_read,
+            "bytes_read_per_iteration": self.bytes_read_per_iteration,
+            "race_results": {metodo: dict(resultado) for metodo, resultado in self.race_results.items()},
+            "warm_start": self.warm_start,
+            "warm_start_residual": self.warm_start_residual,
+            "iterations_saved": self.iterations_saved,
+            "matrix_analysis": dict(self.matrix_analysis),
+            "method_choice": self.method_choice,
+            "stop_reason": self.stop_reason
         }
     
     def __str__(self):
@@ -149,13 +308,528 @@ class ResultRegister:
         for p in self.page:
             p.update_from_result_register()
 
-def jacobi(A, b, tol=1e-10, max_iter=1000):
+# Memoria máxima (en bytes) que ocupa por defecto un HistorialIteraciones
+MAX_BYTES_HISTORIAL = 32 * 1024 * 1024
+
+
+class HistorialIteraciones:
+    '''
+    Registro compacto de los iterados de un método iterativo, guardados en
+    un arreglo float64 preasignado de `capacidad` filas por n columnas.
+
+    Si la corrida cabe en el arreglo se guardan todos los iterados. Si no:
+    - modo "muestreo": al llenarse se descarta una de cada dos filas y se
+      pasa a guardar uno de cada 2k iterados, así que las filas siempre
+      cubren la corrida completa a intervalos regulares.
+    - modo "ventana": buffer circular con los últimos `capacidad` iterados.
+    '''
+    MODOS = ("muestreo", "ventana")
+
+    def __init__(self, n, capacidad, modo="muestreo"):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de historial desconocido: {modo}")
+
+        self.modo = modo
+        self.capacidad = max(2, int(capacidad))
+        self.iteraciones = np.empty(self.capacidad, dtype=np.int64)
+        self.iterados = np.empty((self.capacidad, n))
+
+        # cada: solo se guardan las iteraciones múltiplo de cada
+        # total: filas escritas (en modo ventana puede superar la capacidad)
+        self.cada = 1
+        self.total = 0
+
+    @classmethod
+    def para_sistema(cls, n, max_iter, modo="muestreo", max_bytes=MAX_BYTES_HISTORIAL):
+        '''
+        Crea un historial para un sistema de n incógnitas con a lo más
+        max_iter iteraciones, sin pasar de max_bytes.
+        '''
+        capacidad = min(max_iter + 1, max_bytes // (8 * max(n, 1)))
+        return cls(n, capacidad, modo)
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    @property
+    def n(self):
+        return self.iterados.shape[1]
+
+    @property
+    def nbytes(self):
+        return self.iteraciones.nbytes + self.iterados.nbytes
+
+    def _fila(self, i):
+        # Las filas válidas empiezan en total - len (módulo capacidad)
+        return (self.total - len(self) + i) % self.capacidad
+
+    def iteracion(self, i):
+        '''
+        Número de iteración de la i-ésima fila, en orden cronológico.
+        '''
+        return int(self.iteraciones[self._fila(i)])
+
+    def iterado(self, i):
+        '''
+        Vista del i-ésimo iterado registrado, en orden cronológico.
+        '''
+        return self.iterados[self._fila(i)]
+
+    def proxima(self, iteracion):
+        '''
+        Siguiente iteración, posterior a `iteracion`, que se registraría.
+        '''
+        return (iteracion // self.cada + 1) * self.cada
+
+    def registrar(self, iteracion, x):
+        '''
+        Guarda x como el iterado de `iteracion` si le toca según cada.
+        '''
+        if iteracion % self.cada != 0:
+            return
+
+        if self.modo == "muestreo" and self.total == self.capacidad:
+            self._diezmar()
+            if iteracion % self.cada != 0:
+                return
+
+        self._escribir(iteracion, x)
+
+    def cerrar(self, iteracion, x):
+        '''
+        Guarda el iterado final aunque no le toque, para que la última
+        fila sea siempre la solución devuelta.
+        '''
+        if len(self) > 0 and self.iteracion(len(self) - 1) == iteracion:
+            return
+
+        if self.modo == "muestreo" and self.total == self.capacidad:
+            self._diezmar()
+
+        self._escribir(iteracion, x)
+
+    def _escribir(self, iteracion, x):
+        fila = self.total % self.capacidad
+        self.iteraciones[fila] = iteracion
+        self.iterados[fila] = x
+        self.total += 1
+
+    def _diezmar(self):
+        # Las filas impares son las iteraciones múltiplo de 2 * cada
+        mitad = self.total // 2
+        self.iteraciones[:mitad] = self.iteraciones[1:2 * mitad:2]
+        self.iterados[:mitad] = self.iterados[1:2 * mitad:2]
+        self.total = mitad
+        self.cada *= 2
+
+    @classmethod
+    def desde_filas(cls, iteraciones, iterados, modo="muestreo", cada=1):
+        '''
+        Crea un historial ya lleno con las filas dadas en orden cronológico.
+        '''
+        historial = cls(iterados.shape[1], len(iteraciones), modo)
+        historial.iteraciones[:len(iteraciones)] = iteraciones
+        historial.iterados[:len(iteraciones)] = iterados
+        historial.cada = cada
+        historial.total = len(iteraciones)
+        return historial
+
+    def recortado(self, max_bytes):
+        '''
+        Copia del historial con a lo más max_bytes, tomando filas a
+        intervalos regulares. La última fila (la solución) siempre se
+        conserva, aunque sola ya pase de max_bytes.
+        '''
+        filas = max(1, max_bytes // (8 * (self.n + 1)))
+        orden = np.array([self._fila(i) for i in range(len(self))], dtype=np.int64)
+
+        if len(orden) > filas:
+            orden = orden[np.unique(np.round(np.linspace(len(orden) - 1, 0, filas)).astype(np.int64))]
+
+        cada = self.cada * -(-len(self) // max(len(orden), 1))
+        return HistorialIteraciones.desde_filas(self.iteraciones[orden], self.iterados[orden], self.modo, cada)
+
+    def to_dict(self):
+        orden = [self._fila(i) for i in range(len(self))]
+        return {
+            "modo": self.modo,
+            "cada": self.cada,
+            "iteraciones": self.iteraciones[orden].tolist(),
+            "iterados": self.iterados[orden].tolist()
+        }
+
+
+class TokenCancelacion:
+    '''
+    Token para cancelar cooperativamente una resolución desde otro hilo.
+    Los métodos iterativos lo revisan periódicamente (ver _ControlEjecucion).
+    Con un multiprocessing.Event el token funciona también entre procesos.
+    '''
+    def __init__(self, evento=None):
+        self._evento = threading.Event() if evento is None else evento
+
+    def cancelar(self):
+        self._evento.set()
+
+    def cancelado(self):
+        return self._evento.is_set()
+
+
+# Iteraciones hasta la primera revisión de cancelación, tiempo límite y
+# progreso; después el intervalo se ajusta a PERIODO_REVISION
+ITERACIONES_ENTRE_REVISIONES = 10
+
+# Tiempo aproximado (en segundos) entre dos revisiones
+PERIODO_REVISION = 0.005
+
+# Frecuencia máxima (en Hz) con la que se reporta el progreso
+FRECUENCIA_PROGRESO = 30
+
+
+def _evaluar(valor):
+    '''
+    Devuelve valor() si es una función (medidas que solo se calculan
+    cuando hacen falta) o el propio valor en otro caso.
+    '''
+    return valor() if callable(valor) else valor
+
+
+class _ControlEjecucion:
+    '''
+    Revisa la cancelación, el tiempo límite y el reporte de progreso de un
+    método iterativo, y en esas mismas revisiones guarda el mejor iterado
+    (el de menor residuo o, si no se conoce, de menor paso). Si no hay
+    token, tiempo límite ni función de progreso, revisar() no hace nada.
+
+    La primera revisión ocurre tras ITERACIONES_ENTRE_REVISIONES; luego el
+    número de iteraciones entre revisiones se ajusta para que pasen unos
+    PERIODO_REVISION segundos entre ellas. Así las iteraciones baratas no
+    pagan una revisión cada pocas iteraciones y las caras se revisan en
+    todas.
+
+    El progreso se reporta como progreso(iteracion, paso, residuo) a lo más
+    FRECUENCIA_PROGRESO veces por segundo. residuo puede ser una función
+    de x; solo se evalúa en las iteraciones que se reportan.
+
+    Si se da un HistorialIteraciones, revisar() también se detiene en las
+    iteraciones que el historial quiere registrar.
+    '''
+    def __init__(self, cancelacion=None, tiempo_limite=None, progreso=None, residuo=None, historial=None):
+        self.cancelacion = cancelacion
+        self.limite = None if tiempo_limite is None else time.perf_counter() + tiempo_limite
+        self.progreso = progreso
+        self.residuo = residuo
+        self.historial = historial
+        self.detenible = cancelacion is not None or tiempo_limite is not None
+        self.activo = self.detenible or progreso is not None
+
+        # proxima_control: siguiente revisión de cancelación/tiempo/progreso
+        # proxima_revision: la anterior o la siguiente fila del historial
+        self.salto = ITERACIONES_ENTRE_REVISIONES
+        self.proxima_control = ITERACIONES_ENTRE_REVISIONES if self.activo else float("inf")
+        self.proxima_revision = self.proxima_control if historial is None else min(self.proxima_control, historial.proxima(0))
+        self.ultima_revision = time.perf_counter()
+
+        self.intervalo_progreso = 1.0 / FRECUENCIA_PROGRESO
+        self.ultimo_reporte = float("-inf")
+
+        self.motivo = None
+        self.mejor_x = None
+        self.mejor_medida = float("inf")
+        self.mejor_iteracion = 0
+
+    def revisar(self, iter_count, x=None, paso=None, residuo=None):
+        '''
+        Devuelve True si el método debe detenerse en esta iteración.
+        paso y residuo son normas infinito (o funciones sin argumentos que
+        las calculan); cualquiera puede ser None si el método no la conoce.
+        '''
+        if iter_count + 1 < self.proxima_revision:
+            return False
+
+        if self.historial is not None:
+            if x is not None:
+                self.historial.registrar(iter_count + 1, x)
+            self.proxima_revision = min(self.proxima_control, self.historial.proxima(iter_count + 1))
+            if iter_count + 1 < self.proxima_control:
+                return False
+
+        # Ajustar el salto hacia PERIODO_REVISION, a lo más duplicándolo
+        ahora = time.perf_counter()
+        transcurrido = ahora - self.ultima_revision
+        self.ultima_revision = ahora
+        if transcurrido > 0.0:
+            self.salto = max(1, min(2 * self.salto, int(self.salto * PERIODO_REVISION / transcurrido)))
+        self.proxima_control = iter_count + 1 + self.salto
+        self.proxima_revision = self.proxima_control if self.historial is None else min(self.proxima_control, self.historial.proxima(iter_count + 1))
+
+        # El mejor iterado solo se usa si el método puede detenerse antes
+        if x is not None and self.detenible:
+            medida = _evaluar(paso) if residuo is None else _evaluar(residuo)
+            if medida < self.mejor_medida:
+                self.mejor_medida = medida
+                self.mejor_x = x.copy()
+                self.mejor_iteracion = iter_count + 1
+
+        if self.progreso is not None and ahora - self.ultimo_reporte >= self.intervalo_progreso:
+            self.ultimo_reporte = ahora
+            if residuo is None and self.residuo is not None and x is not None:
+                # El residuo de un iterado que diverge puede desbordar
+                with np.errstate(over="ignore", invalid="ignore"):
+                    residuo = self.residuo(x)
+            self.progreso(iter_count + 1, _evaluar(paso), _evaluar(residuo))
+
+        return self.interrumpido()
+
+    def interrumpido(self):
+        '''
+        Revisa solo la cancelación y el tiempo límite, en cualquier momento.
+        Los métodos con iteraciones muy largas (fuera de memoria) lo llaman
+        también a mitad de una iteración.
+        '''
+        if self.cancelacion is not None and self.cancelacion.cancelado():
+            self.motivo = "cancelado"
+        elif self.limite is not None and time.perf_counter() >= self.limite:
+            self.motivo = "tiempo agotado"
+
+        return self.motivo is not None
+
+    def registrar(self, iteracion, x):
+        '''
+        Guarda un iterado en el historial, para los métodos que no tienen x
+        en cada iteración (GMRES solo lo forma al cerrar cada ciclo).
+        '''
+        if self.historial is not None:
+            self.historial.registrar(iteracion, x)
+
+    def detener(self, x, iter_count, detail=None):
+        '''
+        Registra la detención en el detalle y devuelve la tupla de resultado
+        (mejor iterado, iteraciones, False).
+        '''
+        if self.mejor_x is None:
+            self.mejor_x = x.copy()
+            self.mejor_iteracion = iter_count
+
+        if detail is not None:
+            detail.cancelled = self.motivo == "cancelado"
+            detail.timed_out = self.motivo == "tiempo agotado"
+            detail.set_best_iterate(self.mejor_x, self.mejor_iteracion)
+
+        return self.mejor_x, iter_count, False
+
+
+# Iteraciones por ventana con que _MonitorDivergencia mide el factor de
+# contracción; se juzga con las últimas VENTANAS_DIVERGENCIA ventanas
+VENTANA_DIVERGENCIA = 10
+VENTANAS_DIVERGENCIA = 3
+
+# El método diverge si el paso crece más de CRECIMIENTO_DIVERGENCIA por
+# iteración en todas las ventanas y ya es PASO_DIVERGENCIA veces el menor visto
+CRECIMIENTO_DIVERGENCIA = 1e-3
+PASO_DIVERGENCIA = 1e3
+
+# El método se considera estancado si, aun con la mejor ventana, necesitaría
+# más de MARGEN_ESTANCAMIENTO veces las iteraciones que le quedan. Solo se
+# juzga tras FRACCION_ESTANCAMIENTO de max_iter: el paso de una iteración
+# que converge puede quedarse plano mientras la información cruza la matriz
+MARGEN_ESTANCAMIENTO = 2.0
+FRACCION_ESTANCAMIENTO = 0.1
+
+
+class _MonitorDivergencia:
+    '''
+    Vigila la norma del paso de un método estacionario (Jacobi, Gauss-Seidel,
+    SOR) para abandonarlo en cuanto es claro que no va a converger, en vez
+    de gastar todas las iteraciones:
+
+    - "nan": el paso dejó de ser finito (el iterado desbordó).
+    - "diverged": el paso creció en cada una de las últimas
+      VENTANAS_DIVERGENCIA ventanas de VENTANA_DIVERGENCIA iteraciones y
+      ya es PASO_DIVERGENCIA veces el menor visto.
+    - "stagnated": pasado FRACCION_ESTANCAMIENTO de max_iter, con el
+      factor de contracción de la mejor de esas ventanas llegar a tol
+      requiere más de MARGEN_ESTANCAMIENTO veces las iteraciones restantes
+      (incluye el paso que no decrece, o que no puede bajar de la precisión
+      de la máquina). Con tol <= 0 no se juzga.
+
+    Una sola ventana no basta para decidir, porque el paso de una iteración
+    que converge puede crecer o estancarse durante un transitorio. En cada
+    fin de ventana se guarda una copia del iterado si su paso es el menor
+    visto; es lo que se devuelve si el método diverge. Si se da x0, el
+    vector inicial es el respaldo mientras no haya otro (un barrido de
+    Gauss-Seidel puede desbordar desde la primera iteración).
+    '''
+    def __init__(self, tol, max_iter, x0=None):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.log_pasos = deque(maxlen=VENTANA_DIVERGENCIA * VENTANAS_DIVERGENCIA + 1)
+        self.factor = None
+
+        self.motivo = None
+        self.mejor_x = None if x0 is None else x0.copy()
+        self.mejor_paso = float("inf")
+        self.mejor_iteracion = 0
+
+    def observar(self, iter_count, paso, x):
+        '''
+        Registra el paso de la iteración iter_count (ya aplicado a x) y
+        devuelve True si el método debe abandonarse.
+        '''
+        if not np.isfinite(paso):
+            self.motivo = "nan"
+            return True
+
+        self.log_pasos.append(np.log(max(paso, np.finfo(float).tiny)))
+
+        fin_ventana = (iter_count + 1) % VENTANA_DIVERGENCIA == 0
+        if (fin_ventana or iter_count == 0) and paso < self.mejor_paso:
+            self.mejor_paso = paso
+            self.mejor_x = x.copy()
+            self.mejor_iteracion = iter_count + 1
+
+        if not fin_ventana or len(self.log_pasos) < self.log_pasos.maxlen:
+            return False
+
+        # Logaritmo del factor de contracción medio de cada ventana
+        factores = [(self.log_pasos[(k + 1) * VENTANA_DIVERGENCIA] - self.log_pasos[k * VENTANA_DIVERGENCIA]) / VENTANA_DIVERGENCIA
+                    for k in range(VENTANAS_DIVERGENCIA)]
+        self.factor = float(np.exp(factores[-1]))
+
+        if min(factores) > np.log1p(CRECIMIENTO_DIVERGENCIA) and paso >= PASO_DIVERGENCIA * self.mejor_paso:
+            self.motivo = "diverged"
+        elif self.tol > 0.0 and iter_count + 1 >= FRACCION_ESTANCAMIENTO * self.max_iter:
+            contraccion = -min(factores)
+            necesarias = (self.log_pasos[-1] - np.log(self.tol)) / contraccion if contraccion > 0.0 else float("inf")
+            if necesarias > MARGEN_ESTANCAMIENTO * (self.max_iter - iter_count - 1):
+                self.motivo = "stagnated"
+
+        return self.motivo is not None
+
+    def abandonar(self, x, iter_count, detail=None):
+        '''
+        Registra el motivo en el detalle y devuelve la tupla de resultado:
+        el iterado actual si el método se estancó o el de menor paso si
+        divergió, las iteraciones realizadas y False.
+        '''
+        if self.motivo != "stagnated" and self.mejor_x is not None:
+            x, iteracion = self.mejor_x, self.mejor_iteracion
+        else:
+            iteracion = iter_count
+
+        if detail is not None:
+            detail.set_stop_reason(self.motivo)
+            detail.set_best_iterate(x, iteracion)
+            if self.factor is not None:
+                detail.set_info("factor de contracción", self.factor)
+
+        return x, iter_count, False
+
+
+# Memoria temporal por bloque al recorrer una A densa por filas
+BYTES_BLOQUE_ANALISIS = 32 * 1024 * 1024
+
+
+def _filas_por_bloque(n):
+    return max(1, BYTES_BLOQUE_ANALISIS // (8 * max(n, 1)))
+
+
+def _separar_diagonal(A):
+    '''
+    Separa A = D + R. Devuelve la diagonal D y R (A con la diagonal en cero,
+    modificada in-place).
+    '''
+    D = A.diagonal().copy()
+    np.fill_diagonal(A, 0.0)
+    return D, A
+
+
+def _vector_inicial(x0, n):
+    '''
+    Copia de x0 como vector inicial (los métodos lo modifican), o ceros si
+    no se da.
+
+    Raises:
+        ValueError: si x0 no tiene n componentes finitas.
+    '''
+    if x0 is None:
+        return np.zeros(n)
+
+    x = np.array(x0, dtype=float).reshape(-1)
+    if len(x) != n or not np.all(np.isfinite(x)):
+        raise ValueError(f"El vector inicial x0 debe tener {n} componentes finitas")
+    return x
+
+
+def _registrar_memoria(detail, A):
+    '''
+    Registra en el detalle la memoria que ocupa A: nnz para una MatrizCSR,
+    n^2 para una matriz densa.
+    '''
+    if detail is None:
+        return
+
+    if isinstance(A, MatrizCSR):
+        detail.set_info("nnz", A.nnz)
+        detail.set_info("memoria de A (bytes)", A.nbytes)
+    else:
+        detail.set_info("memoria de A (bytes)", np.asarray(A).nbytes)
+
+
+def _residuo_inf(A, b, x):
+    '''
+    Norma infinito de b - Ax; infinito si x no es finito (un método que
+    divergió nunca es el de menor residuo).
+    '''
+    if not np.all(np.isfinite(x)):
+        return float("inf")
+    return float(np.max(np.abs(b - A @ x))) if len(b) > 0 else 0.0
+
+
+def _jacobi_csr(A: MatrizCSR, b, tol, max_iter, detail, x0=None, **control):
+    '''
+    Jacobi sobre una MatrizCSR: cada barrido cuesta O(nnz).
+    '''
+    n = len(b)
+    D = A.diagonal()
+    control = _ControlEjecucion(**control, residuo=lambda x: np.abs(b - A @ x).max(initial=0.0))
+
+    filas = A.indices_fila()
+    fuera = filas != A.col_idx
+    filas_R, cols_R, vals_R = filas[fuera], A.col_idx[fuera], A.valores[fuera]
+
+    x = _vector_inicial(x0, n)
+    monitor = _MonitorDivergencia(tol, max_iter, x)
+
+    for iter_count in range(max_iter):
+        # x_new = (b - R x) / D, con R x acumulado por filas en O(nnz); si
+        # desborda, _MonitorDivergencia lo reporta (sin avisos de numpy)
+        with np.errstate(over="ignore", invalid="ignore"):
+            x_new = (b - np.bincount(filas_R, weights=vals_R * x[cols_R], minlength=n)) / D
+
+            # Verificar convergencia (norma infinito del paso)
+            paso = np.abs(x_new - x).max(initial=0.0)
+        if paso < tol:
+            return x_new, iter_count + 1, True
+
+        x = x_new
+
+        if monitor.observar(iter_count, paso, x):
+            return monitor.abandonar(x, iter_count + 1, detail)
+
+        if control.revisar(iter_count, x, paso=paso):
+            return control.detener(x, iter_count + 1, detail)
+
+    return x, max_iter, False
+
+
+def jacobi(A, b, tol=1e-10, max_iter=1000, detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None, x0=None):
     """
     Método de Jacobi para resolver sistemas de ecuaciones lineales Ax = b
     
     Parámetros:
     -----------
-    A : array_like
+    A : array_like o MatrizCSR
         Matriz de coeficientes (n x n)
     b : array_like
         Vector de términos independientes (n)
@@ -163,152 +837,1982 @@ def jacobi(A, b, tol=1e-10, max_iter=1000):
         Tolerancia para el criterio de convergencia (default: 1e-10)
     max_iter : int, opcional
         Número máximo de iteraciones (default: 1000)
+    detail : ResultDetail, opcional
+        Si se proporciona, se registra la memoria ocupada por A y, si la
+        resolución se detiene antes, el motivo y el mejor iterado
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+    x0 : array_like, opcional
+        Vector inicial (default: ceros), p. ej. la solución de un sistema
+        parecido (arranque en caliente)
     
     Retorna:
     --------
     x : ndarray
-        Vector solución
+        Vector solución (el mejor iterado si se canceló, agotó el tiempo
+        o divergió; ver _MonitorDivergencia)
     iter_count : int
         Número de iteraciones realizadas
     converged : bool
         True si el método convergió, False en caso contrario
     """
-    A = np.array(A, dtype=float)
+    _registrar_memoria(detail, A)
+    control = {"cancelacion": cancelacion, "tiempo_limite": tiempo_limite, "progreso": progreso, "historial": historial}
+
     b = np.array(b, dtype=float)
+
+    if isinstance(A, MatrizCSR):
+        return _jacobi_csr(A, b, tol, max_iter, detail, x0=x0, **control)
+
+    A = np.array(A, dtype=float)
     n = len(b)
-    
-    # Vector inicial (ceros)
-    x = np.zeros(n)
-    x_new = np.zeros(n)
-    
+
+    # Separar A = D + R una sola vez: D es la diagonal y R la parte fuera
+    # de la diagonal. A ya es una copia, así que se reutiliza como R.
+    D, R = _separar_diagonal(A)
+    control = _ControlEjecucion(**control, residuo=lambda x: np.abs(b - R @ x - D * x).max(initial=0.0))
+
+    # Vector inicial (x0 o ceros) y buffers reutilizados en cada barrido
+    x = _vector_inicial(x0, n)
+    x_new = np.empty(n)
+    diff = np.empty(n)
+    monitor = _MonitorDivergencia(tol, max_iter, x)
+
     for iter_count in range(max_iter):
-        for i in range(n):
-            suma = 0
-            for j in range(n):
-                if j != i:
-                    suma += A[i, j] * x[j]
-            x_new[i] = (b[i] - suma) / A[i, i]
-        
-        # Verificar convergencia
-        if np.linalg.norm(x_new - x, ord=np.inf) < tol:
+        # x_new = (b - R x) / D como un solo producto matriz-vector; si
+        # desborda, _MonitorDivergencia lo reporta (sin avisos de numpy)
+        with np.errstate(over="ignore", invalid="ignore"):
+            np.dot(R, x, out=x_new)
+            np.subtract(b, x_new, out=x_new)
+            np.divide(x_new, D, out=x_new)
+
+            # Verificar convergencia (norma infinito del paso)
+            np.subtract(x_new, x, out=diff)
+            np.abs(diff, out=diff)
+        paso = diff.max(initial=0.0)
+        if paso < tol:
             return x_new, iter_count + 1, True
-        
-        x = x_new.copy()
-    
+
+        x, x_new = x_new, x
+
+        if monitor.observar(iter_count, paso, x):
+            return monitor.abandonar(x, iter_count + 1, detail)
+
+        if control.revisar(iter_count, x, paso=paso):
+            return control.detener(x, iter_count + 1, detail)
+
     return x, max_iter, False
 
 
-def gauss_seidel(A, b, tol=1e-10, max_iter=1000):
+def estimar_radio_espectral_jacobi(A, iteraciones=50):
     """
-    Método de Gauss-Seidel para resolver sistemas de ecuaciones lineales Ax = b
-    
+    Estima el radio espectral de la matriz de iteración de Jacobi
+    B = -D^-1 R mediante el método de la potencia.
+
     Parámetros:
     -----------
-    A : array_like
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n)
+    iteraciones : int, opcional
+        Número de productos matriz-vector a realizar (default: 50)
+
+    Retorna:
+    --------
+    rho : float
+        Estimación del radio espectral de B
+    """
+    if isinstance(A, MatrizCSR):
+        n = A.shape[0]
+        D = A.diagonal()
+        producto_R = lambda v: A.dot(v) - D * v
+    else:
+        # Sin copiar A: R v = A v - D v
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        D = np.diag(A).copy()
+        producto_R = lambda v: A @ v - D * v
+
+    # Vector inicial determinista con componentes en todas las direcciones
+    v = np.linspace(1.0, 2.0, n)
+    v /= np.linalg.norm(v)
+
+    # Se promedia el crecimiento logarítmico de la segunda mitad de las
+    # iteraciones para no depender de un par de autovalores complejos
+    log_crecimiento = 0.0
+    muestras = 0
+    for k in range(iteraciones):
+        v = producto_R(v) / D
+        norma = np.linalg.norm(v)
+        if norma == 0.0 or not np.isfinite(norma):
+            return 0.0 if norma == 0.0 else float("inf")
+        v /= norma
+        if k >= iteraciones // 2:
+            log_crecimiento += np.log(norma)
+            muestras += 1
+
+    return float(np.exp(log_crecimiento / max(muestras, 1)))
+
+
+def estimar_omega_optimo(A, iteraciones=50):
+    """
+    Estima el factor de relajación óptimo para SOR a partir del radio
+    espectral de Jacobi: omega = 2 / (1 + sqrt(1 - rho^2)).
+
+    Si Jacobi no es contractivo (rho >= 1) se devuelve 1.0, es decir,
+    Gauss-Seidel sin relajación.
+    """
+    rho = estimar_radio_espectral_jacobi(A, iteraciones=iteraciones)
+    if rho >= 1.0:
+        return 1.0
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho * rho))
+
+
+def _barrido_sor(filas, x, b_d, w_d, uno_menos_omega):
+    '''
+    Realiza un barrido SOR in-place sobre x y devuelve la norma infinito
+    del paso. `filas` son las vistas de las filas de la parte fuera de la
+    diagonal (densas o FilaDispersa), y b_d, w_d son omega*b/D y omega/D precalculados.
+    '''
+    paso_max = 0.0
+
+    # Si el método diverge los valores desbordan a inf/NaN dentro del
+    # barrido; se deja sin aviso y _MonitorDivergencia lo reporta
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(len(filas)):
+            x_i = uno_menos_omega * x[i] + b_d[i] - w_d[i] * filas[i].dot(x)
+            paso = abs(x_i - x[i])
+            # paso != paso detecta NaN para no reportar una falsa convergencia
+            if paso > paso_max or paso != paso:
+                paso_max = paso
+            x[i] = x_i
+
+    return paso_max
+
+
+def sor(A, b, omega=1.0, tol=1e-10, max_iter=1000, detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None, x0=None):
+    """
+    Método de sobre-relajación sucesiva (SOR) para resolver Ax = b.
+    Con omega=1 es exactamente el método de Gauss-Seidel.
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
         Matriz de coeficientes (n x n)
     b : array_like
         Vector de términos independientes (n)
+    omega : float o None, opcional
+        Factor de relajación en (0, 2). Si es None se estima
+        automáticamente con estimar_omega_optimo (default: 1.0)
     tol : float, opcional
         Tolerancia para el criterio de convergencia (default: 1e-10)
     max_iter : int, opcional
         Número máximo de iteraciones (default: 1000)
-    
+    detail : ResultDetail, opcional
+        Si se proporciona, se registra la memoria ocupada por A y, si la
+        resolución se detiene antes, el motivo y el mejor iterado
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+    x0 : array_like, opcional
+        Vector inicial (default: ceros), p. ej. la solución de un sistema
+        parecido (arranque en caliente)
+
     Retorna:
     --------
     x : ndarray
-        Vector solución
+        Vector solución (el mejor iterado si se canceló, agotó el tiempo
+        o divergió; ver _MonitorDivergencia)
     iter_count : int
         Número de iteraciones realizadas
     converged : bool
         True si el método convergió, False en caso contrario
+
+    Raises:
+    -------
+    ValueError
+        Si omega está fuera del intervalo (0, 2)
     """
-    A = np.array(A, dtype=float)
+    _registrar_memoria(detail, A)
+
+    if not isinstance(A, MatrizCSR):
+        A = np.array(A, dtype=float)
     b = np.array(b, dtype=float)
     n = len(b)
-    
-    # Vector inicial (ceros)
-    x = np.zeros(n)
-    x_old = np.zeros(n)
-    
-    for iter_count in range(max_iter):
-        x_old = x.copy()
-        
-        for i in range(n):
-            suma = 0
-            for j in range(n):
-                if j != i:
-                    suma += A[i, j] * x[j]
-            x[i] = (b[i] - suma) / A[i, i]
-        
-        # Verificar convergencia
-        if np.linalg.norm(x - x_old, ord=np.inf) < tol:
+
+    if omega is None:
+        omega = estimar_omega_optimo(A)
+
+    if not 0.0 < omega < 2.0:
+        raise ValueError("El factor de relajación omega debe estar en el intervalo (0, 2)")
+
+    # Separar A = D + R y precalcular las vistas de cada fila de R
+    if isinstance(A, MatrizCSR):
+        D = A.diagonal()
+        filas = A.filas_fuera_de_diagonal()
+        residuo = lambda x: np.abs(b - A @ x).max(initial=0.0)
+    else:
+        D, R = _separar_diagonal(A)
+        filas = list(R)
+        residuo = lambda x: np.abs(b - R @ x - D * x).max(initial=0.0)
+
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, residuo, historial)
+
+    # Los términos constantes de la actualización se calculan una sola vez
+    b_d = omega * b / D
+    w_d = omega / D
+    uno_menos_omega = 1.0 - omega
+
+    # Vector inicial (x0 o ceros)
+    x = _vector_inicial(x0, n)
+    monitor = _MonitorDivergencia(tol, max_iter, x)
+
+    for iter_count in range(max_iter):
+        paso_max = _barrido_sor(filas, x, b_d, w_d, uno_menos_omega)
+
+        # Verificar convergencia (norma infinito del paso)
+        if paso_max < tol:
             return x, iter_count + 1, True
-    
+
+        if monitor.observar(iter_count, paso_max, x):
+            return monitor.abandonar(x, iter_count + 1, detail)
+
+        if control.revisar(iter_count, x, paso=paso_max):
+            return control.detener(x, iter_count + 1, detail)
+
     return x, max_iter, False
 
-def gauss_jordan(A, b):
+
+def gauss_seidel(A, b, tol=1e-10, max_iter=1000, detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None, x0=None):
     """
-    Método de Gauss-Jordan para resolver sistemas de ecuaciones lineales Ax = b
-    con pivoteo parcial para mayor estabilidad numérica.
+    Método de Gauss-Seidel para resolver sistemas de ecuaciones lineales Ax = b
     
     Parámetros:
     -----------
-    A : array_like
+    A : array_like o MatrizCSR
         Matriz de coeficientes (n x n)
     b : array_like
         Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia para el criterio de convergencia (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    detail : ResultDetail, opcional
+        Si se proporciona, se registra la memoria ocupada por A y, si la
+        resolución se detiene antes, el motivo y el mejor iterado
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+    x0 : array_like, opcional
+        Vector inicial (default: ceros), p. ej. la solución de un sistema
+        parecido (arranque en caliente)
     
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución (el mejor iterado si se canceló, agotó el tiempo
+        o divergió; ver _MonitorDivergencia)
+    iter_count : int
+        Número de iteraciones realizadas
+    converged : bool
+        True si el método convergió, False en caso contrario
+    """
+    return sor(A, b, omega=1.0, tol=tol, max_iter=max_iter, detail=detail, cancelacion=cancelacion, tiempo_limite=tiempo_limite,
+               progreso=progreso, historial=historial, x0=x0)
+
+def _grafo_de_dependencias(A):
+    '''
+    Construye la lista de adyacencia de las incógnitas: i y j son vecinos si
+    A[i, j] o A[j, i] es distinto de cero (sin contar la diagonal).
+    '''
+    patron = A != 0
+    patron = patron | patron.T
+    np.fill_diagonal(patron, False)
+    return [np.flatnonzero(fila) for fila in patron]
+
+
+def _colorear_rojo_negro(vecinos):
+    '''
+    Intenta un coloreo con dos colores (rojo-negro) recorriendo el grafo en
+    anchura. Devuelve el arreglo de colores o None si el grafo no es bipartito.
+    '''
+    n = len(vecinos)
+    colores = np.full(n, -1, dtype=np.int64)
+
+    for inicio in range(n):
+        if colores[inicio] != -1:
+            continue
+        colores[inicio] = 0
+        pendientes = deque([inicio])
+
+        while pendientes:
+            i = pendientes.popleft()
+            for j in vecinos[i]:
+                if colores[j] == -1:
+                    colores[j] = 1 - colores[i]
+                    pendientes.append(j)
+                elif colores[j] == colores[i]:
+                    return None
+
+    return colores
+
+
+def _colorear_voraz(vecinos):
+    '''
+    Coloreo voraz en orden natural: cada incógnita toma el menor color que
+    no usa ninguno de sus vecinos ya coloreados.
+    '''
+    n = len(vecinos)
+    colores = np.full(n, -1, dtype=np.int64)
+
+    for i in range(n):
+        usados = set(colores[vecinos[i]].tolist())
+        color = 0
+        while color in usados:
+            color += 1
+        colores[i] = color
+
+    return colores
+
+
+def colorear_incognitas(A):
+    """
+    Agrupa las incógnitas de A en clases de color independientes: dentro de
+    una misma clase ninguna incógnita depende de otra, por lo que todas
+    pueden actualizarse a la vez en Gauss-Seidel.
+
+    Se intenta primero un coloreo rojo-negro (mallas estructuradas y, en
+    general, cualquier grafo bipartito); si no es posible se usa un coloreo
+    voraz.
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n)
+
+    Retorna:
+    --------
+    clases : list[ndarray]
+        Índices de las incógnitas de cada color, en orden de actualización
+    """
+    A = np.asarray(A, dtype=float)
+    vecinos = _grafo_de_dependencias(A)
+
+    colores = _colorear_rojo_negro(vecinos)
+    if colores is None:
+        colores = _colorear_voraz(vecinos)
+
+    return [np.flatnonzero(colores == c) for c in range(int(colores.max(initial=-1)) + 1)]
+
+
+def gauss_seidel_multicolor(A, b, tol=1e-10, max_iter=1000, hilos=1, detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None,
+                            x0=None):
+    """
+    Gauss-Seidel con ordenamiento multicolor para resolver Ax = b.
+
+    Las incógnitas se agrupan con colorear_incognitas y cada clase de color
+    se actualiza como un solo bloque vectorizado. Con hilos > 1 las filas de
+    cada clase se reparten entre un pool de hilos (NumPy libera el GIL en
+    los productos matriz-vector).
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia para el criterio de convergencia (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    hilos : int, opcional
+        Número de hilos para actualizar cada clase de color (default: 1)
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el número de colores, el costo del
+        coloreo y el speedup por barrido frente a Gauss-Seidel secuencial
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+    x0 : array_like, opcional
+        Vector inicial (default: ceros), p. ej. la solución de un sistema
+        parecido (arranque en caliente)
+
     Retorna:
     --------
     x : ndarray
         Vector solución
-    
+    iter_count : int
+        Número de iteraciones realizadas
+    converged : bool
+        True si el método convergió, False en caso contrario
+    """
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    n = len(b)
+
+    inicio = time.perf_counter()
+    clases = colorear_incognitas(A)
+    tiempo_coloreo = time.perf_counter() - inicio
+
+    D, R = _separar_diagonal(A)
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, lambda x: np.abs(b - R @ x - D * x).max(initial=0.0), historial)
+
+    # Cada clase se parte en bloques (uno por hilo) con sus filas de R
+    # copiadas de forma contigua, para que el barrido no haga fancy indexing
+    hilos = max(1, int(hilos))
+    bloques = []
+    for idx in clases:
+        partes = np.array_split(idx, min(hilos, len(idx))) if hilos > 1 else [idx]
+        bloques.append([(p, R[p], b[p], D[p]) for p in partes if len(p) > 0])
+
+    def actualizar(bloque, x):
+        idx, R_idx, b_idx, D_idx = bloque
+        # Dentro de cada hilo: np.errstate no se hereda entre hilos
+        with np.errstate(over="ignore", invalid="ignore"):
+            x_idx = (b_idx - R_idx @ x) / D_idx
+            paso = np.abs(x_idx - x[idx]).max()
+        x[idx] = x_idx
+        return paso
+
+    pool = ThreadPoolExecutor(max_workers=hilos) if hilos > 1 else None
+
+    def barrido(x):
+        paso_max = 0.0
+        for bloques_color in bloques:
+            if pool is None or len(bloques_color) == 1:
+                pasos = [actualizar(bloque, x) for bloque in bloques_color]
+            else:
+                pasos = list(pool.map(lambda bloque: actualizar(bloque, x), bloques_color))
+            # np.max propaga NaN y evita reportar una falsa convergencia
+            paso_max = np.max([paso_max] + pasos)
+        return paso_max
+
+    # Vector inicial (x0 o ceros)
+    x = _vector_inicial(x0, n)
+    monitor = _MonitorDivergencia(tol, max_iter, x)
+    resultado = None
+    inicio = time.perf_counter()
+
+    try:
+        for iter_count in range(max_iter):
+            # Verificar convergencia (norma infinito del paso)
+            paso = barrido(x)
+            if paso < tol:
+                resultado = (x, iter_count + 1, True)
+                break
+
+            if monitor.observar(iter_count, paso, x):
+                resultado = monitor.abandonar(x, iter_count + 1, detail)
+                break
+
+            if control.revisar(iter_count, x, paso=paso):
+                resultado = control.detener(x, iter_count + 1, detail)
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if resultado is None:
+        resultado = (x, max_iter, False)
+
+    if detail is not None:
+        tiempo_barrido = (time.perf_counter() - inicio) / max(resultado[1], 1)
+
+        # Un barrido secuencial de referencia sobre una copia desde cero
+        b_d = b / D
+        w_d = 1.0 / D
+        inicio = time.perf_counter()
+        _barrido_sor(list(R), np.zeros(n), b_d, w_d, 0.0)
+        tiempo_secuencial = time.perf_counter() - inicio
+
+        detail.set_info("colores", len(clases))
+        detail.set_info("tiempo de coloreo (s)", tiempo_coloreo)
+        detail.set_info("hilos", hilos)
+        detail.set_info("speedup por barrido", tiempo_secuencial / tiempo_barrido if tiempo_barrido > 0 else float("inf"))
+
+    return resultado
+
+def es_simetrica(A, tol=1e-12):
+    """
+    Indica si max |A - A^T| <= tol * max |A|. Una A densa se compara por
+    bloques de filas, sin formar A^T completa.
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz cuadrada (n x n)
+    tol : float, opcional
+        Tolerancia relativa (default: 1e-12)
+
+    Retorna:
+    --------
+    simetrica : bool
+    """
+    if isinstance(A, MatrizCSR):
+        filas = A.indices_fila()
+        diferencia = MatrizCSR.desde_tripletas(
+            np.concatenate([filas, A.col_idx]),
+            np.concatenate([A.col_idx, filas]),
+            np.concatenate([A.valores, -A.valores]),
+            A.shape
+        ).valores
+        return bool(np.abs(diferencia).max(initial=0.0) <= tol * np.abs(A.valores).max(initial=0.0))
+
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    filas_bloque = _filas_por_bloque(n)
+    diferencia = 0.0
+    escala = 0.0
+
+    for inicio in range(0, n, filas_bloque):
+        fin = min(n, inicio + filas_bloque)
+        bloque = A[inicio:fin]
+        diferencia = max(diferencia, float(np.abs(bloque - A[:, inicio:fin].T).max(initial=0.0)))
+        escala = max(escala, float(np.abs(bloque).max(initial=0.0)))
+
+    return diferencia <= tol * escala
+
+
+def verificar_spd(A, tol=1e-12):
+    """
+    Verificación barata de que A puede ser simétrica definida positiva:
+    A debe ser cuadrada, simétrica y con diagonal positiva. La definición
+    positiva completa se comprueba durante el gradiente conjugado (p^T A p > 0).
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n)
+    tol : float, opcional
+        Tolerancia relativa para la simetría (default: 1e-12)
+
     Raises:
     -------
     ValueError
-        Si las dimensiones no son compatibles o la matriz es singular
+        Si A no cumple alguna de las condiciones
     """
-    A = np.array(A, dtype=float)
-    b = np.array(b, dtype=float)
-    
-    # Validar dimensiones
-    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+    if A.shape[0] != A.shape[1]:
         raise ValueError("La matriz A debe ser cuadrada")
-    
-    n = A.shape[0]
-    
-    if b.shape[0] != n:
-        raise ValueError("Las dimensiones de A y b no son compatibles")
-    
-    # Construir la matriz aumentada
-    Ab = np.hstack([A, b.reshape(-1, 1)])
-    
-    # Proceso de eliminación de Gauss-Jordan con pivoteo parcial
-    for i in range(n):
-        # Pivoteo parcial: buscar el elemento máximo en la columna i
-        max_row = i
-        for k in range(i + 1, n):
-            if abs(Ab[k, i]) > abs(Ab[max_row, i]):
-                max_row = k
-        
-        # Intercambiar filas si es necesario
-        if max_row != i:
-            Ab[[i, max_row]] = Ab[[max_row, i]]
-        
-        # Verificar si el pivote es cero (matriz singular)
-        if abs(Ab[i, i]) < 1e-10:
-            raise ValueError("La matriz es singular o casi singular. No se puede resolver el sistema.")
-        
-        # Normalizar la fila del pivote (hacer el elemento diagonal igual a 1)
-        Ab[i] = Ab[i] / Ab[i, i]
-        
-        # Hacer los demás elementos de la columna igual a 0
-        for j in range(n):
-            if j != i:
-                Ab[j] = Ab[j] - Ab[j, i] * Ab[i]
-    
-    # La solución está en la última columna
-    x = Ab[:, -1]
-    print(x)
-    
-    return x
\ No newline at end of file
+
+    if not es_simetrica(A, tol):
+        raise ValueError("La matriz no es simétrica; el gradiente conjugado requiere una matriz simétrica definida positiva.")
+
+    if np.any(A.diagonal() <= 0.0):
+        raise ValueError("La matriz tiene elementos no positivos en la diagonal; no es definida positiva.")
+
+
+def _precondicionador(A, tipo):
+    '''
+    Devuelve una función z = M^-1 r para el precondicionador indicado:
+    "ninguno", "diagonal", "ic0" (solo simétricas) o "ilu0".
+    '''
+    if tipo == "ninguno":
+        return lambda r: r.copy()
+
+    if tipo == "diagonal":
+        # Las filas con diagonal cero (p. ej. una permutación) no se escalan
+        D = A.diagonal()
+        inversa_D = np.divide(1.0, D, out=np.ones(len(D)), where=D != 0.0)
+        return lambda r: inversa_D * r
+
+    if tipo == "ic0":
+        L = cholesky_incompleto(A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A))
+        inferior = TriangularDispersa(L, inferior=True)
+        superior = TriangularDispersa(L.transpuesta(), inferior=False)
+        return lambda r: superior.resolver(inferior.resolver(r))
+
+    if tipo == "ilu0":
+        L, U = lu_incompleto(A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A))
+        inferior = TriangularDispersa(L, inferior=True)
+        superior = TriangularDispersa(U, inferior=False)
+        return lambda r: superior.resolver(inferior.resolver(r))
+
+    raise ValueError(f"Precondicionador desconocido: {tipo}")
+
+
+def gradiente_conjugado(A, b, tol=1e-10, max_iter=1000, precondicionador="diagonal", detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None):
+    """
+    Método del gradiente conjugado precondicionado para sistemas simétricos
+    definidos positivos Ax = b.
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz de coeficientes simétrica definida positiva (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia sobre la norma infinito del residuo (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    precondicionador : str, opcional
+        "ninguno", "diagonal" o "ic0" (Cholesky incompleto sin relleno)
+        (default: "diagonal")
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el precondicionador, la memoria de A
+        y la norma del residuo en cada iteración (residual_history)
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    iter_count : int
+        Número de iteraciones realizadas
+    converged : bool
+        True si el método convergió, False en caso contrario
+
+    Raises:
+    -------
+    ValueError
+        Si A no es simétrica definida positiva
+    """
+    _registrar_memoria(detail, A)
+
+    if not isinstance(A, MatrizCSR):
+        A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+
+    verificar_spd(A)
+    aplicar_M = _precondicionador(A, precondicionador)
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, historial=historial)
+
+    # Vector inicial (ceros): el residuo inicial es b
+    x = np.zeros(len(b))
+    r = b.copy()
+    z = aplicar_M(r)
+    p = z.copy()
+    rz = r @ z
+
+    residuos = [float(np.abs(r).max(initial=0.0))]
+    resultado = None
+
+    # r^T M^-1 r = 0 solo si r = 0: la solución es exacta aun con tol = 0,
+    # y seguir daría p = 0 y una curvatura nula que no indica nada sobre A
+    if residuos[0] < tol or rz == 0.0:
+        resultado = (x, 0, True)
+
+    for iter_count in range(max_iter if resultado is None else 0):
+        Ap = A @ p
+        curvatura = p @ Ap
+        if curvatura <= 0.0:
+            raise ValueError("La matriz no es definida positiva (p^T A p <= 0).")
+
+        alpha = rz / curvatura
+        x += alpha * p
+        r -= alpha * Ap
+
+        # Verificar convergencia (norma infinito del residuo)
+        residuos.append(float(np.abs(r).max(initial=0.0)))
+        if residuos[-1] < tol:
+            resultado = (x, iter_count + 1, True)
+            break
+
+        if control.revisar(iter_count, x, paso=lambda: abs(alpha) * np.abs(p).max(), residuo=residuos[-1]):
+            resultado = control.detener(x, iter_count + 1, detail)
+            break
+
+        z = aplicar_M(r)
+        rz_nuevo = r @ z
+        if rz_nuevo == 0.0:
+            resultado = (x, iter_count + 1, True)
+            break
+
+        p = z + (rz_nuevo / rz) * p
+        rz = rz_nuevo
+
+    if resultado is None:
+        resultado = (x, max_iter, False)
+
+    if detail is not None:
+        detail.set_info("precondicionador", precondicionador)
+        detail.set_info("residuo final", residuos[-1])
+        detail.set_residual_history(residuos)
+
+    return resultado
+
+
+def gmres(A, b, tol=1e-10, max_iter=1000, reinicio=30, precondicionador="ninguno", detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None):
+    """
+    Método GMRES(m) con reinicio para sistemas no simétricos Ax = b,
+    precondicionado por la derecha (A M^-1 u = b, x = M^-1 u) para que el
+    residuo minimizado sea el del sistema original.
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia sobre la norma infinito del residuo (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de pasos de Arnoldi en total (default: 1000)
+    reinicio : int, opcional
+        Dimensión m del subespacio de Krylov antes de reiniciar (default: 30)
+    precondicionador : str, opcional
+        "ninguno", "diagonal" o "ilu0" (default: "ninguno")
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el precondicionador, el número de
+        reinicios y en residual_history la norma 2 del residuo estimada
+        en cada paso de Arnoldi
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    iter_count : int
+        Número de pasos de Arnoldi realizados
+    converged : bool
+        True si el método convergió, False en caso contrario
+    """
+    _registrar_memoria(detail, A)
+
+    if not isinstance(A, MatrizCSR):
+        A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    n = len(b)
+
+    if reinicio < 1:
+        raise ValueError("El reinicio de GMRES debe ser un entero positivo")
+
+    aplicar_M = _precondicionador(A, precondicionador)
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, historial=historial)
+    m = min(int(reinicio), max(n, 1))
+
+    # Vector inicial (ceros)
+    x = np.zeros(n)
+    r = b.copy()
+    residuos = [float(np.linalg.norm(r))]
+    iter_count = 0
+    ciclos = 0
+    converged = bool(np.abs(r).max(initial=0.0) < tol)
+
+    while not converged and iter_count < max_iter:
+        ciclos += 1
+        beta = np.linalg.norm(r)
+
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cosenos = np.zeros(m)
+        senos = np.zeros(m)
+        g = np.zeros(m + 1)
+
+        V[0] = r / beta
+        g[0] = beta
+        pasos = 0
+
+        for j in range(m):
+            w = A @ aplicar_M(V[j])
+
+            # Gram-Schmidt clásico con reortogonalización (dos pasadas)
+            for _ in range(2):
+                h = V[:j + 1] @ w
+                w -= h @ V[:j + 1]
+                H[:j + 1, j] += h
+
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0.0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Aplicar las rotaciones de Givens anteriores y calcular la nueva
+            for i in range(j):
+                h_i = cosenos[i] * H[i, j] + senos[i] * H[i + 1, j]
+                H[i + 1, j] = -senos[i] * H[i, j] + cosenos[i] * H[i + 1, j]
+                H[i, j] = h_i
+
+            radio = np.hypot(H[j, j], H[j + 1, j])
+            cosenos[j] = H[j, j] / radio if radio > 0.0 else 1.0
+            senos[j] = H[j + 1, j] / radio if radio > 0.0 else 0.0
+            H[j, j] = radio
+            H[j + 1, j] = 0.0
+
+            g[j + 1] = -senos[j] * g[j]
+            g[j] = cosenos[j] * g[j]
+
+            pasos += 1
+            iter_count += 1
+            residuos.append(float(abs(g[j + 1])))
+
+            # GMRES no reduce nunca el residuo, así que el mejor iterado es
+            # el que se obtiene al cerrar el ciclo actual. x solo cambia al
+            # cerrar el ciclo, así que se reporta el residuo estimado sin paso.
+            # Se revisa antes del corte por convergencia para que también se
+            # revise cuando cada ciclo termina en uno o dos pasos
+            detener = control.revisar(iter_count - 1, residuo=residuos[-1])
+
+            # La norma 2 acota la norma infinito: si es menor a tol, ya se cumple
+            if abs(g[j + 1]) < tol or H[j, j] == 0.0 or iter_count >= max_iter or detener:
+                break
+
+        # Resolver el sistema triangular superior H y = g y actualizar x
+        y = np.zeros(pasos)
+        for i in range(pasos - 1, -1, -1):
+            if H[i, i] != 0.0:
+                y[i] = (g[i] - H[i, i + 1:pasos] @ y[i + 1:]) / H[i, i]
+
+        x += aplicar_M(y @ V[:pasos])
+        control.registrar(iter_count, x)
+
+        # Verificar convergencia con el residuo verdadero
+        r = b - A @ x
+        converged = bool(np.abs(r).max(initial=0.0) < tol)
+
+        if control.motivo is not None and not converged:
+            x, iter_count, converged = control.detener(x, iter_count, detail)
+            break
+
+        if H[pasos - 1, pasos - 1] == 0.0 and not converged:
+            break
+
+    if detail is not None:
+        detail.set_info("precondicionador", precondicionador)
+        detail.set_info("reinicio (m)", m)
+        detail.set_info("ciclos", ciclos)
+        detail.set_info("residuo final", float(np.abs(r).max(initial=0.0)))
+        detail.set_residual_history(residuos)
+
+    return x, iter_count, converged
+
+
+def bicgstab(A, b, tol=1e-10, max_iter=1000, precondicionador="ninguno", detail=None, cancelacion=None, tiempo_limite=None, progreso=None, historial=None):
+    """
+    Método BiCGSTAB (gradiente biconjugado estabilizado) para sistemas no
+    simétricos Ax = b, precondicionado por la derecha.
+
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia sobre la norma infinito del residuo (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    precondicionador : str, opcional
+        "ninguno", "diagonal" o "ilu0" (default: "ninguno")
+    detail : ResultDetail, opcional
+        Si se proporciona, se registran el precondicionador y la norma del
+        residuo en cada iteración (residual_history)
+    cancelacion : TokenCancelacion, opcional
+        Token para detener la resolución desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) llamada a lo más
+        FRECUENCIA_PROGRESO veces por segundo con las normas infinito del
+        paso y del residuo
+    historial : HistorialIteraciones, opcional
+        Registro donde se guardan los iterados
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    iter_count : int
+        Número de iteraciones realizadas
+    converged : bool
+        True si el método convergió, False en caso contrario
+    """
+    _registrar_memoria(detail, A)
+
+    if not isinstance(A, MatrizCSR):
+        A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    n = len(b)
+
+    aplicar_M = _precondicionador(A, precondicionador)
+    control = _ControlEjecucion(cancelacion, tiempo_limite, progreso, historial=historial)
+
+    # Vector inicial (ceros)
+    x = np.zeros(n)
+    r = b.copy()
+    r_sombra = r.copy()
+    p = np.zeros(n)
+    v = np.zeros(n)
+    rho = alpha = omega = 1.0
+
+    residuos = [float(np.abs(r).max(initial=0.0))]
+    resultado = (x, 0, True) if residuos[0] < tol else None
+    ruptura = False
+
+    for iter_count in range(max_iter if resultado is None else 0):
+        rho_nuevo = r_sombra @ r
+        if rho_nuevo == 0.0:
+            ruptura = True
+            break
+
+        p = r + (rho_nuevo / rho) * (alpha / omega) * (p - omega * v)
+        p_M = aplicar_M(p)
+        v = A @ p_M
+
+        # r_sombra ortogonal a A p: alpha no está definido y el método se
+        # detiene con el último x (finito) en lugar de propagar NaN
+        denominador = r_sombra @ v
+        if denominador == 0.0 or not np.isfinite(denominador):
+            ruptura = True
+            break
+
+        alpha = rho_nuevo / denominador
+        s = r - alpha * v
+
+        if np.abs(s).max(initial=0.0) < tol:
+            x += alpha * p_M
+            residuos.append(float(np.abs(s).max(initial=0.0)))
+            resultado = (x, iter_count + 1, True)
+            break
+
+        s_M = aplicar_M(s)
+        t = A @ s_M
+        tt = t @ t
+        if tt == 0.0 or not np.isfinite(tt):
+            # Sin paso de estabilización: se conserva el medio paso, cuyo
+            # residuo s es finito
+            x += alpha * p_M
+            residuos.append(float(np.abs(s).max(initial=0.0)))
+            ruptura = True
+            break
+
+        omega = (t @ s) / tt
+
+        x += alpha * p_M + omega * s_M
+        r = s - omega * t
+        rho = rho_nuevo
+
+        # Verificar convergencia (norma infinito del residuo)
+        residuos.append(float(np.abs(r).max(initial=0.0)))
+        if residuos[-1] < tol:
+            resultado = (x, iter_count + 1, True)
+            break
+
+        if omega == 0.0 or not np.isfinite(omega):
+            ruptura = True
+            break
+
+        if control.revisar(iter_count, x, paso=lambda: np.abs(alpha * p_M + omega * s_M).max(), residuo=residuos[-1]):
+            resultado = control.detener(x, iter_count + 1, detail)
+            break
+
+    if resultado is None:
+        resultado = (x, len(residuos) - 1 if ruptura else max_iter, False)
+
+    if detail is not None:
+        detail.set_info("precondicionador", precondicionador)
+        detail.set_info("residuo final", residuos[-1])
+        if ruptura:
+            detail.set_info("ruptura", True)
+        detail.set_residual_history(residuos)
+
+    return resultado
+
+
+# Tamaño a partir del cual gauss_jordan usa la variante por bloques
+UMBRAL_GAUSS_JORDAN_BLOQUES = 1000
+TAM_BLOQUE_GAUSS_JORDAN = 64
+
+
+def _pivotear(Ab, i, extra=None):
+    '''
+    Pivoteo parcial in-place: lleva a la fila i el elemento de mayor valor
+    absoluto de la columna i (filas i..n). Si se da `extra`, sus filas se
+    intercambian igual que las de Ab. Devuelve el pivote.
+    '''
+    p = i + int(np.argmax(np.abs(Ab[i:, i])))
+    if p != i:
+        Ab[[i, p]] = Ab[[p, i]]
+        if extra is not None:
+            extra[[i, p]] = extra[[p, i]]
+
+    pivote = Ab[i, i]
+    if abs(pivote) < TOL_PIVOTE:
+        raise ValueError("La matriz es singular o casi singular. No se puede resolver el sistema.")
+
+    return pivote
+
+
+def _gauss_jordan_columnas(Ab, n):
+    '''
+    Eliminación de Gauss-Jordan in-place sobre la matriz aumentada Ab,
+    eliminando cada columna con una sola actualización de rango 1.
+    '''
+    for i in range(n):
+        pivote = _pivotear(Ab, i)
+
+        # Normalizar la fila del pivote; las columnas < i ya son cero en ella
+        fila = Ab[i, i:]
+        fila /= pivote
+
+        # Hacer los demás elementos de la columna igual a 0 (rango 1)
+        factores = Ab[:, i].copy()
+        factores[i] = 0.0
+        Ab[:, i:] -= np.outer(factores, fila)
+
+
+def _gauss_jordan_bloques(Ab, n, tam_bloque):
+    '''
+    Eliminación de Gauss-Jordan in-place por bloques de columnas.
+
+    Cada panel de `tam_bloque` columnas se elimina con actualizaciones de
+    rango 1 restringidas al panel. Las operaciones de fila se acumulan en
+    F (factores) y G (transformación de las filas pivote), y se aplican al
+    resto de la matriz de una sola vez con productos matriz-matriz, de modo
+    que el bloque pendiente se recorre una vez por panel y no una por columna.
+    '''
+    for k in range(0, n, tam_bloque):
+        nb = min(tam_bloque, n - k)
+        fin = k + nb
+
+        F = np.zeros((n, nb))
+        escalas = np.empty(nb)
+
+        # 1) Eliminar las columnas del panel (los intercambios mueven filas
+        #    completas de Ab y de F, así que el resto queda ya permutado)
+        for j in range(nb):
+            c = k + j
+            pivote = _pivotear(Ab, c, extra=F)
+            escalas[j] = 1.0 / pivote
+
+            panel = Ab[:, c:fin]
+            panel[c] *= escalas[j]
+
+            factores = panel[:, 0].copy()
+            factores[c] = 0.0
+            panel -= np.outer(factores, panel[c])
+            F[:, j] = factores
+
+        # 2) Reproducir las operaciones del panel sobre las filas pivote
+        #    (nb x nb): G[j] es la fila pivote j justo al eliminar con ella
+        #    y Q su estado final (F[k + j, j] = 0, así que G[j] se conserva)
+        Q = np.eye(nb)
+        G = np.empty((nb, nb))
+        for j in range(nb):
+            Q[j] *= escalas[j]
+            G[j] = Q[j]
+            Q -= np.outer(F[k:fin, j], G[j])
+
+        # 3) Aplicar todo el panel al bloque restante con productos matriz-matriz
+        resto = Ab[:, fin:]
+        Y = resto[k:fin].copy()
+        resto -= F @ (G @ Y)
+        resto[k:fin] = Q @ Y
+
+
+def gauss_jordan(A, b, tam_bloque=None, detail=None):
+    """
+    Método de Gauss-Jordan para resolver sistemas de ecuaciones lineales Ax = b
+    con pivoteo parcial para mayor estabilidad numérica.
+    
+    Parámetros:
+    -----------
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n). Si es una MatrizCSR se resuelve con
+        FactorizacionLUDispersa (LU en banda tras reordenar con Cuthill-McKee
+        inverso) en lugar de eliminar sobre la matriz densa
+    b : array_like
+        Vector de términos independientes (n) o matriz (n x k) con k
+        lados derechos que se resuelven en la misma eliminación
+    tam_bloque : int, opcional
+        Ancho de los paneles de la variante por bloques. Por defecto se usa
+        la variante por bloques solo si n >= UMBRAL_GAUSS_JORDAN_BLOQUES
+    detail : ResultDetail, opcional
+        Si se proporciona, se registra la memoria ocupada por A (y por los
+        factores en el caso disperso)
+    
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución (n), o matriz solución (n x k) si b tiene k columnas
+    
+    Raises:
+    -------
+    ValueError
+        Si las dimensiones no son compatibles o la matriz es singular
+    """
+    _registrar_memoria(detail, A)
+
+    if isinstance(A, MatrizCSR):
+        factorizacion = FactorizacionLUDispersa(A)
+
+        if detail is not None:
+            detail.set_info("ancho de banda (kl, ku)", (factorizacion.kl, factorizacion.ku))
+            detail.set_info("memoria de los factores (bytes)", factorizacion.nbytes)
+
+        return factorizacion.resolver(b)
+
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    
+    # Validar dimensiones
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+    
+    n = A.shape[0]
+    
+    if b.shape[0] != n:
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+    
+    # Construir la matriz aumentada (se modifica in-place)
+    B = b.reshape(n, -1)
+    Ab = np.empty((n, n + B.shape[1]))
+    Ab[:, :n] = A
+    Ab[:, n:] = B
+
+    # Proceso de eliminación de Gauss-Jordan con pivoteo parcial
+    if tam_bloque is None and n >= UMBRAL_GAUSS_JORDAN_BLOQUES:
+        tam_bloque = TAM_BLOQUE_GAUSS_JORDAN
+
+    if tam_bloque is None:
+        _gauss_jordan_columnas(Ab, n)
+    else:
+        _gauss_jordan_bloques(Ab, n, int(tam_bloque))
+
+    # La solución está en las últimas columnas
+    x = Ab[:, n:].copy()
+
+    return x[:, 0] if b.ndim == 1 else x
+
+
+def factorizar_lu(A, tam_bloque=TAM_BLOQUE_GAUSS_JORDAN):
+    """
+    Factorización LU con pivoteo parcial: A[perm] = L U.
+
+    Se trabaja por paneles de `tam_bloque` columnas: cada panel se factoriza
+    con actualizaciones de rango 1 y el resto de la matriz se actualiza con
+    un solo producto matriz-matriz.
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n)
+    tam_bloque : int, opcional
+        Ancho de los paneles (default: TAM_BLOQUE_GAUSS_JORDAN)
+
+    Retorna:
+    --------
+    LU : ndarray
+        L (triangular inferior, diagonal unitaria implícita) y U empaquetadas
+    perm : ndarray
+        Vector de pivotes: orden de las filas de A
+    
+    Raises:
+    -------
+    ValueError
+        Si A no es cuadrada o es singular
+    """
+    LU = np.array(A, dtype=float)
+
+    if LU.ndim != 2 or LU.shape[0] != LU.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+
+    perm = np.arange(LU.shape[0])
+    _factorizar_lu_paneles(LU, perm, tam_bloque)
+
+    return LU, perm
+
+
+def _factorizar_lu_paneles(LU, perm, tam_bloque):
+    '''
+    Factoriza in-place LU (m x w, con m >= w) por paneles de tam_bloque
+    columnas con pivoteo parcial. Los intercambios mueven filas completas
+    de LU y se registran en perm. Con m > w deja la factorización de un
+    panel alto: L (m x w) y U (w x w) empaquetadas.
+    '''
+    n = LU.shape[1]
+
+    for k in range(0, n, tam_bloque):
+        fin = min(k + tam_bloque, n)
+
+        # Factorizar el panel (los intercambios mueven filas completas)
+        for c in range(k, fin):
+            p = c + int(np.argmax(np.abs(LU[c:, c])))
+            if p != c:
+                LU[[c, p]] = LU[[p, c]]
+                perm[[c, p]] = perm[[p, c]]
+
+            if abs(LU[c, c]) < TOL_PIVOTE:
+                raise ValueError("La matriz es singular o casi singular. No se puede resolver el sistema.")
+
+            LU[c + 1:, c] /= LU[c, c]
+            LU[c + 1:, c + 1:fin] -= np.outer(LU[c + 1:, c], LU[c, c + 1:fin])
+
+        if fin == n:
+            break
+
+        # U12 = L11^-1 A12 y actualización del complemento de Schur
+        L11 = np.tril(LU[k:fin, k:fin], -1) + np.eye(fin - k)
+        LU[k:fin, fin:] = np.linalg.solve(L11, LU[k:fin, fin:])
+        LU[fin:, fin:] -= LU[fin:, k:fin] @ LU[k:fin, fin:]
+
+
+def resolver_lu(LU, perm, b):
+    """
+    Resuelve Ax = b a partir de la factorización de factorizar_lu con dos
+    sustituciones triangulares (O(n^2) por lado derecho).
+
+    Parámetros:
+    -----------
+    LU, perm : ndarray
+        Resultado de factorizar_lu(A)
+    b : array_like
+        Vector de términos independientes (n) o matriz (n x k)
+
+    Retorna:
+    --------
+    x : ndarray
+        Solución con la misma forma que b
+    """
+    b = np.array(b, dtype=float)
+    n = LU.shape[0]
+
+    if b.shape[0] != n:
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+    # Sustitución hacia adelante: L y = b[perm]
+    y = b[perm]
+    for i in range(1, n):
+        y[i] -= LU[i, :i] @ y[:i]
+
+    # Sustitución hacia atrás: U x = y
+    for i in range(n - 1, -1, -1):
+        y[i] -= LU[i, i + 1:] @ y[i + 1:]
+        y[i] /= LU[i, i]
+
+    return y
+
+
+def _es_triangular_inferior(A):
+    '''
+    Indica si A (densa o MatrizCSR) no tiene elementos sobre la diagonal.
+    '''
+    if isinstance(A, MatrizCSR):
+        return not np.any(A.col_idx > A.indices_fila())
+
+    n = A.shape[0]
+    filas_bloque = _filas_por_bloque(n)
+    for inicio in range(0, n, filas_bloque):
+        fin = min(n, inicio + filas_bloque)
+        bloque = np.asarray(A[inicio:fin], dtype=float)
+        if np.any(np.triu(bloque, inicio + 1)):
+            return False
+    return True
+
+
+def sustitucion_triangular(A, b, inferior=None):
+    """
+    Resuelve Ax = b con A triangular por sustitución hacia adelante
+    (inferior) o hacia atrás (superior): O(nnz) operaciones, una fila por
+    paso. Una A densa se lee fila a fila, así que puede estar en disco.
+
+    Parámetros:
+    -----------
+    A : array_like, np.memmap o MatrizCSR
+        Matriz triangular (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    inferior : bool, opcional
+        Si A es triangular inferior; None la detecta (default: None)
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+
+    Raises:
+    -------
+    ValueError
+        Si las dimensiones no son compatibles o la diagonal tiene ceros
+    """
+    if len(b) != A.shape[0]:
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+    if inferior is None:
+        inferior = _es_triangular_inferior(A)
+
+    if isinstance(A, MatrizCSR):
+        return TriangularDispersa(A, inferior).resolver(b)
+
+    x = np.array(b, dtype=float)
+    n = len(x)
+    for i in (range(n) if inferior else range(n - 1, -1, -1)):
+        fila = np.asarray(A[i], dtype=float)
+        if fila[i] == 0.0:
+            raise ValueError("La matriz triangular tiene ceros en la diagonal")
+        if inferior:
+            x[i] = (x[i] - fila[:i] @ x[:i]) / fila[i]
+        else:
+            x[i] = (x[i] - fila[i + 1:] @ x[i + 1:]) / fila[i]
+
+    return x
+
+
+def _jacobi_multiple(A, B, tol, max_iter):
+    '''
+    Jacobi sobre las k columnas de B a la vez. Solo se iteran las columnas
+    activas: al converger una columna se retira del bloque de trabajo.
+    '''
+    D, R = _separar_diagonal(A)
+    n, k = B.shape
+
+    X = np.zeros((n, k))
+    iteraciones = np.full(k, max_iter)
+    convergidos = np.zeros(k, dtype=bool)
+
+    activas = np.arange(k)
+    Xa = np.zeros((n, k))
+    Ba = B.copy()
+
+    for iter_count in range(max_iter):
+        X_new = (Ba - R @ Xa) / D[:, None]
+        pasos = np.abs(X_new - Xa).max(axis=0, initial=0.0)
+        Xa = X_new
+
+        listas = pasos < tol
+        if listas.any():
+            X[:, activas[listas]] = Xa[:, listas]
+            iteraciones[activas[listas]] = iter_count + 1
+            convergidos[activas[listas]] = True
+
+            activas, Xa, Ba = activas[~listas], Xa[:, ~listas], Ba[:, ~listas]
+            if len(activas) == 0:
+                break
+
+    X[:, activas] = Xa
+    return X, iteraciones, convergidos
+
+
+def _sor_multiple(A, B, omega, tol, max_iter):
+    '''
+    SOR (Gauss-Seidel si omega=1) sobre las k columnas de B a la vez: cada
+    actualización de fila es un producto fila-matriz sobre las columnas
+    activas. Al converger una columna se retira del bloque de trabajo.
+    '''
+    D, R = _separar_diagonal(A)
+    filas = list(R)
+    n, k = B.shape
+
+    X = np.zeros((n, k))
+    iteraciones = np.full(k, max_iter)
+    convergidos = np.zeros(k, dtype=bool)
+
+    activas = np.arange(k)
+    Xa = np.zeros((n, k))
+    Ba_d = omega * B / D[:, None]
+    w_d = omega / D
+
+    for iter_count in range(max_iter):
+        pasos = np.zeros(len(activas))
+
+        for i in range(n):
+            x_i = (1.0 - omega) * Xa[i] + Ba_d[i] - w_d[i] * (filas[i] @ Xa)
+            # np.fmax ignora NaN, por eso se usa np.maximum
+            pasos = np.maximum(pasos, np.abs(x_i - Xa[i]))
+            Xa[i] = x_i
+
+        listas = pasos < tol
+        if listas.any():
+            X[:, activas[listas]] = Xa[:, listas]
+            iteraciones[activas[listas]] = iter_count + 1
+            convergidos[activas[listas]] = True
+
+            activas, Xa, Ba_d = activas[~listas], Xa[:, ~listas], Ba_d[:, ~listas]
+            if len(activas) == 0:
+                break
+
+    X[:, activas] = Xa
+    return X, iteraciones, convergidos
+
+
+def solve_many(A, B, metodo="Gauss-Jordan", tol=1e-10, max_iter=1000, omega=1.0):
+    """
+    Resuelve k sistemas A x_j = B[:, j] con la misma matriz A en una sola pasada.
+
+    Los métodos directos hacen una única factorización para todas las
+    columnas. Los iterativos avanzan todas las columnas juntas como una
+    matriz, y cada columna deja de costar trabajo en cuanto converge.
+
+    Parámetros:
+    -----------
+    A : array_like
+        Matriz de coeficientes (n x n)
+    B : array_like
+        Matriz de términos independientes (n x k), o vector (n)
+    metodo : str, opcional
+        "Jacobi", "Gauss-Seidel", "SOR", "Gauss-Jordan", "LU",
+        "Gradiente conjugado", "GMRES" o "BiCGSTAB" (default: "Gauss-Jordan").
+        Los métodos de Krylov resuelven las columnas una por una
+    tol : float, opcional
+        Tolerancia para los métodos iterativos (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones de los métodos iterativos (default: 1000)
+    omega : float o None, opcional
+        Factor de relajación para "SOR"; None lo estima automáticamente
+
+    Retorna:
+    --------
+    resultados : list[ResultHandler]
+        Un ResultHandler con la solución de cada columna de B
+    detail : ResultDetail
+        Detalle agregado; info incluye las iteraciones y la convergencia
+        de cada sistema
+
+    Raises:
+    -------
+    ValueError
+        Si las dimensiones no son compatibles o el método no existe
+    """
+    # controllers.caches importa este módulo: se importa al usarlo
+    from controllers.caches import lu_cacheado
+
+    A = np.array(A, dtype=float)
+    B = np.array(B, dtype=float)
+
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+
+    if B.shape[0] != A.shape[0]:
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+    B = B.reshape(A.shape[0], -1)
+    k = B.shape[1]
+
+    detail = ResultDetail(metodo=metodo)
+    inicio = time.perf_counter()
+
+    if metodo == "Jacobi":
+        X, iteraciones, convergidos = _jacobi_multiple(A, B, tol, max_iter)
+
+    elif metodo in ("Gauss-Seidel", "SOR"):
+        if metodo == "Gauss-Seidel":
+            omega = 1.0
+        elif omega is None:
+            omega = estimar_omega_optimo(A)
+
+        if not 0.0 < omega < 2.0:
+            raise ValueError("El factor de relajación omega debe estar en el intervalo (0, 2)")
+
+        X, iteraciones, convergidos = _sor_multiple(A, B, omega, tol, max_iter)
+
+    elif metodo == "Gauss-Jordan":
+        X = gauss_jordan(A, B)
+        iteraciones = np.ones(k, dtype=int)
+        convergidos = np.ones(k, dtype=bool)
+
+    elif metodo == "LU":
+        X = lu_cacheado(A, B, detail=detail)
+        iteraciones = np.ones(k, dtype=int)
+        convergidos = np.ones(k, dtype=bool)
+
+    elif metodo in ("Gradiente conjugado", "GMRES", "BiCGSTAB"):
+        krylov = {"Gradiente conjugado": gradiente_conjugado, "GMRES": gmres, "BiCGSTAB": bicgstab}[metodo]
+
+        X = np.zeros_like(B)
+        iteraciones = np.zeros(k, dtype=int)
+        convergidos = np.zeros(k, dtype=bool)
+        for j in range(k):
+            X[:, j], iteraciones[j], convergidos[j] = krylov(A, B[:, j], tol=tol, max_iter=max_iter)
+
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    detail.execution_time = time.perf_counter() - inicio
+    detail.total_iterations = int(iteraciones.max(initial=0))
+    detail.converged = bool(convergidos.all())
+    detail.set_info("sistemas", k)
+    detail.set_info("sistemas convergidos", int(convergidos.sum()))
+    detail.set_info("iteraciones por sistema", iteraciones.tolist())
+    detail.set_info("convergencia por sistema", convergidos.tolist())
+
+    resultados = []
+    for j in range(k):
+        handler = ResultHandler()
+        handler.set_results(X[:, j].copy())
+        resultados.append(handler)
+
+    return resultados, detail
+
+
+def _gauss_jordan_lote(Ab, n):
+    '''
+    Gauss-Jordan con pivoteo parcial sobre una pila de matrices aumentadas
+    Ab (m x n x n+1), in-place. Cada columna se elimina en todos los sistemas
+    a la vez. Devuelve una máscara con los sistemas no singulares.
+    '''
+    m = Ab.shape[0]
+    sistemas = np.arange(m)
+    validos = np.ones(m, dtype=bool)
+
+    for i in range(n):
+        # Pivoteo parcial por sistema
+        p = i + np.argmax(np.abs(Ab[:, i:, i]), axis=1)
+        fila_i = Ab[sistemas, i].copy()
+        Ab[sistemas, i] = Ab[sistemas, p]
+        Ab[sistemas, p] = fila_i
+
+        # Los sistemas singulares se marcan y se neutralizan con pivote 1
+        pivotes = Ab[:, i, i].copy()
+        singulares = np.abs(pivotes) < TOL_PIVOTE
+        if singulares.any():
+            validos &= ~singulares
+            pivotes[singulares] = 1.0
+
+        Ab[:, i, i:] /= pivotes[:, None]
+
+        factores = Ab[:, :, i].copy()
+        factores[:, i] = 0.0
+        Ab[:, :, i:] -= factores[:, :, None] * Ab[:, i, None, i:]
+
+    return validos
+
+
+def resolver_lote(A, b, metodo="Gauss-Jordan", tol=1e-10, max_iter=1000):
+    """
+    Resuelve m sistemas independientes A[s] x[s] = b[s] con operaciones
+    vectorizadas sobre toda la pila, pensado para muchos sistemas pequeños
+    (por ejemplo 3x3 o 4x4) donde el costo por llamada domina.
+
+    Parámetros:
+    -----------
+    A : array_like
+        Pila de matrices de coeficientes (m x n x n)
+    b : array_like
+        Pila de vectores de términos independientes (m x n)
+    metodo : str, opcional
+        "Jacobi", "Gauss-Seidel" o "Gauss-Jordan" (default: "Gauss-Jordan")
+    tol : float, opcional
+        Tolerancia para los métodos iterativos (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones de los métodos iterativos (default: 1000)
+
+    Retorna:
+    --------
+    x : ndarray
+        Soluciones (m x n). Los sistemas singulares quedan en NaN con
+        Gauss-Jordan
+    iteraciones : ndarray
+        Iteraciones realizadas por cada sistema (m)
+    convergidos : ndarray
+        True para cada sistema que convergió (m)
+
+    Raises:
+    -------
+    ValueError
+        Si las dimensiones no son compatibles o el método no existe
+    """
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("A debe ser una pila de matrices cuadradas (m x n x n)")
+
+    m, n, _ = A.shape
+
+    if b.shape != (m, n):
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+    if metodo == "Gauss-Jordan":
+        Ab = np.empty((m, n, n + 1))
+        Ab[:, :, :n] = A
+        Ab[:, :, n] = b
+
+        validos = _gauss_jordan_lote(Ab, n)
+        x = Ab[:, :, n].copy()
+        x[~validos] = np.nan
+
+        return x, np.ones(m, dtype=int), validos
+
+    if metodo not in ("Jacobi", "Gauss-Seidel"):
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    # Separar A = D + R en toda la pila
+    D = np.diagonal(A, axis1=1, axis2=2).copy()
+    R = A
+    R[:, np.arange(n), np.arange(n)] = 0.0
+
+    x = np.zeros((m, n))
+    iteraciones = np.full(m, max_iter)
+    convergidos = np.zeros(m, dtype=bool)
+
+    # Bloque de trabajo: los sistemas aún activos. Se compacta solo cuando
+    # la mitad ya convergió, para no copiar la pila en cada iteración.
+    activos = np.arange(m)
+    Ra, Da, ba = R, D, b
+    xa = np.zeros((m, n))
+    hechos = np.zeros(m, dtype=bool)
+
+    for iter_count in range(max_iter):
+        if metodo == "Jacobi":
+            x_new = (ba - np.einsum("sij,sj->si", Ra, xa)) / Da
+            pasos = np.abs(x_new - xa).max(axis=1, initial=0.0)
+            xa = x_new
+        else:
+            pasos = np.zeros(len(activos))
+            for i in range(n):
+                x_i = (ba[:, i] - np.einsum("sj,sj->s", Ra[:, i], xa)) / Da[:, i]
+                pasos = np.maximum(pasos, np.abs(x_i - xa[:, i]))
+                xa[:, i] = x_i
+
+        nuevos = (pasos < tol) & ~hechos
+        if nuevos.any():
+            x[activos[nuevos]] = xa[nuevos]
+            iteraciones[activos[nuevos]] = iter_count + 1
+            convergidos[activos[nuevos]] = True
+            hechos |= nuevos
+
+            if hechos.all():
+                break
+
+            if 2 * hechos.sum() >= len(hechos):
+                quedan = ~hechos
+                activos, Ra, Da, ba, xa = activos[quedan], Ra[quedan], Da[quedan], ba[quedan], xa[quedan]
+                hechos = np.zeros(len(activos), dtype=bool)
+
+    pendientes = ~hechos
+    x[activos[pendientes]] = xa[pendientes]
+
+    return x, iteraciones, convergidos
+
+
+# Métodos que aceptan un vector inicial x0
+METODOS_ARRANQUE_EN_CALIENTE = ("Jacobi", "Gauss-Seidel", "SOR", "Gauss-Seidel multicolor")
+
+# Reducción del residuo a partir de la cual una resolución mide su propia
+# tasa de convergencia con suficiente precisión
+REDUCCION_MINIMA_TASA = 10.0
+
+
+def tasa_convergencia(residuo_inicial, residuo_final, iteraciones):
+    '''
+    Factor medio q en que bajó el residuo por iteración,
+    q = (residuo_final / residuo_inicial)^(1 / iteraciones), o None si no
+    bajó. Un residuo final exacto se acota por la precisión de máquina.
+    '''
+    if iteraciones <= 0 or residuo_inicial <= 0.0:
+        return None
+
+    residuo_final = max(residuo_final, np.finfo(float).eps * residuo_inicial)
+    if residuo_final >= residuo_inicial:
+        return None
+
+    return float((residuo_final / residuo_inicial) ** (1.0 / iteraciones))
+
+
+def estimar_iteraciones_ahorradas(residuo_frio, residuo_inicial, residuo_final, iteraciones, tasa=None):
+    '''
+    Estima cuántas iteraciones ahorró un arranque en caliente: desde cero
+    (residuo ||b||) el método habría necesitado log(residuo_frio /
+    residuo_final) / log(1 / q) iteraciones para llegar al mismo residuo.
+
+    q es la tasa de la resolución que produjo x0 si se conoce (mismo método
+    sobre un sistema casi igual, partiendo de cero). Si no, se usa la de
+    esta resolución, que tiende a subestimar el ahorro: tras un cambio
+    pequeño el error inicial se concentra en componentes que se amortiguan
+    rápido. Es negativo si x0 era peor que cero, y None si no se puede
+    estimar (sin tasa conocida y con x0 tan bueno que esta resolución casi
+    no redujo el residuo).
+    '''
+    if tasa is None and residuo_final * REDUCCION_MINIMA_TASA <= residuo_inicial:
+        tasa = tasa_convergencia(residuo_inicial, residuo_final, iteraciones)
+    if tasa is None or residuo_frio <= 0.0:
+        return None
+
+    residuo_final = max(residuo_final, np.finfo(float).eps * residuo_frio)
+    return int(round(np.log(residuo_frio / residuo_final) / np.log(1.0 / tasa))) - iteraciones
+
+
+# Métodos disponibles en el selector de la página del solver
+METODOS = (
+    "Jacobi",
+    "Gauss-Seidel",
+    "Gauss-Jordan",
+    "SOR",
+    "Gauss-Seidel multicolor",
+    "LU",
+    "Gradiente conjugado",
+    "GMRES",
+    "BiCGSTAB",
+    "Auto",
+    "Carrera de métodos",
+)
+
+# Seudométodo que corre varios métodos en paralelo (ver resolver_en_carrera)
+METODO_CARRERA = "Carrera de métodos"
+
+# Seudométodo que elige el método según la estructura de A (ver resolver_automatico)
+METODO_AUTO = "Auto"
+
+# Método interno de "Auto" para A triangular (ver sustitucion_triangular)
+MOTOR_TRIANGULAR = "Sustitución triangular"
+
+
+def precondicionador_por_defecto(A, incompleto):
+    '''
+    Precondicionador que usa la aplicación para los métodos de Krylov: la
+    factorización incompleta `incompleto` ("ic0" o "ilu0") solo si A ya es
+    una MatrizCSR. Sobre una A densa, cholesky_incompleto y lu_incompleto
+    recorren en Python todas sus entradas (O(n^3), minutos con n = 2000),
+    mientras que "diagonal" cuesta O(n).
+    '''
+    return incompleto if isinstance(A, MatrizCSR) else "diagonal"
+
+
+def resolver_con_metodo(metodo, A, b, tol=1e-10, max_iter=1000, detail=None, cancelacion=None, tiempo_limite=None, progreso=None,
+                        registrar_historial=False, x0=None, arranque_en_caliente=False, incremental=False, precondicionador=None):
+    """
+    Resuelve Ax = b con el método indicado por su nombre (ver METODOS),
+    con la configuración que usa la aplicación para cada uno. Si A es un
+    np.memmap, Jacobi y LU se resuelven fuera de memoria (ver
+    controllers/fuera_de_memoria.py).
+
+    Parámetros:
+    -----------
+    metodo : str
+        Nombre del método, tal como aparece en el selector
+    A : array_like o MatrizCSR
+        Matriz de coeficientes (n x n)
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia para los métodos iterativos (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+    detail : ResultDetail, opcional
+        Detalle a completar; si no se da se crea uno nuevo
+    cancelacion : TokenCancelacion, opcional
+        Token para detener los métodos iterativos desde otro hilo
+    tiempo_limite : float, opcional
+        Tiempo máximo de ejecución en segundos de los métodos iterativos
+    progreso : callable, opcional
+        Función progreso(iteracion, paso, residuo) que reciben los métodos
+        iterativos
+    registrar_historial : bool, opcional
+        Si es True se registran los iterados en un HistorialIteraciones
+        (ver HistorialIteraciones.para_sistema) que queda en
+        detail.iteration_history
+    x0 : array_like, opcional
+        Vector inicial de los métodos de METODOS_ARRANQUE_EN_CALIENTE; los
+        demás lo ignoran
+    arranque_en_caliente : bool, opcional
+        Si es True y no se da x0, los métodos de
+        METODOS_ARRANQUE_EN_CALIENTE arrancan desde la solución reciente
+        más cercana (ver SolucionesRecientes), y las soluciones que
+        convergen se guardan en soluciones_recientes. El origen, el residuo
+        inicial y las iteraciones ahorradas quedan en detail (warm_start,
+        warm_start_residual, iterations_saved)
+    incremental : bool, opcional
+        Si es True, Gauss-Jordan y LU sobre una A densa usan
+        resolucion_incremental: si A difiere en pocas entradas de la última
+        factorizada, la solución se actualiza en O(k n^2) en lugar de
+        refactorizar. Ambos son la misma eliminación con pivoteo parcial;
+        la ruta elegida queda en detail.info["ruta de resolución"]
+    precondicionador : str, opcional
+        Precondicionador de Gradiente conjugado, GMRES y BiCGSTAB; None usa
+        el de la aplicación (ver precondicionador_por_defecto)
+
+    Con METODO_CARRERA se resuelve con resolver_en_carrera; progreso no se
+    usa porque los métodos corren en otros procesos. Con METODO_AUTO el
+    método se elige con resolver_automatico, que además puede pedir
+    MOTOR_TRIANGULAR.
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    detail : ResultDetail
+        Método, tiempo de ejecución, iteraciones y convergencia
+
+    Raises:
+    -------
+    ValueError
+        Si el método no existe o el sistema no se puede resolver
+    """
+    # Los subsistemas se importan aquí y no al inicio del módulo porque a
+    # su vez importan los métodos de este módulo
+    from controllers.caches import lu_cacheado, soluciones_recientes
+    from controllers.carrera import resolver_en_carrera
+    from controllers.fuera_de_memoria import jacobi_fuera_de_memoria, lu_fuera_de_memoria
+    from controllers.resolucion_incremental import resolucion_incremental
+    from controllers.seleccion_automatica import resolver_automatico
+
+    if metodo == METODO_CARRERA:
+        return resolver_en_carrera(A, b, tol=tol, max_iter=max_iter, detail=detail, cancelacion=cancelacion,
+                                   tiempo_limite=tiempo_limite, registrar_historial=registrar_historial)
+
+    if metodo == METODO_AUTO:
+        return resolver_automatico(A, b, tol=tol, max_iter=max_iter, detail=detail, cancelacion=cancelacion, tiempo_limite=tiempo_limite,
+                                   progreso=progreso, registrar_historial=registrar_historial, x0=x0,
+                                   arranque_en_caliente=arranque_en_caliente, incremental=incremental)
+
+    detail = ResultDetail() if detail is None else detail
+    detail.metodo = metodo
+
+    historial = HistorialIteraciones.para_sistema(len(b), max_iter) if registrar_historial else None
+    control = {"cancelacion": cancelacion, "tiempo_limite": tiempo_limite, "progreso": progreso, "historial": historial}
+    inicio = time.time()
+
+    # Una A mapeada desde disco puede no caber en RAM: Jacobi y LU la
+    # recorren por teselas en lugar de copiarla
+    fuera_de_memoria = isinstance(A, np.memmap)
+
+    # Arranque en caliente: el x0 dado o la solución reciente más cercana.
+    # Los residuos se miden para estimar las iteraciones ahorradas
+    origen = ""
+    tasa_origen = None
+    if metodo not in METODOS_ARRANQUE_EN_CALIENTE or fuera_de_memoria:
+        x0 = None
+    elif x0 is not None:
+        origen = "x0"
+    elif arranque_en_caliente:
+        reciente = soluciones_recientes.elegir(A, b)
+        if reciente is not None:
+            x0, _, metodo_origen, tasa_origen = reciente
+            origen = "solución reciente"
+            # La tasa solo describe al método que la midió
+            tasa_origen = tasa_origen if metodo_origen == metodo else None
+
+    medir = x0 is not None or (arranque_en_caliente and not fuera_de_memoria)
+    if medir:
+        A_residuo = A if isinstance(A, MatrizCSR) else np.asarray(A, dtype=float)
+        b_residuo = np.asarray(b, dtype=float)
+        residuo_frio = float(np.abs(b_residuo).max(initial=0.0))
+        residuo_inicial = residuo_frio if x0 is None else _residuo_inf(A_residuo, b_residuo, _vector_inicial(x0, len(b_residuo)))
+
+    if metodo == "Gauss-Seidel":
+        x, detail.total_iterations, detail.converged = gauss_seidel(A, b, tol=tol, max_iter=max_iter, detail=detail, x0=x0, **control)
+
+    elif metodo == "Jacobi" and fuera_de_memoria:
+        x, detail.total_iterations, detail.converged = jacobi_fuera_de_memoria(A, b, tol=tol, max_iter=max_iter, detail=detail, **control)
+
+    elif metodo == "Jacobi":
+        x, detail.total_iterations, detail.converged = jacobi(A, b, tol=tol, max_iter=max_iter, detail=detail, x0=x0, **control)
+
+    elif metodo == "SOR":
+        # omega=None: el factor de relajación se estima automáticamente
+        x, detail.total_iterations, detail.converged = sor(A, b, omega=None, tol=tol, max_iter=max_iter, detail=detail, x0=x0, **control)
+
+    elif metodo == "Gauss-Seidel multicolor" and isinstance(A, MatrizCSR):
+        # El coloreo y los bloques por color son densos: una A dispersa se
+        # barre fila por fila en O(nnz), con la misma convergencia
+        detail.set_info("motor", "Gauss-Seidel disperso (el multicolor requiere A densa)")
+        x, detail.total_iterations, detail.converged = gauss_seidel(A, b, tol=tol, max_iter=max_iter, detail=detail, x0=x0, **control)
+
+    elif metodo == "Gauss-Seidel multicolor":
+        x, detail.total_iterations, detail.converged = gauss_seidel_multicolor(A, b, tol=tol, max_iter=max_iter, hilos=os.cpu_count() or 1, detail=detail,
+                                                                              x0=x0, **control)
+
+    elif metodo == "Gradiente conjugado":
+        x, detail.total_iterations, detail.converged = gradiente_conjugado(A, b, tol=tol, max_iter=max_iter, precondicionador=precondicionador or precondicionador_por_defecto(A, "ic0"),
+                                                                           detail=detail, **control)
+
+    elif metodo == "GMRES":
+        x, detail.total_iterations, detail.converged = gmres(A, b, tol=tol, max_iter=max_iter, reinicio=30, precondicionador=precondicionador or precondicionador_por_defecto(A, "ilu0"),
+                                                             detail=detail, **control)
+
+    elif metodo == "BiCGSTAB":
+        x, detail.total_iterations, detail.converged = bicgstab(A, b, tol=tol, max_iter=max_iter, precondicionador=precondicionador or precondicionador_por_defecto(A, "ilu0"),
+                                                                detail=detail, **control)
+
+    elif metodo == MOTOR_TRIANGULAR:
+        x = sustitucion_triangular(A, b)
+        detail.total_iterations = 1
+        detail.converged = True
+
+    elif metodo in ("Gauss-Jordan", "LU") and incremental and not fuera_de_memoria and not isinstance(A, MatrizCSR):
+        # Tras editar pocas celdas se actualiza la solución anterior
+        x = resolucion_incremental.resolver(A, b, detail=detail)
+        detail.total_iterations = 1
+        detail.converged = True
+
+    elif metodo == "Gauss-Jordan":
+        x = gauss_jordan(A, b, detail=detail)
+        detail.total_iterations = 1
+        detail.converged = True
+
+    elif metodo == "LU" and fuera_de_memoria:
+        x, detail.total_iterations, detail.converged = lu_fuera_de_memoria(A, b, detail=detail, cancelacion=cancelacion, tiempo_limite=tiempo_limite)
+
+    elif metodo == "LU" and isinstance(A, MatrizCSR):
+        # LU con pivoteo parcial en banda tras reordenar (FactorizacionLUDispersa),
+        # sin formar la matriz densa
+        x = gauss_jordan(A, b, detail=detail)
+        detail.total_iterations = 1
+        detail.converged = True
+
+    elif metodo == "LU":
+        # La factorización de A se reutiliza si ya se resolvió antes
+        x = lu_cacheado(A, b, detail=detail)
+        detail.total_iterations = 1
+        detail.converged = True
+
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    detail.execution_time = time.time() - inicio
+
+    if medir:
+        residuo_final = _residuo_inf(A_residuo, b_residuo, x)
+        tasa = tasa_convergencia(residuo_inicial, residuo_final, detail.total_iterations)
+
+    if x0 is not None:
+        detail.set_warm_start(origen, residuo_inicial / residuo_frio if residuo_frio > 0.0 else None,
+                              estimar_iteraciones_ahorradas(residuo_frio, residuo_inicial, residuo_final, detail.total_iterations, tasa_origen))
+        # La tasa de un arranque en caliente subestima la de uno en frío
+        tasa = tasa_origen
+
+    if arranque_en_caliente and detail.converged and not fuera_de_memoria:
+        soluciones_recientes.agregar(x, metodo, tasa if metodo in METODOS_ARRANQUE_EN_CALIENTE else None)
+
+    if historial is not None:
+        historial.cerrar(detail.total_iterations, x)
+        detail.set_iteration_history(historial)
+
+    return x, detail
+
+
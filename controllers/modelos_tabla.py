@@ -0,0 +1,195 @@
+import numpy as np
+from PyQt5.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex, Qt
+
+from controllers.metodos import HistorialIteraciones
+
+
+class ModeloSoluciones(QAbstractListModel):
+    '''
+    Modelo de solo lectura sobre el vector solución: una fila "Xi = valor"
+    por incógnita, formateada en data() solo cuando la vista la muestra.
+    Lee directamente del ndarray, sin copiarlo ni crear un item por fila.
+    '''
+    def __init__(self, soluciones=None, parent=None):
+        super().__init__(parent)
+        self.soluciones = np.empty(0) if soluciones is None else np.asarray(soluciones)
+
+    def set_soluciones(self, soluciones):
+        '''
+        Cambia el vector mostrado y avisa a las vistas.
+        '''
+        self.beginResetModel()
+        self.soluciones = np.empty(0) if soluciones is None else np.asarray(soluciones)
+        self.endResetModel()
+
+    def get_soluciones(self):
+        return self.soluciones
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.soluciones)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        return f"X{index.row() + 1} = {self.soluciones[index.row()]}"
+
+
+class ModeloHistorial(QAbstractTableModel):
+    '''
+    Modelo de solo lectura sobre un HistorialIteraciones: una fila por
+    iterado registrado y una columna por incógnita. Las celdas se formatean
+    en data() solo cuando la vista las pide, así que la tabla no crea un
+    item por valor aunque el historial tenga miles de filas.
+    '''
+    def __init__(self, historial: HistorialIteraciones = None, parent=None):
+        super().__init__(parent)
+        self.historial = historial
+
+    def set_historial(self, historial: HistorialIteraciones):
+        '''
+        Cambia el historial mostrado y avisa a las vistas.
+        '''
+        self.beginResetModel()
+        self.historial = historial
+        self.endResetModel()
+
+    def get_historial(self) -> HistorialIteraciones:
+        return self.historial
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.historial is None:
+            return 0
+        return len(self.historial)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.historial is None:
+            return 0
+        return self.historial.n
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.TextAlignmentRole):
+            return None
+
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        return f"{self.historial.iterado(index.row())[index.column()]:.6g}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or self.historial is None:
+            return None
+
+        if orientation == Qt.Horizontal:
+            return f"x{section + 1}"
+
+        # Encabezado de fila: número de iteración (puede saltar de k en k)
+        return str(self.historial.iteracion(section))
+
+
+class ModeloMatriz(QAbstractTableModel):
+    '''
+    Modelo editable sobre la matriz aumentada [A | b], guardada en un
+    ndarray float64 de n x (n + 1). La vista solo pide texto (y crea
+    editores) para las celdas visibles, y editar una celda convierte
+    únicamente ese texto. Las celdas en cero se muestran vacías, igual que
+    los campos sin llenar de antes.
+    '''
+    def __init__(self, n=4, parent=None):
+        super().__init__(parent)
+        self.valores = np.zeros((n, n + 1))
+
+    def get_valores(self):
+        return self.valores
+
+    def set_valores(self, valores):
+        '''
+        Reemplaza la matriz aumentada completa (n x (n + 1)).
+
+        Raises:
+            ValueError: si la forma no corresponde a un sistema n x n.
+        '''
+        valores = np.asarray(valores, dtype=float)
+        if valores.ndim != 2 or valores.shape[1] != valores.shape[0] + 1:
+            raise ValueError("La matriz aumentada debe tener n filas y n + 1 columnas.")
+
+        self.beginResetModel()
+        self.valores = valores
+        self.endResetModel()
+
+    def redimensionar(self, n):
+        '''
+        Cambia el sistema a n x n conservando los coeficientes y términos
+        independientes que siguen dentro del nuevo tamaño.
+        '''
+        valores = np.zeros((n, n + 1))
+        m = min(n, self.valores.shape[0])
+        valores[:m, :m] = self.valores[:m, :m]
+        valores[:m, -1] = self.valores[:m, -1]
+
+        self.beginResetModel()
+        self.valores = valores
+        self.endResetModel()
+
+    def limpiar(self):
+        self.valores.fill(0.0)
+        if self.valores.size > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.valores.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.valores.shape[1]
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        valor = self.valores[index.row(), index.column()]
+        if valor == 0.0:
+            return ""
+        return f"{valor:.6g}" if role == Qt.DisplayRole else repr(float(valor))
+
+    def setData(self, index, value, role=Qt.EditRole):
+        '''
+        Convierte el texto de una sola celda. Un texto vacío es cero y uno
+        inválido se rechaza, dejando el valor anterior.
+        '''
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        texto = str(value).strip()
+        try:
+            valor = float(texto) if texto else 0.0
+        except ValueError:
+            return False
+
+        self.valores[index.row(), index.column()] = valor
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+
+        if orientation == Qt.Vertical:
+            return str(section + 1)
+
+        # La última columna es la de términos independientes
+        return "b" if section == self.valores.shape[0] else f"x{section + 1}"
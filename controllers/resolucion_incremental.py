@@ -0,0 +1,207 @@
+import time
+from collections import deque
+
+import numpy as np
+
+from controllers.caches import cache_lu
+from controllers.metodos import _residuo_inf, resolver_lu
+
+# Rango máximo (como fracción de n) de un cambio de A que se resuelve con
+# Sherman-Morrison-Woodbury: cuesta k pares de sustituciones O(n^2) frente a
+# los O(n^3) de refactorizar, así que más allá deja de convenir
+FRACCION_RANGO_SMW = 0.125
+
+# Número de condición máximo de la matriz de capacitancia I + V^T A0^-1 U;
+# por encima la actualización pierde demasiados dígitos
+COND_MAXIMA_SMW = 1e10
+
+# Error hacia atrás máximo ||b - Ax|| / (||A|| ||x|| + ||b||) de una solución
+# actualizada; si lo supera se refactoriza
+ERROR_MAXIMO_SMW = 1e-10
+
+# Memoria máxima (A base y su factorización) que guarda ResolucionIncremental
+MAX_BYTES_INCREMENTAL = 256 * 1024 * 1024
+
+
+def _cubrir_cambios(filas, columnas):
+    '''
+    Elige filas R y columnas C que cubren todas las entradas cambiadas
+    (filas, columnas son sus coordenadas, como las da np.nonzero) con
+    |R| + |C| pequeño: las filas con más cambios entran a R y el resto de
+    las entradas se cubre por columnas. Prueba todos los cortes de las
+    filas ordenadas por número de cambios, en O(k log k) para k entradas
+    cambiadas. |R| + |C| acota el rango del cambio.
+    '''
+    if len(filas) == 0:
+        return filas, columnas
+
+    distintas, inverso, por_fila = np.unique(filas, return_inverse=True, return_counts=True)
+    orden = np.argsort(-por_fila, kind="stable")
+
+    # Columnas cambiadas de cada fila distinta, agrupadas en orden de fila
+    agrupadas = np.argsort(inverso, kind="stable")
+    limites = np.concatenate([[0], np.cumsum(por_fila)])
+
+    # columnas_restantes[r]: columnas distintas en las filas orden[r:]
+    columnas_restantes = np.zeros(len(orden) + 1, dtype=np.int64)
+    vistas = set()
+    for r in range(len(orden) - 1, -1, -1):
+        fila = orden[r]
+        vistas.update(columnas[agrupadas[limites[fila]:limites[fila + 1]]].tolist())
+        columnas_restantes[r] = len(vistas)
+
+    costo = np.arange(len(orden) + 1) + columnas_restantes
+    corte = int(np.argmin(costo))
+
+    en_R = np.zeros(len(distintas), dtype=bool)
+    en_R[orden[:corte]] = True
+    return distintas[en_R], np.unique(columnas[~en_R[inverso]])
+
+
+class ResolucionIncremental:
+    '''
+    Resuelve sistemas densos sucesivos cuya A cambia en pocas entradas
+    (el usuario edita algunas celdas de la tabla) sin refactorizar cada vez.
+
+    Guarda una A base A0 con su factorización LU. Para una A nueva detecta
+    las entradas distintas de A0 y las cubre con pocas filas y columnas
+    (ver _cubrir_cambios): el cambio ΔA = A - A0 se escribe como U V^T con
+    k = filas + columnas. Con
+    Sherman-Morrison-Woodbury
+
+        x = y - Z (I + V^T Z)^-1 V^T y,   y = A0^-1 b,   Z = A0^-1 U
+
+    la solución cuesta O(k n^2) usando la factorización de A0. Se
+    refactoriza (y A pasa a ser la base) si k supera FRACCION_RANGO_SMW * n,
+    si la matriz de capacitancia está mal condicionada o si el error hacia
+    atrás de la solución actualizada es mayor que ERROR_MAXIMO_SMW.
+
+    Cada resolución deja su ruta en detail.info y en registro (las últimas
+    100), para ver cuántas se resolvieron de forma incremental.
+    '''
+    def __init__(self, fraccion_rango=FRACCION_RANGO_SMW, max_bytes=MAX_BYTES_INCREMENTAL, cache=None):
+        '''
+        Parámetros:
+        - fraccion_rango (float): Rango máximo del cambio, como fracción de n.
+        - max_bytes (int): Las A más grandes no se guardan como base.
+        - cache (CacheFactorizaciones, opcional): Caché para las
+          refactorizaciones (default: cache_lu).
+        '''
+        self.fraccion_rango = fraccion_rango
+        self.max_bytes = max_bytes
+        self.cache = cache
+        self.registro = deque(maxlen=100)
+        self.limpiar()
+
+    def limpiar(self):
+        '''
+        Descarta la base: la siguiente resolución refactoriza.
+        '''
+        self.A_base = None
+        self.LU = None
+        self.perm = None
+
+    def resolver(self, A, b, detail=None):
+        '''
+        Resuelve Ax = b con la ruta más barata disponible.
+
+        Retorna:
+        - x (ndarray): Vector solución.
+
+        Raises:
+            ValueError: si A no es cuadrada, las dimensiones no coinciden o
+            A es singular.
+        '''
+        A = np.asarray(A, dtype=float)
+        b = np.array(b, dtype=float)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("La matriz A debe ser cuadrada")
+        if b.shape[0] != A.shape[0]:
+            raise ValueError("Las dimensiones de A y b no son compatibles")
+
+        inicio = time.perf_counter()
+        n = A.shape[0]
+        x = None
+        rango = 0
+        cambiadas = 0
+
+        if self.A_base is None:
+            motivo = "sin factorización previa"
+        elif self.A_base.shape != A.shape:
+            motivo = "cambió el tamaño"
+        else:
+            filas_cambio, columnas_cambio = np.nonzero(A != self.A_base)
+            filas, columnas = _cubrir_cambios(filas_cambio, columnas_cambio)
+            cambiadas = len(filas_cambio)
+            rango = len(filas) + len(columnas)
+            limite = max(1, int(self.fraccion_rango * n))
+
+            if rango == 0:
+                x = resolver_lu(self.LU, self.perm, b)
+                ruta = "misma A (solo sustituciones)"
+            elif rango > limite:
+                motivo = f"rango {rango} > {limite}"
+            else:
+                x, motivo = self._woodbury(A, b, filas, columnas)
+                ruta = f"Sherman-Morrison-Woodbury (rango {rango})"
+
+        if x is None:
+            ruta = f"refactorización ({motivo})"
+            x = self._refactorizar(A, b)
+
+        self.registro.append({"ruta": ruta, "rango": rango, "entradas cambiadas": cambiadas, "tiempo": time.perf_counter() - inicio})
+
+        if detail is not None:
+            detail.set_info("ruta de resolución", ruta)
+            detail.set_info("entradas cambiadas", cambiadas)
+
+        return x
+
+    def _woodbury(self, A, b, filas, columnas):
+        '''
+        Solución por Sherman-Morrison-Woodbury sobre la factorización de la
+        base. Devuelve (x, None) o (None, motivo) si no es confiable.
+        '''
+        y = resolver_lu(self.LU, self.perm, b)
+
+        # ΔA = E_R ΔA[R, :] + ΔA'[:, C] E_C^T, con ΔA' el cambio fuera de
+        # las filas R: U = [E_R, ΔA'[:, C]] y V^T = [ΔA[R, :]; E_C^T]
+        n, r = len(b), len(filas)
+        U = np.zeros((n, r + len(columnas)))
+        U[filas, np.arange(r)] = 1.0
+        U[:, r:] = A[:, columnas] - self.A_base[:, columnas]
+        U[filas, r:] = 0.0
+        Z = resolver_lu(self.LU, self.perm, U)
+
+        filas_cambio = A[filas, :] - self.A_base[filas, :]
+        capacitancia = np.eye(U.shape[1]) + np.vstack([filas_cambio @ Z, Z[columnas, :]])
+        Vt_y = np.concatenate([filas_cambio @ y, y[columnas]])
+
+        condicion = np.linalg.cond(capacitancia)
+        if not np.isfinite(condicion) or condicion > COND_MAXIMA_SMW:
+            return None, f"capacitancia mal condicionada, cond {condicion:.1e}"
+
+        x = y - Z @ np.linalg.solve(capacitancia, Vt_y)
+
+        residuo = _residuo_inf(A, b, x)
+        escala = np.abs(A).sum(axis=1).max() * np.abs(x).max(initial=0.0) + np.abs(b).max(initial=0.0)
+        if escala > 0.0 and residuo > ERROR_MAXIMO_SMW * escala:
+            return None, f"error hacia atrás {residuo / escala:.1e}"
+
+        return x, None
+
+    def _refactorizar(self, A, b):
+        cache = cache_lu if self.cache is None else self.cache
+        LU, perm = cache.obtener(A)
+
+        if A.nbytes + LU.nbytes + perm.nbytes <= self.max_bytes:
+            # Copia: la tabla de la interfaz puede seguir modificando A
+            self.A_base, self.LU, self.perm = A.copy(), LU, perm
+        else:
+            self.limpiar()
+
+        return resolver_lu(LU, perm, b)
+
+
+# Resolución incremental de la aplicación (ver resolver_con_metodo)
+resolucion_incremental = ResolucionIncremental()
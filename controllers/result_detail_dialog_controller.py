@@ -3,6 +3,14 @@ from PyQt5.QtWidgets import QDialog, QMessageBox
 from ui.result_detail_dialog import Ui_Dialog
 
 from controllers.metodos import ResultDetail
+from controllers.importar_matriz import formatear_bytes
+
+# Texto de cada motivo de abandono de ResultDetail.stop_reason
+MOTIVOS_DETENCION = {
+    "diverged": "divergió",
+    "stagnated": "estancado",
+    "nan": "valores no finitos"
+}
 
 #########################################
 
@@ -49,7 +57,72 @@ class ResultDetailDialogController(QDialog, Ui_Dialog):
         self.method_name.setText(self.result_detail.get_metodo())
         self.time.setText(f"{self.result_detail.get_execution_time():.3f} seconds")
         self.total_iterations.setText(str(self.result_detail.get_total_iterations()))
-        self.converge.setText("Si" if self.result_detail.get_converged() else "No")
+        self.converge.setText(self._texto_converge())
+        self._show_info()
+
+    def _texto_converge(self):
+        '''
+        Metodo privado que indica si el método convergió y, si se detuvo
+        antes, el motivo.
+        '''
+        if self.result_detail.get_converged():
+            return "Si"
+        if self.result_detail.get_cancelled():
+            return "No (cancelado)"
+        if self.result_detail.get_timed_out():
+            return "No (tiempo agotado)"
+        if self.result_detail.get_stop_reason():
+            return f"No ({MOTIVOS_DETENCION.get(self.result_detail.get_stop_reason(), self.result_detail.get_stop_reason())})"
+        return "No"
+
+    def _show_info(self):
+        '''
+        Metodo privado para mostrar las métricas adicionales del método.
+        La sección se oculta si el método no reportó ninguna.
+        '''
+        info = self.result_detail.get_info()
+
+        lineas = []
+        for clave, valor in info.items():
+            if isinstance(valor, float):
+                valor = f"{valor:.4g}"
+            lineas.append(f"{clave}: {valor}")
+
+        # Carrera de métodos: estado y tiempo de cada participante
+        for metodo, resultado in self.result_detail.get_race_results().items():
+            iteraciones = "" if resultado["iteraciones"] is None else f", {resultado['iteraciones']} iteraciones"
+            lineas.append(f"{metodo}: {resultado['estado']} ({resultado['tiempo']:.3f} s{iteraciones})")
+
+        # Método "Auto": propiedades medidas de A y método elegido
+        analisis = self.result_detail.get_matrix_analysis()
+        if analisis:
+            simetrica = {True: "sí", False: "no", None: "no medida"}[analisis["simétrica"]]
+            radio = analisis["radio espectral Jacobi"]
+            lineas.append(f"análisis de A: n = {analisis['n']}, nnz = {analisis['nnz']} (densidad {analisis['densidad']:.3g}), "
+                          f"{'dispersa' if analisis['dispersa'] else 'densa'}{', en disco' if analisis['en disco'] else ''}")
+            lineas.append(f"simétrica: {simetrica} | dominancia diagonal: {analisis['dominancia diagonal']:.3g} | "
+                          f"triangular: {analisis['triangular'] or 'no'}")
+            lineas.append(f"ancho de banda: {analisis['ancho de banda']} (kl {analisis['kl']}, ku {analisis['ku']}) | "
+                          f"radio espectral Jacobi: {'no definido' if radio is None else f'{radio:.3g}'}")
+            lineas.append(f"tiempo de análisis: {analisis['tiempo de análisis']:.3f} s")
+            lineas.append(f"decisión: {self.result_detail.get_method_choice()}")
+
+        # Arranque en caliente: origen de x0 y beneficio estimado
+        if self.result_detail.get_warm_start():
+            residuo = self.result_detail.get_warm_start_residual()
+            ahorradas = self.result_detail.get_iterations_saved()
+            partes = [] if residuo is None else [f"residuo inicial {residuo:.2g} del de cero"]
+            partes.append("ahorro no estimable" if ahorradas is None else f"≈ {ahorradas} iteraciones ahorradas")
+            lineas.append(f"arranque en caliente: {self.result_detail.get_warm_start()} ({', '.join(partes)})")
+
+        # Métodos fuera de memoria: E/S de disco
+        if self.result_detail.get_bytes_read() > 0:
+            lineas.append(f"leído por iteración: {formatear_bytes(self.result_detail.get_bytes_read_per_iteration())}")
+            lineas.append(f"leído en total: {formatear_bytes(self.result_detail.get_bytes_read())}")
+
+        self.info_metodo.setText("\n".join(lineas))
+        self.label_info.setVisible(len(lineas) > 0)
+        self.info_metodo.setVisible(len(lineas) > 0)
 
     def show_results(self):
         '''
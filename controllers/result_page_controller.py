@@ -1,9 +1,10 @@
 from ui.result_dialog import Ui_Form
-from PyQt5.QtWidgets import QWidget
+from PyQt5.QtWidgets import QWidget, QHeaderView
 
 from controllers.navigation_controller import SOLVER_PAGE_INDEX
 
 from controllers.metodos import ResultDetail, ResultInterfaceRegister, ResultRegister
+from controllers.modelos_tabla import ModeloHistorial, ModeloSoluciones
 
 class ResultPageController(QWidget, Ui_Form, ResultInterfaceRegister):
     def __init__(self, navigation_controller, result_register : ResultRegister = None):
@@ -21,21 +22,39 @@ class ResultPageController(QWidget, Ui_Form, ResultInterfaceRegister):
         # Configurar la interfaz de usuario para la página de resultados
         self.setupUi(self)
 
+        # La lista y la tabla leen directamente de los arreglos del resultado
+        # y solo formatean las filas visibles
+        self.modelo_soluciones = ModeloSoluciones(parent=self)
+        self.lista_soluciones.setModel(self.modelo_soluciones)
+
+        self.modelo_historial = ModeloHistorial(parent=self)
+        self.tabla_iteraciones.setModel(self.modelo_historial)
+
+        # Con filas de alto fijo la vista no mide cada fila al cambiar de
+        # modelo (un QListView sí recorre todas las filas al acomodarlas)
+        self.lista_soluciones.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla_iteraciones.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
     # ==================== MÉTODOS MANEJADORES DE EVENTOS ====================
     def on_regresar_clicked(self):
         self.navigation_controller.set_current_page(SOLVER_PAGE_INDEX)
 
     # ==================== MÉTODOS DE INTERFAZ DE RESULTADOS ====================
     def update_from_result_register(self):
-        self.lista_soluciones.clear()
+        self._update_iteration_table()
 
-        if self.result_register.get_result_handler() is None or self.result_register.get_result_handler().size() == 0:
+        result_handler = self.result_register.get_result_handler()
+        if result_handler is None or result_handler.size() == 0:
+            self.modelo_soluciones.set_soluciones(None)
             return
 
-        solutions = self.result_register.get_result_handler().get_results()
+        self.modelo_soluciones.set_soluciones(result_handler.get_results())
 
-        var_no = 1
-        
-        for sol in solutions:
-            self.lista_soluciones.addItem(f"X{var_no} = {sol}")
-            var_no += 1
\ No newline at end of file
+    def _update_iteration_table(self):
+        '''
+        Muestra en la tabla los iterados registrados en el detalle del
+        resultado, o la deja vacía si no se registraron.
+        '''
+        detail : ResultDetail = self.result_register.get_result_detail()
+        historial = None if detail is None else detail.get_iteration_history()
+        self.modelo_historial.set_historial(historial)
@@ -0,0 +1,353 @@
+import time
+
+import numpy as np
+
+from controllers.matriz_csr import MatrizCSR
+from controllers.metodos import (METODO_AUTO, MOTOR_TRIANGULAR, ResultDetail, _filas_por_bloque, es_simetrica, estimar_radio_espectral_jacobi,
+                                 resolver_con_metodo)
+
+# Métodos iterativos que "Auto" puede elegir; si no convergen se usa un directo
+METODOS_ITERATIVOS_AUTO = ("Jacobi", "Gauss-Seidel", "Gradiente conjugado", "GMRES")
+
+
+# Productos matriz-vector del método de la potencia en analizar_matriz
+ITERACIONES_POTENCIA_AUTO = 20
+
+# Operaciones de punto flotante que cuestan lo mismo que un paso del
+# intérprete por fila (unos 2 µs): las sustituciones, los barridos de
+# Gauss-Seidel y la LU en banda recorren las filas en Python
+COSTO_FILA_PYTHON = 10000
+
+# Memoria máxima de los factores de un método directo elegido por "Auto"
+MEMORIA_DIRECTO_AUTO = 1024 * 1024 * 1024
+
+
+def analizar_matriz(A, iteraciones_potencia=ITERACIONES_POTENCIA_AUTO):
+    """
+    Recorre A una vez (O(nnz), por bloques de filas si es densa) y mide
+    las propiedades que deciden qué método conviene: dispersión, simetría,
+    dominancia diagonal, ancho de banda, triangularidad y el radio
+    espectral de Jacobi estimado con unas pocas iteraciones del método de
+    la potencia.
+
+    Parámetros:
+    -----------
+    A : array_like, np.memmap o MatrizCSR
+        Matriz de coeficientes (n x n)
+    iteraciones_potencia : int, opcional
+        Productos matriz-vector para estimar el radio espectral
+        (default: ITERACIONES_POTENCIA_AUTO)
+
+    Retorna:
+    --------
+    analisis : dict
+        "n", "nnz", "densidad", "dispersa", "en disco", "simétrica" (None
+        si no se midió), "diagonal positiva", "ceros en la diagonal",
+        "diagonal mínima" (min |a_ii|),
+        "dominancia diagonal" (min |a_ii| / sum_j!=i |a_ij|), "kl" y "ku"
+        (anchos de banda inferior y superior), "ancho de banda",
+        "triangular" ("inferior", "superior" o None), "cota radio
+        espectral" (max sum_j!=i |a_ij| / |a_ii|), "radio espectral
+        Jacobi" (None si la diagonal tiene ceros) y "tiempo de análisis"
+    """
+    inicio = time.perf_counter()
+
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A debe ser cuadrada")
+    n = A.shape[0]
+    en_disco = isinstance(A, np.memmap)
+
+    if isinstance(A, MatrizCSR):
+        filas = A.indices_fila()
+        fuera = filas != A.col_idx
+        diagonal = A.diagonal()
+        suma_fuera = np.bincount(filas[fuera], weights=np.abs(A.valores[fuera]), minlength=n)
+        desplazamiento = A.col_idx - filas
+        nnz = int(np.count_nonzero(A.valores))
+        ku = int(max(0, desplazamiento.max(initial=0)))
+        kl = int(max(0, -desplazamiento.min(initial=0)))
+        simetrica = es_simetrica(A)
+    else:
+        diagonal = np.empty(n)
+        suma_fuera = np.empty(n)
+        nnz = kl = ku = 0
+        filas_bloque = _filas_por_bloque(n)
+
+        for inicio_bloque in range(0, n, filas_bloque):
+            fin = min(n, inicio_bloque + filas_bloque)
+            bloque = np.asarray(A[inicio_bloque:fin], dtype=float)
+            indices = np.arange(inicio_bloque, fin)
+
+            diagonal[inicio_bloque:fin] = bloque[indices - inicio_bloque, indices]
+            suma_fuera[inicio_bloque:fin] = np.abs(bloque).sum(axis=1) - np.abs(diagonal[inicio_bloque:fin])
+
+            no_nulos = bloque != 0.0
+            nnz += int(no_nulos.sum())
+            con_datos = no_nulos.any(axis=1)
+            if con_datos.any():
+                primera = no_nulos.argmax(axis=1)
+                ultima = n - 1 - no_nulos[:, ::-1].argmax(axis=1)
+                kl = max(kl, int((indices - primera)[con_datos].max()))
+                ku = max(ku, int((ultima - indices)[con_datos].max()))
+
+        # Leer columnas de un archivo mapeado recorre todo el archivo por
+        # cada bloque: la simetría solo se mide en memoria
+        simetrica = None if en_disco else es_simetrica(A)
+
+    modulo_diagonal = np.abs(diagonal)
+    ceros_diagonal = int(np.count_nonzero(diagonal == 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dominancia = float(np.where(suma_fuera > 0.0, modulo_diagonal / suma_fuera, np.inf).min(initial=np.inf))
+        cota_radio = float(np.inf) if ceros_diagonal else float((suma_fuera / modulo_diagonal).max(initial=0.0))
+
+    # La potencia da una estimación más ajustada que la cota por filas,
+    # que igual es una cota superior rigurosa; en disco cada producto
+    # sería una lectura completa de A
+    if ceros_diagonal:
+        radio = None
+    elif en_disco:
+        radio = cota_radio
+    else:
+        radio = min(estimar_radio_espectral_jacobi(A, iteraciones_potencia), cota_radio)
+
+    triangular = None
+    if ku == 0:
+        triangular = "inferior"
+    elif kl == 0:
+        triangular = "superior"
+
+    return {
+        "n": n,
+        "nnz": nnz,
+        "densidad": nnz / (n * n) if n else 0.0,
+        "dispersa": isinstance(A, MatrizCSR),
+        "en disco": en_disco,
+        "simétrica": simetrica,
+        "diagonal positiva": bool(np.all(diagonal > 0.0)),
+        "ceros en la diagonal": ceros_diagonal,
+        "diagonal mínima": float(modulo_diagonal.min(initial=np.inf)),
+        "dominancia diagonal": dominancia,
+        "kl": kl,
+        "ku": ku,
+        "ancho de banda": kl + ku + 1,
+        "triangular": triangular,
+        "cota radio espectral": cota_radio,
+        "radio espectral Jacobi": radio,
+        "tiempo de análisis": time.perf_counter() - inicio
+    }
+
+
+def _iteraciones_estimadas(tasa, reduccion):
+    '''
+    Iteraciones para reducir el error en el factor reduccion (> 1) con una
+    tasa de convergencia lineal tasa (< 1).
+    '''
+    if reduccion <= 1.0:
+        return 1
+    if tasa <= 0.0:
+        return 1
+    return int(np.ceil(np.log(reduccion) / -np.log(tasa)))
+
+
+def estimar_costos(analisis, b, tol=1e-10, max_iter=1000):
+    """
+    Estima, en operaciones de punto flotante, el costo de resolver el
+    sistema analizado con cada método aplicable. Los iterativos se estiman
+    con el radio espectral de Jacobi rho: Jacobi necesita
+    log(escala / tol) / log(1 / rho) iteraciones (escala = |b| / min |a_ii|
+    acota el primer paso), Gauss-Seidel la mitad y el gradiente
+    conjugado con precondicionador diagonal 0.5 sqrt(kappa) ln(2 |b| / tol)
+    con kappa = (1 + rho) / (1 - rho).
+
+    Parámetros:
+    -----------
+    analisis : dict
+        Resultado de analizar_matriz
+    b : array_like
+        Vector de términos independientes (n)
+    tol : float, opcional
+        Tolerancia de los métodos iterativos (default: 1e-10)
+    max_iter : int, opcional
+        Número máximo de iteraciones (default: 1000)
+
+    Retorna:
+    --------
+    costos : dict
+        {metodo: costo} de los métodos aplicables
+    descartados : dict
+        {metodo: motivo} de los que no se pueden usar
+    """
+    n = analisis["n"]
+    nnz = analisis["nnz"]
+    kl, ku = analisis["kl"], analisis["ku"]
+    radio = analisis["radio espectral Jacobi"]
+    b = np.asarray(b, dtype=float)
+    norma_b = float(np.abs(b).max(initial=0.0))
+
+    costos = {}
+    descartados = {}
+
+    # Directos
+    if analisis["triangular"] is not None and analisis["ceros en la diagonal"] == 0:
+        costos[MOTOR_TRIANGULAR] = 2.0 * nnz + n * COSTO_FILA_PYTHON
+    elif analisis["triangular"] is not None:
+        descartados[MOTOR_TRIANGULAR] = "ceros en la diagonal"
+    else:
+        descartados[MOTOR_TRIANGULAR] = "no es triangular"
+
+    if analisis["dispersa"]:
+        # LU en banda (Gauss-Jordan disperso); el reordenamiento Cuthill-McKee
+        # solo puede reducir kl y ku
+        if 8 * n * (2 * kl + ku + 1) <= MEMORIA_DIRECTO_AUTO:
+            costos["Gauss-Jordan"] = 2.0 * n * kl * (kl + ku + 1) + 10 * n * COSTO_FILA_PYTHON
+        else:
+            descartados["Gauss-Jordan"] = "la banda no cabe en memoria"
+        descartados["LU"] = "A dispersa (se usa la LU en banda)"
+    else:
+        # En disco la LU se factoriza por teselas (lu_fuera_de_memoria)
+        if analisis["en disco"] or 8 * n * n <= MEMORIA_DIRECTO_AUTO:
+            costos["LU"] = 2.0 / 3.0 * n ** 3
+        else:
+            descartados["LU"] = "los factores no caben en memoria"
+
+    # Iterativos
+    if radio is None:
+        motivo = "ceros en la diagonal"
+        descartados["Jacobi"] = descartados["Gauss-Seidel"] = motivo
+    elif radio >= 1.0:
+        motivo = f"radio espectral de Jacobi {radio:.3g} >= 1"
+        descartados["Jacobi"] = descartados["Gauss-Seidel"] = motivo
+    else:
+        escala = norma_b / analisis["diagonal mínima"]
+        iteraciones = _iteraciones_estimadas(radio, escala / tol)
+
+        if iteraciones > max_iter:
+            descartados["Jacobi"] = f"≈ {iteraciones} iteraciones > máximo"
+        else:
+            costos["Jacobi"] = iteraciones * 2.0 * nnz
+
+        if analisis["en disco"]:
+            descartados["Gauss-Seidel"] = "A en disco"
+        elif (iteraciones + 1) // 2 > max_iter:
+            descartados["Gauss-Seidel"] = f"≈ {(iteraciones + 1) // 2} iteraciones > máximo"
+        else:
+            costos["Gauss-Seidel"] = (iteraciones + 1) // 2 * (2.0 * nnz + n * COSTO_FILA_PYTHON)
+
+    if analisis["en disco"]:
+        descartados["Gradiente conjugado"] = "A en disco"
+    elif not analisis["simétrica"] or not analisis["diagonal positiva"]:
+        descartados["Gradiente conjugado"] = "no es simétrica con diagonal positiva"
+    else:
+        if radio is not None and radio < 1.0:
+            kappa = (1.0 + radio) / (1.0 - radio)
+            iteraciones = int(np.ceil(0.5 * np.sqrt(kappa) * np.log(2.0 * max(norma_b / tol, 1.0))))
+        else:
+            # Sin estimación del condicionamiento: a lo más n en aritmética exacta
+            iteraciones = n
+        if iteraciones > max_iter:
+            descartados["Gradiente conjugado"] = f"≈ {iteraciones} iteraciones > máximo"
+        else:
+            costos["Gradiente conjugado"] = iteraciones * (2.0 * nnz + 10.0 * n)
+
+    return costos, descartados
+
+
+def elegir_metodo_automatico(analisis, b, tol=1e-10, max_iter=1000):
+    """
+    Elige el método aplicable de menor costo estimado (ver estimar_costos).
+    Si ninguno es aplicable se usa GMRES, que no exige ninguna estructura.
+
+    Retorna:
+    --------
+    metodo : str
+        Método elegido (un nombre de METODOS o MOTOR_TRIANGULAR)
+    decision : str
+        El método, su costo y el de las alternativas, y los descartados con
+        su motivo
+    costos : dict
+        {metodo: costo} de los métodos aplicables
+    """
+    costos, descartados = estimar_costos(analisis, b, tol, max_iter)
+
+    if costos:
+        metodo = min(costos, key=costos.get)
+        decision = f"{metodo}: menor costo estimado ({costos[metodo]:.2g} operaciones)"
+    else:
+        metodo = "GMRES"
+        decision = "GMRES: ningún otro método es aplicable"
+
+    alternativas = [f"{otro} {costo:.2g}" for otro, costo in sorted(costos.items(), key=lambda par: par[1]) if otro != metodo]
+    if alternativas:
+        decision += "; alternativas: " + ", ".join(alternativas)
+    if descartados:
+        decision += "; descartados: " + ", ".join(f"{otro} ({motivo})" for otro, motivo in descartados.items())
+
+    return metodo, decision, costos
+
+
+def resolver_automatico(A, b, tol=1e-10, max_iter=1000, detail=None, cancelacion=None, tiempo_limite=None, progreso=None,
+                        registrar_historial=False, x0=None, arranque_en_caliente=False, incremental=False):
+    """
+    Método "Auto": analiza A (analizar_matriz), elige el método más barato
+    que se le puede aplicar (elegir_metodo_automatico) y resuelve con él
+    mediante resolver_con_metodo. Los iterativos de Krylov usan el
+    precondicionador diagonal, que cuesta O(n) en lugar de la
+    factorización incompleta. Si un iterativo no converge (sin haber sido
+    cancelado ni agotado su tiempo), se resuelve con el directo aplicable
+    más barato.
+
+    Los parámetros son los de resolver_con_metodo. El análisis y la
+    decisión quedan en detail (matrix_analysis, method_choice) y
+    detail.metodo es "Auto (<método usado>)".
+
+    Retorna:
+    --------
+    x : ndarray
+        Vector solución
+    detail : ResultDetail
+        Detalle del método usado, con el tiempo total incluido el análisis
+    """
+    inicio = time.time()
+    detail = ResultDetail() if detail is None else detail
+
+    if len(b) != A.shape[0]:
+        raise ValueError("Las dimensiones de A y b no son compatibles")
+
+    analisis = analizar_matriz(A)
+    metodo, decision, costos = elegir_metodo_automatico(analisis, b, tol, max_iter)
+    opciones = {"tol": tol, "max_iter": max_iter, "cancelacion": cancelacion, "tiempo_limite": tiempo_limite, "progreso": progreso,
+                "registrar_historial": registrar_historial, "x0": x0, "arranque_en_caliente": arranque_en_caliente, "incremental": incremental}
+
+    error = None
+    try:
+        x, detail = resolver_con_metodo(metodo, A, b, detail=detail, precondicionador="diagonal", **opciones)
+    except ValueError as e:
+        # Un iterativo puede descubrir tarde que A no le sirve (p. ej. que
+        # no es definida positiva); un directo que falla no tiene respaldo
+        if metodo not in METODOS_ITERATIVOS_AUTO:
+            raise
+        error = e
+
+    detenido = error is None and (detail.cancelled or detail.timed_out)
+    if metodo in METODOS_ITERATIVOS_AUTO and not detenido and (error is not None or not detail.converged):
+        directos = [otro for otro in costos if otro not in METODOS_ITERATIVOS_AUTO]
+        if not directos:
+            if error is not None:
+                raise error
+        else:
+            respaldo = min(directos, key=costos.get)
+            if error is not None:
+                falla = f"falló ({error})"
+            else:
+                falla = "no convergió" + (f" ({detail.stop_reason})" if detail.stop_reason else "")
+            x, detail_respaldo = resolver_con_metodo(respaldo, A, b, **opciones)
+            vars(detail).update(vars(detail_respaldo))
+            decision += f"; {metodo} {falla}, se resolvió con {respaldo}"
+            metodo = respaldo
+
+    detail.metodo = f"{METODO_AUTO} ({metodo})"
+    detail.set_method_choice(analisis, decision)
+    detail.execution_time = time.time() - inicio
+
+    return x, detail
@@ -1,14 +1,19 @@
-from PyQt5.QtWidgets import QWidget, QMessageBox
+import os
+
+from PyQt5.QtWidgets import QWidget, QMessageBox, QHeaderView, QFileDialog, QApplication
 from PyQt5.QtCore import Qt
 
 from ui.solver_screen import Ui_solver_screen
 from controllers.navigation_controller import NavigationController, RESULT_PAGE_INDEX
-from controllers.matrix_controller import MatrixController
+from controllers.matrix_controller import MatrixController, MAX_SIZE
 
-from controllers.metodos import gauss_jordan, gauss_seidel, jacobi, ResultDetail, ResultHandler, ResultInterfaceRegister, ResultRegister
+from controllers.caches import cache_soluciones
+from controllers.metodos import ResultDetail, ResultHandler, ResultInterfaceRegister, ResultRegister
 from controllers.result_detail_dialog_controller import ResultDetailDialogController
+from controllers.solver_worker import SolverWorker
 
-import time
+# Carpeta donde persiste la caché de soluciones entre ejecuciones
+DIRECTORIO_CACHE_SOLUCIONES = os.path.join(os.path.expanduser("~"), ".matrix_solver_ultimate", "cache_soluciones")
 
 class SolverPageController(QWidget, Ui_solver_screen, ResultInterfaceRegister):
     """
@@ -23,6 +28,10 @@ class SolverPageController(QWidget, Ui_solver_screen, ResultInterfaceRegister):
         self.navigation_controller : NavigationController = navigation_controller
         self.matrix_controller : MatrixController = MatrixController()
         self.result_register : ResultRegister = result_register
+
+        # Las soluciones ya calculadas se reutilizan incluso tras reiniciar
+        cache_soluciones.set_directorio(DIRECTORIO_CACHE_SOLUCIONES)
+        self.solver_worker : SolverWorker = SolverWorker(cache=cache_soluciones, parent=self)
         
         # Conecta los eventos a tus métodos
         self._connect_signals()
@@ -36,28 +45,38 @@ class SolverPageController(QWidget, Ui_solver_screen, ResultInterfaceRegister):
         """
         self.resolver_btn.clicked.connect(self.on_solve_button_clicked)
         self.limpiar_matriz_btn.clicked.connect(self.on_clear_button_clicked)
-        self.matrix_size_slider.valueChanged.connect(self.on_matrix_size_changed)
+        self.importar_btn.clicked.connect(self.on_import_button_clicked)
+        self.cancelar_btn.clicked.connect(self.on_cancel_button_clicked)
+        self.matrix_size_spin.valueChanged.connect(self.on_matrix_size_changed)
+
+        self.solver_worker.signals.terminado.connect(self.on_solver_terminado)
+        self.solver_worker.signals.error.connect(self.on_solver_error)
+        self.solver_worker.signals.cancelado.connect(self.on_solver_cancelado)
+        self.solver_worker.signals.iniciado.connect(self.on_solver_iniciado)
+        self.solver_worker.signals.progreso.connect(self.on_solver_progreso)
     
     def _initialize_data(self):
         """
         Inicializa datos o configuraciones adicionales.
         """
         self._config_matriz()
+        self.texto_resolver_btn = self.resolver_btn.text()
+
+        # max_iter de cada tarea encolada, para escalar la barra de progreso
+        self.max_iter_por_tarea = {}
 
     def _config_matriz(self):
-        self.matrix_controller.set_matriz_fields([
-            [self.a11_field, self.a12_field, self.a13_field, self.a14_field, self.c1_field],
-            [self.a21_field, self.a22_field, self.a23_field, self.a24_field, self.c2_field],
-            [self.a31_field, self.a32_field, self.a33_field, self.a34_field, self.c3_field],
-            [self.a41_field, self.a42_field, self.a43_field, self.a44_field, self.c4_field],
-        ])
+        # La tabla muestra directamente el arreglo de la matriz aumentada
+        self.tabla_matriz.setModel(self.matrix_controller.get_modelo())
+        self.tabla_matriz.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.matrix_size_spin.setMaximum(MAX_SIZE)
+        self.matrix_size_spin.setValue(self.matrix_controller.get_size())
 
     # ==================== MÉTODOS MANEJADORES DE EVENTOS ====================
     def on_solve_button_clicked(self):
         """
         Se ejecuta cuando el usuario hace clic en el botón de resolver.
         """
-        self._config_matriz()
         self.matrix_controller.print_matriz()
         self.absolute_solver()
 
@@ -67,19 +86,51 @@ class SolverPageController(QWidget, Ui_solver_screen, ResultInterfaceRegister):
         """
         self.matrix_controller.clear_matriz()
         self.matrix_controller.set_size_to_default()
-        self.matrix_size_slider.setValue(4)
+        self.matrix_size_spin.setValue(self.matrix_controller.get_size())
+        self._mostrar_importacion(None)
+
+    def on_import_button_clicked(self):
+        """
+        Se ejecuta cuando el usuario hace clic en el botón de importar.
+        Carga un sistema desde un archivo y muestra cuánto tardó la carga y
+        cuánta memoria usó.
+        """
+        ruta, _ = QFileDialog.getOpenFileName(self, "Importar sistema", "", "Sistemas (*.csv *.npy *.npz *.mtx)")
+        if not ruta:
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            sistema = self.matrix_controller.importar(ruta)
+        except (ValueError, OSError) as e:
+            QMessageBox.critical(self, "Error", f"No se pudo importar el sistema: {e}")
+            print(e)
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        print("Sistema importado:", sistema.resumen())
+        self._mostrar_importacion(sistema)
+
+    def on_cancel_button_clicked(self):
+        """
+        Se ejecuta cuando el usuario hace clic en el botón de cancelar.
+        Detiene la resolución en curso y descarta las que siguen en cola.
+        """
+        self.solver_worker.cancelar_todo()
 
     def on_matrix_size_changed(self):
         """
         Se ejecuta cuando el usuario cambia el tamaño de la matriz.
         """
-        self.matrix_controller.change_size(self.matrix_size_slider.value())
+        self.matrix_controller.change_size(self.matrix_size_spin.value())
 
     # ==================== MÉTODOS AUXILIARES ====================
     def absolute_solver(self):
         '''
-        Metodo el cual se encarga de obtener los datos, procesarlos, llamar a las
-        funciones de solución y mostrar los resultados.
+        Metodo el cual se encarga de obtener los datos, procesarlos y encolar
+        la resolución en segundo plano. Los resultados se muestran en
+        on_solver_terminado cuando el worker termina.
         '''
         # validaciones
         if not self.carefully_with_max_iterations():
@@ -89,86 +140,149 @@ class SolverPageController(QWidget, Ui_solver_screen, ResultInterfaceRegister):
         coeficientes, terminos_independientes = self.matrix_controller.separate_A_b()
         tol = float(self.tolerancia_field.text())
         max_iter = int(self.iteraciones_maximas_field.text())
+        metodo = self.seleccionar_metodo.currentText()
 
-        # Valores de resultado
-        detail : ResultDetail = ResultDetail()
-        detail.metodo = self.seleccionar_metodo.currentText()
-        
-        result : ResultHandler = ResultHandler()
-        tmp_solucion = []
+        print("Using method: ", metodo)
+        # Tras editar un sistema ya resuelto, los iterativos parten de su
+        # solución y los directos actualizan su factorización
+        id_tarea = self.solver_worker.encolar(metodo, coeficientes, terminos_independientes, tol, max_iter, registrar_historial=True,
+                                              arranque_en_caliente=True, incremental=True)
+        self.max_iter_por_tarea[id_tarea] = max_iter
+        self._actualizar_estado_cola()
 
-        # Realizar la operacion
+    def _mostrar_importacion(self, sistema):
+        '''
+        Muestra el resumen de la última importación. Mientras se resuelve un
+        sistema importado que no cabe en el editor, la tabla y el tamaño se
+        desactivan; el botón de limpiar vuelve al editor.
+        '''
+        self.info_importacion.setText("" if sistema is None else sistema.resumen())
+
+        editable = self.matrix_controller.get_sistema_importado() is None
+        if editable:
+            self.matrix_size_spin.setValue(self.matrix_controller.get_size())
+        self.tabla_matriz.setEnabled(editable)
+        self.matrix_size_spin.setEnabled(editable)
+
+    def carefully_with_max_iterations(self):
+        '''
+        Metodo que se encarga de validar el número máximo de iteraciones
+        ingresado por el usuario. Como la resolución corre en segundo plano,
+        un número alto de iteraciones ya no congela la aplicación.
+
+        Returns:
+            bool: True si el valor es válido, False en caso contrario.
+        '''
         try:
-            print("Using method: ", self.seleccionar_metodo.currentText())
+            max_iter = int(self.iteraciones_maximas_field.text())
+        except ValueError:
+            QMessageBox.critical(self, "Error", "El número máximo de iteraciones debe ser un entero positivo.")
+            return False
 
-            now = time.time()
-            if(self.seleccionar_metodo.currentText() == "Gauss-Seidel"):
-                tmp_solucion, detail.total_iterations, detail.converged = gauss_seidel(coeficientes, terminos_independientes, tol=tol, max_iter=max_iter)
+        # validar que no sea negativo o cero
+        if max_iter <= 0:
+            QMessageBox.critical(self, "Error", "El número máximo de iteraciones debe ser un entero positivo.")
+            return False
 
-            elif(self.seleccionar_metodo.currentText() == "Jacobi"):
-                tmp_solucion, detail.total_iterations, detail.converged = jacobi(coeficientes, terminos_independientes, tol=tol, max_iter=max_iter)
+        return True
 
-            elif(self.seleccionar_metodo.currentText() == "Gauss-Jordan"):
-                tmp_solucion = gauss_jordan(coeficientes, terminos_independientes)
-                detail.total_iterations = 1
-                detail.converged = True
-                
-            # obtener tiempo de ejecucion
-            after = time.time()
-            detail.execution_time = after - now
+    def _actualizar_estado_cola(self):
+        '''
+        Muestra en el botón de resolver cuántas resoluciones siguen pendientes.
+        '''
+        pendientes = self.solver_worker.get_pendientes()
+        self.cancelar_btn.setEnabled(pendientes > 0)
+
+        if pendientes == 0:
+            self.resolver_btn.setText(self.texto_resolver_btn)
+        else:
+            self.resolver_btn.setText(f"{self.texto_resolver_btn} ({pendientes} en cola)")
+
+    def _finalizar_progreso(self, id_tarea):
+        '''
+        Olvida el max_iter de la tarea y, si la cola quedó vacía, limpia la
+        barra de progreso.
+        '''
+        self.max_iter_por_tarea.pop(id_tarea, None)
+
+        if self.solver_worker.get_pendientes() == 0:
+            self.progreso_bar.setValue(0)
+            self.progreso_label.setText("")
+
+    # ==================== MÉTODOS MANEJADORES DEL WORKER ====================
+    def on_solver_iniciado(self, id_tarea):
+        '''
+        Se ejecuta cuando una resolución sale de la cola y empieza.
+        '''
+        self.progreso_bar.setRange(0, self.max_iter_por_tarea.get(id_tarea, 0))
+        self.progreso_bar.setValue(0)
+        self.progreso_label.setText("Resolviendo...")
+
+    def on_solver_progreso(self, id_tarea, datos):
+        '''
+        Actualiza la barra de progreso y la lectura de convergencia con el
+        último reporte del método (a lo más FRECUENCIA_PROGRESO por segundo).
+        '''
+        iteracion, paso, residuo = datos
+        self.progreso_bar.setValue(min(iteracion, self.progreso_bar.maximum()))
+
+        texto = f"Iteración {iteracion}"
+        if paso is not None:
+            texto += f" | paso {paso:.3e}"
+        if residuo is not None:
+            texto += f" | residuo {residuo:.3e}"
+        self.progreso_label.setText(texto)
 
+    def on_solver_terminado(self, id_tarea, solucion, detail: ResultDetail):
+        '''
+        Se ejecuta en el hilo de la interfaz cuando una resolución termina.
+        '''
+        self._actualizar_estado_cola()
+        self._finalizar_progreso(id_tarea)
+
+        try:
             # obtener solucion
             if(self.result_register is None):
                 raise Exception("ResultRegister no está inicializado en SolverPageController.")
-            
-            print("Solución encontrada: ", tmp_solucion)
-            result.set_results(tmp_solucion)
+
+            print("Solución encontrada: ", solucion)
+            if "ruta de resolución" in detail.get_info():
+                print("Ruta de resolución: ", detail.get_info()["ruta de resolución"])
+            result : ResultHandler = ResultHandler()
+            result.set_results(solucion)
             self.result_register.result_handler = result
             self.result_register.result_detail = detail
 
             self.result_register.notify()
 
             # ir a la página de resultados
-            if detail.converged:
+            if detail.converged and not detail.get_cancelled():
                 self.navigation_controller.set_current_page(RESULT_PAGE_INDEX)
 
             # Mostrar detalles en un diálogo
             results_dialog = ResultDetailDialogController(detail, self)
             results_dialog.show_results()
-        
+
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
             print(e)
-            print(e.__traceback__)
 
-    def carefully_with_max_iterations(self):
+    def on_solver_error(self, id_tarea, mensaje):
         '''
-        Metodo que se encarga de validar el número máximo de iteraciones
-        ingresado por el usuario. Esto es para evitar que la aplicación se congele
-        por un número muy alto de iteraciones.
-
-        Returns:
-            bool: True si el valor es válido, False en caso contrario.
+        Se ejecuta en el hilo de la interfaz cuando una resolución falla.
         '''
-        max_iter = int(self.iteraciones_maximas_field.text())
+        self._actualizar_estado_cola()
+        self._finalizar_progreso(id_tarea)
+        QMessageBox.critical(self, "Error", mensaje)
+        print(mensaje)
 
-        # valiudar que no sea muy grande
-        if max_iter > 9999:
-            reply = QMessageBox.question(self, 
-                                         'Advertencia',
-                                         "El número máximo de iteraciones es muy alto y puede causar que la aplicación se congele. ¿Desea continuar?",
-                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                                        )
-            if reply == QMessageBox.No:
-                return False
-            
-        # validar que no sea negativo o cero
-        if max_iter <= 0:
-            QMessageBox.critical(self, "Error", "El número máximo de iteraciones debe ser un entero positivo.")
-            return False
+    def on_solver_cancelado(self, id_tarea):
+        '''
+        Se ejecuta cuando una resolución se cancela antes de empezar.
+        '''
+        self._actualizar_estado_cola()
+        self._finalizar_progreso(id_tarea)
 
-        return True
-    
     # ==================== MÉTODOS DE LA INTERFAZ ResultInterfaceRegister ====================
     def update_from_result_register(self):
         '''
@@ -0,0 +1,150 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from controllers.caches import resolver_con_cache
+from controllers.metodos import ResultDetail, TokenCancelacion
+
+
+class SolverSignals(QObject):
+    '''
+    Señales emitidas por las tareas de resolución. Se emiten desde el hilo
+    de trabajo y Qt las entrega en el hilo de la interfaz.
+
+    - iniciado(id): la tarea salió de la cola y empezó a resolverse.
+    - progreso(id, datos): avance reportado por el método, como la tupla
+      (iteracion, paso, residuo). Los métodos lo limitan a
+      FRECUENCIA_PROGRESO reportes por segundo.
+    - terminado(id, solucion, detail): la tarea terminó correctamente.
+    - error(id, mensaje): la tarea terminó con una excepción.
+    - cancelado(id): la tarea se canceló antes de empezar.
+
+    Una tarea cancelada a mitad de camino emite terminado con el mejor
+    iterado encontrado y detail.get_cancelled() en True.
+    '''
+    iniciado = pyqtSignal(int)
+    progreso = pyqtSignal(int, object)
+    terminado = pyqtSignal(int, object, object)
+    error = pyqtSignal(int, str)
+    cancelado = pyqtSignal(int)
+
+
+class SolverTask(QRunnable):
+    '''
+    Tarea que resuelve un sistema con resolver_con_metodo fuera del hilo
+    de la interfaz. Si el sistema ya se resolvió con los mismos parámetros
+    la solución sale de la caché de soluciones (ver resolver_con_cache).
+    '''
+    def __init__(self, id_tarea, signals: SolverSignals, metodo, A, b, tol, max_iter, cancelacion=None, tiempo_limite=None,
+                 registrar_historial=False, cache=None, arranque_en_caliente=False, incremental=False):
+        super().__init__()
+        self.id_tarea = id_tarea
+        self.signals = signals
+        self.metodo = metodo
+        self.A = A
+        self.b = b
+        self.tol = tol
+        self.max_iter = max_iter
+        self.cancelacion = cancelacion if cancelacion is not None else TokenCancelacion()
+        self.tiempo_limite = tiempo_limite
+        self.registrar_historial = registrar_historial
+        self.cache = cache
+        self.arranque_en_caliente = arranque_en_caliente
+        self.incremental = incremental
+
+    def run(self):
+        if self.cancelacion.cancelado():
+            self.signals.cancelado.emit(self.id_tarea)
+            return
+
+        self.signals.iniciado.emit(self.id_tarea)
+
+        try:
+            detail = ResultDetail(metodo=self.metodo)
+            solucion, detail = resolver_con_cache(self.metodo, self.A, self.b, tol=self.tol, max_iter=self.max_iter, cache=self.cache, detail=detail,
+                                                  cancelacion=self.cancelacion, tiempo_limite=self.tiempo_limite, progreso=self._reportar_progreso,
+                                                  registrar_historial=self.registrar_historial, arranque_en_caliente=self.arranque_en_caliente,
+                                                  incremental=self.incremental)
+        except Exception as e:
+            self.signals.error.emit(self.id_tarea, str(e))
+            return
+
+        self.signals.terminado.emit(self.id_tarea, solucion, detail)
+
+    def _reportar_progreso(self, iteracion, paso, residuo):
+        self.signals.progreso.emit(self.id_tarea, (iteracion, paso, residuo))
+
+
+class SolverWorker(QObject):
+    '''
+    Cola de resoluciones en segundo plano. Las tareas se ejecutan en un
+    QThreadPool propio; con max_hilos=1 se resuelven en orden de llegada.
+    Las tareas consultan la caché de soluciones dada (default:
+    cache_soluciones).
+    '''
+    def __init__(self, max_hilos=1, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.signals = SolverSignals()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_hilos)
+
+        self.siguiente_id = 0
+        self.pendientes = {}
+
+        self.signals.terminado.connect(self._on_tarea_finalizada)
+        self.signals.error.connect(self._on_tarea_finalizada)
+        self.signals.cancelado.connect(self._on_tarea_finalizada)
+
+    def encolar(self, metodo, A, b, tol, max_iter, tiempo_limite=None, registrar_historial=False, arranque_en_caliente=False,
+                incremental=False):
+        '''
+        Agrega una resolución a la cola y devuelve su identificador.
+
+        tiempo_limite (segundos) acota la duración de la resolución; al
+        agotarse se devuelve el mejor iterado encontrado. Con
+        registrar_historial los iterados quedan en detail.iteration_history.
+        Con arranque_en_caliente los métodos iterativos arrancan desde la
+        solución reciente más cercana (ver SolucionesRecientes); con
+        incremental los métodos directos actualizan la última factorización
+        si A cambió en pocas entradas (ver ResolucionIncremental).
+        '''
+        self.siguiente_id += 1
+        id_tarea = self.siguiente_id
+
+        token = TokenCancelacion()
+        self.pendientes[id_tarea] = token
+        self.pool.start(SolverTask(id_tarea, self.signals, metodo, A, b, tol, max_iter, cancelacion=token, tiempo_limite=tiempo_limite,
+                                   registrar_historial=registrar_historial, cache=self.cache, arranque_en_caliente=arranque_en_caliente,
+                                   incremental=incremental))
+
+        return id_tarea
+
+    def cancelar(self, id_tarea):
+        '''
+        Pide cancelar una tarea. Si aún no empezó se descarta; si está en
+        ejecución el método se detiene en su siguiente revisión.
+        '''
+        token = self.pendientes.get(id_tarea)
+        if token is not None:
+            token.cancelar()
+
+    def cancelar_todo(self):
+        '''
+        Pide cancelar todas las tareas en cola o en ejecución.
+        '''
+        for token in self.pendientes.values():
+            token.cancelar()
+
+    def get_pendientes(self):
+        '''
+        Número de tareas en cola o en ejecución.
+        '''
+        return len(self.pendientes)
+
+    def esperar(self, msecs=-1):
+        '''
+        Bloquea hasta que terminen todas las tareas (útil al cerrar la app).
+        '''
+        return self.pool.waitForDone(msecs)
+
+    def _on_tarea_finalizada(self, id_tarea, *args):
+        self.pendientes.pop(id_tarea, None)
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 from PyQt5.QtWidgets import QApplication
 
@@ -5,6 +6,10 @@ from controllers.main_window_controller import MainWindowController
 
 
 if __name__ == '__main__':
+    # La carrera de métodos crea procesos; en el ejecutable empaquetado
+    # cada proceso hijo vuelve a entrar aquí y debe detenerse
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
     
     # Ventana principal con navegación entre paneles
@@ -0,0 +1,168 @@
+# Resolución por lotes sin interfaz gráfica (no importa PyQt5)
+# Uso: python -m solver_cli ENTRADA [ENTRADA ...] [--metodo M] [--tol T] [--max-iter N]
+#                            [--tiempo-limite S] [--procesos P] [--salida archivo.jsonl]
+#                            [--cache DIRECTORIO]
+#
+# Cada ENTRADA es un archivo, un directorio (se toman sus .csv, .npy, .npz y
+# .mtx) o un patrón glob. Se escribe una línea JSON por sistema con la
+# solución y el ResultDetail, en el orden de las entradas.
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from controllers.caches import CacheSoluciones, resolver_con_cache
+from controllers.importar_matriz import FORMATOS_IMPORTACION, importar_sistema
+from controllers.metodos import METODOS, resolver_con_metodo
+
+
+def listar_archivos(entradas):
+    """
+    Expande las entradas a la lista ordenada de archivos de sistemas, sin
+    repetidos. Los <nombre>_b.mtx de un directorio se omiten porque son el
+    vector b de <nombre>.mtx.
+    """
+    archivos = []
+
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            encontrados = sorted(
+                os.path.join(entrada, nombre) for nombre in os.listdir(entrada)
+                if os.path.splitext(nombre)[1].lower() in FORMATOS_IMPORTACION and not nombre.lower().endswith("_b.mtx")
+            )
+        elif os.path.isfile(entrada):
+            encontrados = [entrada]
+        else:
+            encontrados = sorted(ruta for ruta in glob.glob(entrada, recursive=True) if os.path.isfile(ruta))
+
+        archivos.extend(ruta for ruta in encontrados if ruta not in archivos)
+
+    return archivos
+
+
+def _a_json(valor):
+    """Convierte los tipos de numpy que json no conoce."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"{type(valor).__name__} no es serializable a JSON")
+
+
+def resolver_archivo(ruta, metodo, tol, max_iter, tiempo_limite=None, registrar_historial=False, directorio_cache=None):
+    """
+    Carga y resuelve un sistema. Devuelve (linea, convergio, error): el
+    registro como una línea JSON (archivo, datos de la carga, solución y
+    ResultDetail, o archivo y error si no se pudo cargar o resolver), si
+    el método convergió y el mensaje de error o None. Con directorio_cache
+    las soluciones se guardan y reutilizan desde esa carpeta (ver
+    CacheSoluciones), compartida por todos los procesos del pool.
+    """
+    registro = {"archivo": ruta}
+
+    try:
+        sistema = importar_sistema(ruta)
+        registro["carga"] = {
+            "formato": sistema.formato,
+            "n": sistema.n,
+            "tiempo": sistema.tiempo_carga,
+            "memoria": sistema.memoria,
+            "bytes_mapeados": sistema.bytes_mapeados,
+            "nota": sistema.nota
+        }
+
+        if directorio_cache is None:
+            x, detail = resolver_con_metodo(metodo, sistema.A, sistema.b, tol=tol, max_iter=max_iter,
+                                            tiempo_limite=tiempo_limite, registrar_historial=registrar_historial)
+        else:
+            x, detail = resolver_con_cache(metodo, sistema.A, sistema.b, tol=tol, max_iter=max_iter, cache=CacheSoluciones(directorio=directorio_cache),
+                                           tiempo_limite=tiempo_limite, registrar_historial=registrar_historial)
+        registro["solucion"] = x
+        registro["detail"] = detail.to_dict()
+
+    except Exception as e:
+        # Un archivo inválido no detiene el lote: queda registrado
+        registro["error"] = f"{type(e).__name__}: {e}"
+
+    convergio = "detail" in registro and registro["detail"]["converged"]
+    return json.dumps(registro, default=_a_json), convergio, registro.get("error")
+
+
+def _resolver_archivo_args(args):
+    return resolver_archivo(*args)
+
+
+def resolver_archivos(archivos, metodo, tol, max_iter, tiempo_limite=None, registrar_historial=False, procesos=None, directorio_cache=None):
+    """
+    Resuelve los archivos repartiéndolos en un pool de procesos (cada
+    proceso carga su propio archivo, así las matrices no se copian entre
+    procesos). Genera los resultados de resolver_archivo en el orden de
+    archivos, a medida que están listos. Con procesos=1 todo corre en el
+    proceso actual.
+    """
+    tareas = [(ruta, metodo, tol, max_iter, tiempo_limite, registrar_historial, directorio_cache) for ruta in archivos]
+    procesos = min(procesos or os.cpu_count() or 1, max(1, len(tareas)))
+
+    if procesos == 1:
+        for tarea in tareas:
+            yield _resolver_archivo_args(tarea)
+        return
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        yield from pool.map(_resolver_archivo_args, tareas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m solver_cli", description="Resuelve por lotes sistemas Ax = b guardados en archivos, sin interfaz gráfica")
+    parser.add_argument("entradas", nargs="+", help="Archivos, directorios o patrones glob (.csv, .npy, .npz, .mtx)")
+    parser.add_argument("--metodo", choices=METODOS, default=METODOS[0], help=f"Método de resolución (default: {METODOS[0]})")
+    parser.add_argument("--tol", type=float, default=1e-10, help="Tolerancia de los métodos iterativos (default: 1e-10)")
+    parser.add_argument("--max-iter", type=int, default=1000, help="Máximo de iteraciones (default: 1000)")
+    parser.add_argument("--tiempo-limite", type=float, default=None, help="Segundos máximos por sistema para los métodos iterativos")
+    parser.add_argument("--historial", action="store_true", help="Incluir los iterados registrados en cada ResultDetail")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool (default: uno por CPU)")
+    parser.add_argument("--cache", default=None, metavar="DIRECTORIO", help="Carpeta de la caché de soluciones: los sistemas ya resueltos con los mismos parámetros no se vuelven a resolver")
+    parser.add_argument("--salida", default="-", help="Archivo JSON lines de salida (default: salida estándar)")
+    args = parser.parse_args(argv)
+
+    if args.max_iter <= 0:
+        parser.error("--max-iter debe ser un entero positivo")
+    if args.procesos is not None and args.procesos <= 0:
+        parser.error("--procesos debe ser un entero positivo")
+
+    archivos = listar_archivos(args.entradas)
+    if not archivos:
+        parser.error("ninguna entrada corresponde a un archivo de sistema")
+
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    inicio = time.perf_counter()
+    convergidos = 0
+    errores = 0
+
+    try:
+        resultados = resolver_archivos(archivos, args.metodo, args.tol, args.max_iter, args.tiempo_limite, args.historial, args.procesos, args.cache)
+        for ruta, (linea, convergio, error) in zip(archivos, resultados):
+            salida.write(linea + "\n")
+            salida.flush()
+
+            if error is not None:
+                errores += 1
+                print(f"❌ {ruta}: {error}", file=sys.stderr)
+            elif convergio:
+                convergidos += 1
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"{len(archivos)} sistemas | {convergidos} convergieron | {errores} errores | {time.perf_counter() - inicio:.2f} s", file=sys.stderr)
+    return 1 if errores > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+
+# Tamaño de los sistemas de prueba: suficiente para recorrer varios bloques
+# de Gauss-Jordan y LU sin que las pruebas tarden
+N_PRUEBA = 40
+
+
+def matriz_dominante(n, semilla=0, simetrica=False):
+    '''
+    Matriz aleatoria estrictamente diagonal dominante (todos los métodos
+    iterativos convergen); si simetrica es True además es definida positiva.
+    '''
+    rng = np.random.default_rng(semilla)
+    A = rng.uniform(-1.0, 1.0, (n, n))
+    if simetrica:
+        A = A + A.T
+    np.fill_diagonal(A, np.abs(A).sum(axis=1) + 1.0)
+    return A
+
+
+@pytest.fixture
+def sistema():
+    A = matriz_dominante(N_PRUEBA, semilla=1)
+    b = np.random.default_rng(2).uniform(-1.0, 1.0, N_PRUEBA)
+    return A, b, np.linalg.solve(A, b)
+
+
+@pytest.fixture
+def sistema_spd():
+    A = matriz_dominante(N_PRUEBA, semilla=3, simetrica=True)
+    b = np.random.default_rng(4).uniform(-1.0, 1.0, N_PRUEBA)
+    return A, b, np.linalg.solve(A, b)
+
+
+def matriz_dispersa(n, semilla=0, densidad=0.1, simetrica=False):
+    '''
+    Como matriz_dominante pero con solo una fracción `densidad` de las
+    entradas fuera de la diagonal distintas de cero (densa, sin convertir).
+    '''
+    rng = np.random.default_rng(semilla)
+    A = rng.uniform(-1.0, 1.0, (n, n)) * (rng.random((n, n)) < densidad)
+    if simetrica:
+        A = A + A.T
+    np.fill_diagonal(A, np.abs(A).sum(axis=1) + 1.0)
+    return A
+
+
+@pytest.fixture
+def sistema_disperso():
+    A = matriz_dispersa(N_PRUEBA, semilla=5, simetrica=True)
+    b = np.random.default_rng(6).uniform(-1.0, 1.0, N_PRUEBA)
+    return A, b, np.linalg.solve(A, b)
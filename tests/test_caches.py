@@ -0,0 +1,189 @@
+import os
+
+import numpy as np
+import pytest
+
+from controllers.caches import CacheSoluciones, clave_solucion, resolver_con_cache
+from controllers.matriz_csr import MatrizCSR
+from controllers.metodos import ResultDetail
+
+
+def test_ida_y_vuelta_a_disco(tmp_path, sistema):
+    A, b, esperado = sistema
+    x, detail = resolver_con_cache("Jacobi", A, b, cache=CacheSoluciones(directorio=str(tmp_path)))
+    assert detail.get_info()["cache soluciones"] == "miss"
+    assert len(os.listdir(tmp_path)) == 1
+
+    # Una caché nueva sobre la misma carpeta (un reinicio de la aplicación)
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    x_guardado, detail_guardado = resolver_con_cache("Jacobi", A, b, cache=cache)
+
+    assert detail_guardado.get_info()["cache soluciones"] == "hit"
+    assert cache.estadisticas()["hits"] == 1
+    assert cache.estadisticas()["misses"] == 0
+    np.testing.assert_array_equal(x_guardado, x)
+    np.testing.assert_allclose(x_guardado, esperado, atol=1e-8)
+    assert detail_guardado.get_metodo() == "Jacobi"
+    assert detail_guardado.get_converged()
+    assert detail_guardado.get_total_iterations() == detail.get_total_iterations()
+    assert detail_guardado.get_residual_history() == detail.get_residual_history()
+
+    # El acierto en disco vuelve a memoria
+    assert len(cache) == 1
+
+
+def test_ida_y_vuelta_con_historial(tmp_path, sistema):
+    A, b, _ = sistema
+    _, detail = resolver_con_cache("Gauss-Seidel", A, b, cache=CacheSoluciones(directorio=str(tmp_path)), registrar_historial=True)
+
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    _, detail_guardado = resolver_con_cache("Gauss-Seidel", A, b, cache=cache, registrar_historial=True)
+
+    assert detail_guardado.get_info()["cache soluciones"] == "hit"
+    original, guardado = detail.get_iteration_history(), detail_guardado.get_iteration_history()
+    assert len(guardado) == len(original) > 0
+    for i in range(len(original)):
+        assert guardado.iteracion(i) == original.iteracion(i)
+        np.testing.assert_array_equal(guardado.iterado(i), original.iterado(i))
+
+
+def test_entrada_sin_historial_no_sirve_a_quien_lo_pide(sistema):
+    A, b, _ = sistema
+    cache = CacheSoluciones()
+    resolver_con_cache("Jacobi", A, b, cache=cache)
+    cache.reiniciar_contadores()
+
+    _, detail = resolver_con_cache("Jacobi", A, b, cache=cache, registrar_historial=True)
+
+    assert detail.get_info()["cache soluciones"] == "miss"
+    assert cache.estadisticas()["hits"] == 0
+    assert cache.estadisticas()["misses"] == 1
+    assert detail.get_iteration_history() is not None
+
+
+def test_acierto_devuelve_copias(sistema):
+    A, b, _ = sistema
+    cache = CacheSoluciones()
+    x, _ = resolver_con_cache("LU", A, b, cache=cache)
+
+    x_guardado, _ = resolver_con_cache("LU", A, b, cache=cache)
+    x_guardado[:] = 0.0
+    x_otra_vez, _ = resolver_con_cache("LU", A, b, cache=cache)
+
+    np.testing.assert_array_equal(x_otra_vez, x)
+
+
+def test_clave_depende_del_sistema_y_del_metodo(sistema):
+    A, b, _ = sistema
+    clave = clave_solucion("Jacobi", A, b, 1e-10, 1000)
+    A_modificada = A.copy()
+    A_modificada[3, 4] += 1e-12
+
+    assert clave == clave_solucion("Jacobi", A.copy(), b.copy(), 1e-10, 1000)
+    assert clave != clave_solucion("Gauss-Seidel", A, b, 1e-10, 1000)
+    assert clave != clave_solucion("Jacobi", A, b, 1e-8, 1000)
+    assert clave != clave_solucion("Jacobi", A, b, 1e-10, 500)
+    assert clave != clave_solucion("Jacobi", A_modificada, b, 1e-10, 1000)
+    assert clave != clave_solucion("Jacobi", A, 2.0 * b, 1e-10, 1000)
+    assert clave != clave_solucion("Jacobi", MatrizCSR.desde_densa(A), b, 1e-10, 1000)
+
+
+@pytest.mark.parametrize("contenido", [b"", b"no es un npz", b"PK\x03\x04truncado"])
+def test_entrada_danada_es_un_miss(tmp_path, sistema, contenido):
+    A, b, _ = sistema
+    clave = clave_solucion("Jacobi", A, b, 1e-10, 1000)
+    (tmp_path / (clave + CacheSoluciones.EXTENSION)).write_bytes(contenido)
+
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    x, detail = resolver_con_cache("Jacobi", A, b, cache=cache)
+
+    assert detail.get_info()["cache soluciones"] == "miss"
+    assert cache.estadisticas()["misses"] == 1
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-8)
+
+
+def test_entrada_con_pickle_se_rechaza(tmp_path, sistema):
+    A, b, _ = sistema
+    clave = clave_solucion("Jacobi", A, b, 1e-10, 1000)
+    # Un arreglo de objetos solo se puede leer con pickle
+    np.savez(tmp_path / (clave + CacheSoluciones.EXTENSION), x=np.array([object()], dtype=object), detail=np.array("{}"))
+
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    assert cache.obtener(clave) is None
+    assert cache.estadisticas()["misses"] == 1
+
+
+@pytest.mark.parametrize("campo", ["cancelled", "timed_out"])
+def test_resoluciones_interrumpidas_no_se_guardan(tmp_path, campo):
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    detail = ResultDetail(metodo="Jacobi", converged=False, **{campo: True})
+    cache.guardar("clave", np.zeros(3), detail)
+
+    assert len(cache) == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_arranque_en_caliente_sin_convergencia_no_se_guarda(sistema):
+    A, b, esperado = sistema
+    cache = CacheSoluciones()
+    _, detail = resolver_con_cache("Jacobi", A, b, max_iter=3, cache=cache, x0=esperado + 1.0)
+    assert detail.get_warm_start() == "x0"
+    assert not detail.get_converged()
+
+    # Un pedido en frío no recibe el resultado que dependía de x0
+    _, detail_frio = resolver_con_cache("Jacobi", A, b, max_iter=3, cache=cache)
+    assert detail_frio.get_info()["cache soluciones"] == "miss"
+    assert detail_frio.get_warm_start() == ""
+
+
+def test_arranque_en_caliente_convergido_se_guarda_sin_el_origen(sistema):
+    A, b, esperado = sistema
+    cache = CacheSoluciones()
+    resolver_con_cache("Jacobi", A, b, cache=cache, x0=esperado)
+
+    x, detail = resolver_con_cache("Jacobi", A, b, cache=cache)
+    assert detail.get_info()["cache soluciones"] == "hit"
+    assert detail.get_warm_start() == ""
+    assert detail.get_warm_start_residual() is None
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_limpiar_disco(tmp_path, sistema):
+    A, b, _ = sistema
+    cache = CacheSoluciones(directorio=str(tmp_path))
+    resolver_con_cache("Jacobi", A, b, cache=cache)
+
+    cache.limpiar(disco=True)
+
+    assert len(cache) == 0
+    assert cache.estadisticas()["entradas_disco"] == 0
+    _, detail = resolver_con_cache("Jacobi", A, b, cache=cache)
+    assert detail.get_info()["cache soluciones"] == "miss"
+
+
+def test_clave_de_memmap_por_archivo(tmp_path, sistema):
+    A, b, _ = sistema
+    ruta = tmp_path / "A.dat"
+    A_disco = np.memmap(ruta, dtype=float, mode="w+", shape=A.shape)
+    A_disco[:] = A
+    A_disco.flush()
+
+    clave = clave_solucion("Jacobi", A_disco, b, 1e-10, 1000)
+    assert clave is not None
+    assert clave == clave_solucion("Jacobi", np.memmap(ruta, dtype=float, mode="r", shape=A.shape), b, 1e-10, 1000)
+
+
+def test_memmap_sin_archivo_no_pasa_por_la_cache(tmp_path, sistema):
+    A, b, _ = sistema
+    ruta = tmp_path / "A.dat"
+    A_disco = np.memmap(ruta, dtype=float, mode="w+", shape=A.shape)
+    A_disco[:] = A
+    A_disco.flush()
+    os.remove(ruta)
+
+    cache = CacheSoluciones()
+    x, detail = resolver_con_cache("Jacobi", A_disco, b, cache=cache)
+
+    assert detail.get_info()["cache soluciones"] == "no aplica (A en disco)"
+    assert len(cache) == 0
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-8)
@@ -0,0 +1,81 @@
+import threading
+
+import numpy as np
+import pytest
+
+from controllers.metodos import ResultDetail, TokenCancelacion, bicgstab, gauss_seidel, gmres, gradiente_conjugado, jacobi, sor
+
+
+# Métodos iterativos con cancelación, tiempo límite y progreso
+METODOS = {
+    "Jacobi": jacobi,
+    "Gauss-Seidel": gauss_seidel,
+    "SOR": sor,
+    "Gradiente conjugado": gradiente_conjugado,
+    "GMRES": gmres,
+    "BiCGSTAB": bicgstab,
+}
+
+
+@pytest.fixture
+def poisson():
+    # Converge muy lentamente: con tol = 0 ningún método termina en el
+    # tiempo de una prueba y el monitor de divergencia no lo abandona
+    n = 1000
+    return 2.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1), np.random.default_rng(9).uniform(-1.0, 1.0, n)
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_cancelacion_previa(metodo, poisson):
+    A, b = poisson
+    token = TokenCancelacion()
+    token.cancelar()
+    detail = ResultDetail()
+    x, iteraciones, converged = METODOS[metodo](A, b, tol=0.0, max_iter=100000, detail=detail, cancelacion=token)
+
+    assert not converged
+    assert detail.get_cancelled()
+    assert not detail.get_timed_out()
+    assert iteraciones < 100000
+    assert np.isfinite(x).all()
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_cancelacion_desde_otro_hilo(metodo, poisson):
+    A, b = poisson
+    token = TokenCancelacion()
+    temporizador = threading.Timer(0.05, token.cancelar)
+    temporizador.start()
+    try:
+        detail = ResultDetail()
+        _, _, converged = METODOS[metodo](A, b, tol=0.0, max_iter=10 ** 7, detail=detail, cancelacion=token)
+    finally:
+        temporizador.cancel()
+
+    assert not converged
+    assert detail.get_cancelled()
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_tiempo_limite(metodo, poisson):
+    A, b = poisson
+    detail = ResultDetail()
+    x, _, converged = METODOS[metodo](A, b, tol=0.0, max_iter=10 ** 7, detail=detail, tiempo_limite=0.05)
+
+    assert not converged
+    assert detail.get_timed_out()
+    assert not detail.get_cancelled()
+    # Se devuelve el mejor iterado visto hasta detenerse
+    assert detail.get_best_iterate() is not None
+    np.testing.assert_array_equal(x, detail.get_best_iterate())
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_progreso(metodo, poisson):
+    A, b = poisson
+    llamadas = []
+    METODOS[metodo](A, b, tol=0.0, max_iter=200, progreso=lambda *args: llamadas.append(args))
+
+    assert len(llamadas) > 0
+    iteraciones = [llamada[0] for llamada in llamadas]
+    assert iteraciones == sorted(iteraciones)
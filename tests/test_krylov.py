@@ -0,0 +1,166 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from controllers.matriz_csr import MatrizCSR
+from controllers.metodos import ResultDetail, bicgstab, gmres, gradiente_conjugado
+
+
+@pytest.fixture(autouse=True)
+def advertencias_como_errores():
+    # Una ruptura debe detectarse antes de dividir por cero o propagar NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        yield
+
+
+@pytest.mark.parametrize("A", [
+    np.array([[2.0, 1.0], [0.0, 2.0]]),   # no simétrica
+    np.array([[1.0, 0.0], [0.0, -1.0]]),  # diagonal no positiva
+])
+def test_gradiente_conjugado_rechaza_matrices_no_spd(A):
+    with pytest.raises(ValueError):
+        gradiente_conjugado(A, np.ones(2))
+    with pytest.raises(ValueError):
+        gradiente_conjugado(MatrizCSR.desde_densa(A), np.ones(2))
+
+
+def test_gradiente_conjugado_detecta_curvatura_no_positiva():
+    # Simétrica con diagonal positiva pero indefinida: p^T A p < 0 en la
+    # primera dirección
+    A = np.array([[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError, match="definida positiva"):
+        gradiente_conjugado(A, np.array([1.0, -1.0]))
+
+
+def test_gradiente_conjugado_con_b_nulo():
+    detail = ResultDetail()
+    x, iteraciones, converged = gradiente_conjugado(np.eye(3), np.zeros(3), detail=detail)
+
+    assert converged
+    assert iteraciones == 0
+    np.testing.assert_array_equal(x, np.zeros(3))
+    assert detail.get_residual_history() == [0.0]
+
+
+@pytest.mark.parametrize("b", [np.zeros(4), np.ones(4)])
+def test_gradiente_conjugado_residuo_exacto_con_tol_cero(b):
+    # Con tol = 0 el residuo exactamente nulo cuenta como convergencia en
+    # lugar de dar p = 0 y una curvatura nula
+    A = 2.0 * np.eye(4) - np.eye(4, k=1) - np.eye(4, k=-1)
+    x, iteraciones, converged = gradiente_conjugado(A, b, tol=0.0, max_iter=100)
+
+    assert converged
+    assert iteraciones <= 4
+    np.testing.assert_allclose(x, np.linalg.solve(A, b))
+
+
+def test_gradiente_conjugado_termina_en_n_pasos():
+    # En aritmética exacta CG termina en a lo sumo n pasos; con A = I en uno
+    x, iteraciones, converged = gradiente_conjugado(2.0 * np.eye(5), np.arange(5.0), precondicionador="ninguno")
+
+    assert converged
+    assert iteraciones == 1
+    np.testing.assert_allclose(x, np.arange(5.0) / 2.0)
+
+
+def test_gradiente_conjugado_precondicionador_desconocido(sistema_spd):
+    A, b, _ = sistema_spd
+    with pytest.raises(ValueError):
+        gradiente_conjugado(A, b, precondicionador="multigrid")
+
+
+# Permutación: r_sombra = b es ortogonal a A b desde el primer paso
+PERMUTACION = (np.array([[0.0, 1.0], [1.0, 0.0]]), np.array([1.0, 0.0]))
+
+
+def test_bicgstab_ruptura_por_r_sombra_ortogonal():
+    A, b = PERMUTACION
+    detail = ResultDetail()
+    x, iteraciones, converged = bicgstab(A, b, detail=detail)
+
+    assert not converged
+    assert iteraciones == 0
+    assert detail.get_info()["ruptura"]
+    np.testing.assert_array_equal(x, np.zeros(2))
+
+
+def test_bicgstab_ruptura_sin_paso_de_estabilizacion():
+    # El medio paso deja s en el núcleo de A: t = A s = 0 y omega no está
+    # definido; se conserva el medio paso
+    A = np.array([[1.0, 1.0], [0.0, 0.0]])
+    b = np.array([1.0, 1.0])
+    detail = ResultDetail()
+    x, iteraciones, converged = bicgstab(A, b, detail=detail)
+
+    assert not converged
+    assert iteraciones == 1
+    assert detail.get_info()["ruptura"]
+    np.testing.assert_allclose(x, [1.0, 1.0])
+    assert detail.get_residual_history() == [1.0, 1.0]
+
+
+def test_bicgstab_ruptura_tras_un_paso():
+    # Tras un paso completo la nueva dirección p queda en el núcleo de A:
+    # r_sombra · A p = 0 y se devuelve el x de ese paso
+    A = np.array([[1.0, 1.0], [1.0, 1.0]])
+    detail = ResultDetail()
+    x, iteraciones, converged = bicgstab(A, np.array([1.0, 0.0]), detail=detail)
+
+    assert not converged
+    assert iteraciones == 1
+    assert detail.get_info()["ruptura"]
+    np.testing.assert_allclose(x, [1.0, -0.5])
+
+
+@pytest.mark.parametrize("precondicionador", ["ninguno", "diagonal"])
+def test_gmres_resuelve_la_permutacion(precondicionador):
+    A, b = PERMUTACION
+    x, iteraciones, converged = gmres(A, b, precondicionador=precondicionador)
+
+    assert converged
+    assert iteraciones == 2
+    np.testing.assert_allclose(x, [0.0, 1.0])
+
+
+def test_gmres_ruptura_afortunada():
+    # El subespacio de Krylov es invariante tras un paso: H[1, 0] = 0 y la
+    # solución es exacta
+    x, iteraciones, converged = gmres(3.0 * np.eye(4), np.ones(4))
+
+    assert converged
+    assert iteraciones == 1
+    np.testing.assert_allclose(x, np.ones(4) / 3.0)
+
+
+def test_gmres_matriz_singular():
+    # b no está en la imagen de A: el mínimo residuo no baja de 1 y GMRES
+    # se detiene sin propagar NaN
+    A = np.array([[1.0, 0.0], [0.0, 0.0]])
+    x, _, converged = gmres(A, np.array([1.0, 1.0]), max_iter=50)
+
+    assert not converged
+    assert np.isfinite(x).all()
+    assert x[0] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("krylov", [gmres, bicgstab])
+@pytest.mark.parametrize("precondicionador", ["ninguno", "diagonal", "ilu0"])
+def test_krylov_no_simetrico_coincide_con_numpy(krylov, precondicionador, sistema):
+    A, b, esperado = sistema
+    x, _, converged = krylov(A, b, tol=1e-10, precondicionador=precondicionador)
+
+    assert converged
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_gmres_con_reinicio_corto(sistema):
+    A, b, esperado = sistema
+    detail = ResultDetail()
+    x, _, converged = gmres(A, b, tol=1e-10, reinicio=3, detail=detail)
+
+    assert converged
+    assert detail.get_info()["reinicio (m)"] == 3
+    assert detail.get_info()["ciclos"] > 1
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from controllers.metodos import resolver_lote, solve_many
+
+
+METODOS_SOLVE_MANY = ["Jacobi", "Gauss-Seidel", "SOR", "Gauss-Jordan", "LU", "Gradiente conjugado", "GMRES", "BiCGSTAB"]
+
+
+@pytest.mark.parametrize("metodo", METODOS_SOLVE_MANY)
+def test_solve_many_coincide_con_numpy(metodo, sistema_spd):
+    A, _, _ = sistema_spd
+    B = np.random.default_rng(7).uniform(-1.0, 1.0, (len(A), 5))
+    resultados, detail = solve_many(A, B, metodo=metodo, tol=1e-10)
+
+    assert len(resultados) == 5
+    for j, handler in enumerate(resultados):
+        np.testing.assert_allclose(handler.get_results(), np.linalg.solve(A, B[:, j]), atol=1e-8)
+
+    assert detail.get_converged()
+    assert detail.get_info()["sistemas"] == 5
+    assert detail.get_info()["convergencia por sistema"] == [True] * 5
+
+
+def test_solve_many_con_un_vector(sistema):
+    A, b, esperado = sistema
+    resultados, detail = solve_many(A, b)
+
+    assert len(resultados) == 1
+    np.testing.assert_allclose(resultados[0].get_results(), esperado, atol=1e-10)
+
+
+def test_solve_many_iteraciones_por_columna(sistema):
+    A, b, _ = sistema
+    # La columna de ceros converge en el primer paso; la escalada necesita
+    # al menos tantas iteraciones como la original
+    B = np.column_stack([np.zeros(len(b)), b, 1e6 * b])
+    _, detail = solve_many(A, B, metodo="Jacobi", tol=1e-10)
+
+    iteraciones = detail.get_info()["iteraciones por sistema"]
+    assert iteraciones[0] == 1
+    assert 1 < iteraciones[1] <= iteraciones[2]
+    assert detail.get_total_iterations() == iteraciones[2]
+
+
+def test_solve_many_reporta_columnas_sin_convergencia(sistema):
+    A, b, _ = sistema
+    B = np.column_stack([np.zeros(len(b)), b])
+    _, detail = solve_many(A, B, metodo="Jacobi", tol=1e-10, max_iter=2)
+
+    assert not detail.get_converged()
+    assert detail.get_info()["convergencia por sistema"] == [True, False]
+    assert detail.get_info()["sistemas convergidos"] == 1
+
+
+@pytest.mark.parametrize("A, B", [(np.ones((3, 4)), np.ones(3)), (np.eye(3), np.ones(4))])
+def test_solve_many_dimensiones_invalidas(A, B):
+    with pytest.raises(ValueError):
+        solve_many(A, B)
+
+
+def test_solve_many_metodo_desconocido(sistema):
+    A, b, _ = sistema
+    with pytest.raises(ValueError):
+        solve_many(A, b, metodo="Cramer")
+
+
+def pila_dominante(m, n, semilla=8):
+    rng = np.random.default_rng(semilla)
+    A = rng.uniform(-1.0, 1.0, (m, n, n))
+    i = np.arange(n)
+    A[:, i, i] = np.abs(A).sum(axis=2) + 1.0
+    return A, rng.uniform(-1.0, 1.0, (m, n))
+
+
+@pytest.mark.parametrize("metodo", ["Gauss-Jordan", "Jacobi", "Gauss-Seidel"])
+@pytest.mark.parametrize("n", [3, 4, 8])
+def test_resolver_lote_coincide_con_numpy(metodo, n):
+    A, b = pila_dominante(500, n)
+    x, iteraciones, convergidos = resolver_lote(A, b, metodo=metodo, tol=1e-12)
+
+    assert convergidos.all()
+    assert iteraciones.shape == (500,)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b[..., None])[..., 0], atol=1e-10)
+
+
+def test_resolver_lote_pivotea():
+    # Sin pivoteo el primer pivote de cada sistema sería cero
+    A = np.array([[[0.0, 1.0], [1.0, 0.0]], [[0.0, 2.0], [3.0, 1.0]]])
+    b = np.array([[1.0, 2.0], [4.0, 5.0]])
+    x, _, convergidos = resolver_lote(A, b)
+
+    assert convergidos.all()
+    np.testing.assert_allclose(x, np.linalg.solve(A, b[..., None])[..., 0])
+
+
+def test_resolver_lote_sistema_singular():
+    A, b = pila_dominante(4, 3)
+    A[2] = 1.0
+    x, _, convergidos = resolver_lote(A, b)
+
+    assert convergidos.tolist() == [True, True, False, True]
+    assert np.isnan(x[2]).all()
+    validos = [0, 1, 3]
+    np.testing.assert_allclose(x[validos], np.linalg.solve(A[validos], b[validos, :, None])[..., 0], atol=1e-12)
+
+
+def test_resolver_lote_iterativo_sin_convergencia():
+    A, b = pila_dominante(3, 4)
+    # El segundo sistema no es diagonal dominante: Jacobi diverge
+    A[1] = np.ones((4, 4)) + 3.0 * np.eye(4)[::-1]
+    x, iteraciones, convergidos = resolver_lote(A, b, metodo="Jacobi", max_iter=50)
+
+    assert convergidos.tolist() == [True, False, True]
+    assert iteraciones[1] == 50
+
+
+@pytest.mark.parametrize("A, b", [(np.ones((2, 3, 4)), np.ones((2, 3))), (np.ones((2, 3, 3)), np.ones((2, 4))), (np.eye(3), np.ones(3))])
+def test_resolver_lote_dimensiones_invalidas(A, b):
+    with pytest.raises(ValueError):
+        resolver_lote(A, b)
+
+
+def test_resolver_lote_metodo_desconocido():
+    A, b = pila_dominante(2, 3)
+    with pytest.raises(ValueError):
+        resolver_lote(A, b, metodo="LU")
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from controllers.matriz_csr import MatrizCSR
+from controllers.metodos import (METODO_AUTO, METODO_CARRERA, METODOS, ResultDetail, bicgstab, factorizar_lu, gauss_jordan, gauss_seidel,
+                                 gauss_seidel_multicolor, gmres, gradiente_conjugado, jacobi, resolver_con_metodo, resolver_lu, sor,
+                                 sustitucion_triangular)
+
+
+TOL = 1e-10
+
+# Métodos iterativos que devuelven (x, iteraciones, convergió)
+ITERATIVOS = {
+    "Jacobi": lambda A, b: jacobi(A, b, tol=TOL),
+    "Gauss-Seidel": lambda A, b: gauss_seidel(A, b, tol=TOL),
+    "SOR": lambda A, b: sor(A, b, omega=1.1, tol=TOL),
+    "Gauss-Seidel multicolor": lambda A, b: gauss_seidel_multicolor(A, b, tol=TOL),
+    "Gauss-Seidel multicolor (2 hilos)": lambda A, b: gauss_seidel_multicolor(A, b, tol=TOL, hilos=2),
+    "GMRES": lambda A, b: gmres(A, b, tol=TOL),
+    "BiCGSTAB": lambda A, b: bicgstab(A, b, tol=TOL),
+}
+
+
+@pytest.mark.parametrize("metodo", ITERATIVOS)
+def test_iterativo_coincide_con_numpy(metodo, sistema):
+    A, b, esperado = sistema
+    x, iteraciones, converged = ITERATIVOS[metodo](A, b)
+
+    assert converged
+    assert 0 < iteraciones < 1000
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+@pytest.mark.parametrize("precondicionador", ["ninguno", "diagonal", "ic0"])
+def test_gradiente_conjugado_coincide_con_numpy(precondicionador, sistema_spd):
+    A, b, esperado = sistema_spd
+    x, _, converged = gradiente_conjugado(A, b, tol=TOL, precondicionador=precondicionador)
+
+    assert converged
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+@pytest.mark.parametrize("tam_bloque", [None, 1, 7, 64])
+def test_gauss_jordan_coincide_con_numpy(tam_bloque, sistema):
+    A, b, esperado = sistema
+    np.testing.assert_allclose(gauss_jordan(A, b, tam_bloque=tam_bloque), esperado, atol=1e-10)
+
+
+def test_gauss_jordan_pivotea():
+    # Sin pivoteo el primer pivote sería cero
+    A = np.array([[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [2.0, 0.0, 3.0]])
+    b = np.array([3.0, 2.0, 5.0])
+    np.testing.assert_allclose(gauss_jordan(A, b), np.linalg.solve(A, b))
+
+
+def test_gauss_jordan_singular():
+    with pytest.raises(ValueError):
+        gauss_jordan(np.ones((3, 3)), np.ones(3))
+
+
+@pytest.mark.parametrize("tam_bloque", [1, 7, 64])
+def test_lu_coincide_con_numpy(tam_bloque, sistema):
+    A, b, esperado = sistema
+    LU, perm = factorizar_lu(A, tam_bloque=tam_bloque)
+
+    np.testing.assert_allclose(resolver_lu(LU, perm, b), esperado, atol=1e-10)
+    L = np.tril(LU, -1) + np.eye(len(b))
+    np.testing.assert_allclose(L @ np.triu(LU), A[perm], atol=1e-10)
+
+
+@pytest.mark.parametrize("inferior", [True, False])
+def test_sustitucion_triangular(inferior, sistema):
+    A, b, _ = sistema
+    T = np.tril(A) if inferior else np.triu(A)
+    np.testing.assert_allclose(sustitucion_triangular(T, b), np.linalg.solve(T, b), atol=1e-10)
+
+
+@pytest.mark.parametrize("metodo", [m for m in METODOS if m not in (METODO_CARRERA, METODO_AUTO)])
+def test_resolver_con_metodo(metodo, sistema_spd):
+    A, b, esperado = sistema_spd
+    x, detail = resolver_con_metodo(metodo, A, b, tol=TOL)
+
+    assert isinstance(detail, ResultDetail)
+    assert detail.get_metodo() == metodo
+    assert detail.get_converged()
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_resolver_con_metodo_auto(sistema_spd):
+    A, b, esperado = sistema_spd
+    x, detail = resolver_con_metodo(METODO_AUTO, A, b, tol=TOL)
+
+    assert detail.get_method_choice()
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_resolver_con_metodo_desconocido(sistema):
+    A, b, _ = sistema
+    with pytest.raises(ValueError):
+        resolver_con_metodo("Cramer", A, b)
+
+
+# El multicolor requiere A densa (resolver_con_metodo usa Gauss-Seidel con una MatrizCSR)
+ITERATIVOS_DISPERSOS = [m for m in ITERATIVOS if not m.startswith("Gauss-Seidel multicolor")]
+
+
+@pytest.mark.parametrize("metodo", ITERATIVOS_DISPERSOS)
+def test_iterativo_disperso_coincide_con_numpy(metodo, sistema_disperso):
+    A, b, esperado = sistema_disperso
+    x, _, converged = ITERATIVOS[metodo](MatrizCSR.desde_densa(A), b)
+
+    assert converged
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+@pytest.mark.parametrize("precondicionador", ["ninguno", "diagonal", "ic0", "ilu0"])
+def test_gradiente_conjugado_disperso(precondicionador, sistema_disperso):
+    A, b, esperado = sistema_disperso
+    x, _, converged = gradiente_conjugado(MatrizCSR.desde_densa(A), b, tol=TOL, precondicionador=precondicionador)
+
+    assert converged
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_gauss_jordan_disperso(sistema_disperso):
+    A, b, esperado = sistema_disperso
+    np.testing.assert_allclose(gauss_jordan(MatrizCSR.desde_densa(A), b), esperado, atol=1e-10)
+
+
+@pytest.mark.parametrize("inferior", [True, False])
+def test_sustitucion_triangular_dispersa(inferior, sistema_disperso):
+    A, b, _ = sistema_disperso
+    T = np.tril(A) if inferior else np.triu(A)
+    np.testing.assert_allclose(sustitucion_triangular(MatrizCSR.desde_densa(T), b), np.linalg.solve(T, b), atol=1e-10)
+
+
+@pytest.mark.parametrize("metodo", [m for m in METODOS if m not in (METODO_CARRERA, METODO_AUTO)] + [METODO_AUTO])
+def test_resolver_con_metodo_disperso(metodo, sistema_disperso):
+    A, b, esperado = sistema_disperso
+    x, detail = resolver_con_metodo(metodo, MatrizCSR.desde_densa(A), b, tol=TOL)
+
+    assert detail.get_converged()
+    np.testing.assert_allclose(x, esperado, atol=1e-8)
+
+
+def test_matriz_csr_no_se_densifica_implicitamente(sistema_disperso):
+    A, b, _ = sistema_disperso
+    A_csr = MatrizCSR.desde_densa(A)
+
+    np.testing.assert_array_equal(A_csr.toarray(), A)
+    with pytest.raises(ValueError):
+        np.asarray(A_csr)
+    with pytest.raises(ValueError):
+        gauss_seidel_multicolor(A_csr, b)
@@ -0,0 +1,119 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from controllers.metodos import ResultDetail, gauss_seidel, gauss_seidel_multicolor, jacobi, resolver_con_metodo, sor
+
+
+ESTACIONARIOS = {
+    "Jacobi": jacobi,
+    "Gauss-Seidel": gauss_seidel,
+    "SOR": lambda A, b, **kwargs: sor(A, b, omega=1.5, **kwargs),
+    "Gauss-Seidel multicolor": gauss_seidel_multicolor,
+}
+
+
+@pytest.fixture
+def sistema_no_dominante():
+    # Diagonal casi nula: el radio espectral de Jacobi es enorme
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((300, 300))
+    np.fill_diagonal(A, 0.05)
+    return A, rng.standard_normal(300)
+
+
+@pytest.fixture
+def poisson():
+    # Poisson 1D: converge, pero con un factor de contracción tan cercano
+    # a 1 que no llega a tol en max_iter = 2000
+    n = 200
+    return 2.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1), np.ones(n)
+
+
+def resolver_sin_advertencias(metodo, A, b, **kwargs):
+    '''
+    Resuelve con el método estacionario indicado y falla si numpy emite
+    alguna advertencia (desborde, operación inválida) durante la resolución.
+    '''
+    detail = ResultDetail()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        x, iteraciones, converged = ESTACIONARIOS[metodo](A, b, detail=detail, **kwargs)
+    return x, iteraciones, converged, detail
+
+
+def test_jacobi_diverge(sistema_no_dominante):
+    A, b = sistema_no_dominante
+    x, iteraciones, converged, detail = resolver_sin_advertencias("Jacobi", A, b)
+
+    assert not converged
+    assert detail.get_stop_reason() == "diverged"
+    assert iteraciones < 100
+    # Se devuelve el iterado de menor paso, no el último
+    assert np.isfinite(x).all()
+    np.testing.assert_array_equal(x, detail.get_best_iterate())
+    assert detail.get_best_iteration() < iteraciones
+
+
+@pytest.mark.parametrize("metodo", ["Jacobi", "Gauss-Seidel"])
+def test_diverge_en_sistema_pequeno(metodo):
+    A = np.array([[1.0, 2.0], [2.0, 1.0]])
+    _, iteraciones, converged, detail = resolver_sin_advertencias(metodo, A, np.ones(2))
+
+    assert not converged
+    assert detail.get_stop_reason() == "diverged"
+    assert iteraciones < 100
+
+
+@pytest.mark.parametrize("metodo", ["Gauss-Seidel", "SOR", "Gauss-Seidel multicolor"])
+def test_desborde_se_reporta_como_nan(metodo, sistema_no_dominante):
+    A, b = sistema_no_dominante
+    x, iteraciones, converged, detail = resolver_sin_advertencias(metodo, A, b)
+
+    assert not converged
+    assert detail.get_stop_reason() == "nan"
+    assert iteraciones <= 2
+    assert np.isfinite(x).all()
+
+
+@pytest.mark.parametrize("metodo", ESTACIONARIOS)
+def test_estancamiento(metodo, poisson):
+    A, b = poisson
+    x, iteraciones, converged, detail = resolver_sin_advertencias(metodo, A, b, max_iter=2000)
+
+    assert not converged
+    assert detail.get_stop_reason() == "stagnated"
+    assert iteraciones < 2000
+    # Estancado no es divergente: se devuelve el iterado actual
+    np.testing.assert_array_equal(x, detail.get_best_iterate())
+    assert detail.get_best_iteration() == iteraciones
+    assert 0.0 < detail.get_info()["factor de contracción"] < 1.0
+
+
+def test_sin_tolerancia_no_se_juzga_estancamiento(poisson):
+    A, b = poisson
+    _, iteraciones, converged, detail = resolver_sin_advertencias("Jacobi", A, b, tol=0.0, max_iter=2000)
+
+    assert not converged
+    assert iteraciones == 2000
+    assert detail.get_stop_reason() == ""
+
+
+@pytest.mark.parametrize("metodo", ESTACIONARIOS)
+def test_convergencia_no_se_abandona(metodo, sistema):
+    A, b, esperado = sistema
+    x, _, converged, detail = resolver_sin_advertencias(metodo, A, b, tol=1e-12)
+
+    assert converged
+    assert detail.get_stop_reason() == ""
+    np.testing.assert_allclose(x, esperado, atol=1e-10)
+
+
+def test_motivo_llega_al_detalle_de_resolver_con_metodo(sistema_no_dominante):
+    A, b = sistema_no_dominante
+    x, detail = resolver_con_metodo("Jacobi", A, b)
+
+    assert not detail.get_converged()
+    assert detail.get_stop_reason() == "diverged"
+    assert np.isfinite(x).all()
@@ -190,6 +190,40 @@ class Ui_Dialog(object):
         self.converge.setObjectName("converge")
         self.verticalLayout_4.addWidget(self.converge)
         self.verticalLayout_5.addLayout(self.verticalLayout_4)
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_6.setSpacing(0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.label_info = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_info.sizePolicy().hasHeightForWidth())
+        self.label_info.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Plus Jakarta Sans")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_info.setFont(font)
+        self.label_info.setStyleSheet("color: #A1A0BC;")
+        self.label_info.setObjectName("label_info")
+        self.verticalLayout_6.addWidget(self.label_info)
+        self.info_metodo = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.info_metodo.sizePolicy().hasHeightForWidth())
+        self.info_metodo.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Plus Jakarta Sans")
+        font.setPointSize(12)
+        self.info_metodo.setFont(font)
+        self.info_metodo.setStyleSheet("color: white;")
+        self.info_metodo.setText("")
+        self.info_metodo.setWordWrap(True)
+        self.info_metodo.setObjectName("info_metodo")
+        self.verticalLayout_6.addWidget(self.info_metodo)
+        self.verticalLayout_5.addLayout(self.verticalLayout_6)
         self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
@@ -223,6 +257,7 @@ class Ui_Dialog(object):
         self.total_iterations.setText(_translate("Dialog", "0"))
         self.label_8.setText(_translate("Dialog", "Converge"))
         self.converge.setText(_translate("Dialog", "si"))
+        self.label_info.setText(_translate("Dialog", "Detalles del método"))
 
 
 if __name__ == "__main__":
@@ -28,7 +28,7 @@ class Ui_Form(object):
         self.label.setFont(font)
         self.label.setObjectName("label")
         self.verticalLayout.addWidget(self.label)
-        self.lista_soluciones = QtWidgets.QListWidget(Form)
+        self.lista_soluciones = QtWidgets.QTableView(Form)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
         font.setPointSize(18)
@@ -39,7 +39,13 @@ class Ui_Form(object):
         self.lista_soluciones.setStyleSheet("border-radius: 20px;\n"
 "color: #eee;\n"
 "")
+        self.lista_soluciones.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.lista_soluciones.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.lista_soluciones.setShowGrid(False)
         self.lista_soluciones.setObjectName("lista_soluciones")
+        self.lista_soluciones.horizontalHeader().setVisible(False)
+        self.lista_soluciones.horizontalHeader().setStretchLastSection(True)
+        self.lista_soluciones.verticalHeader().setVisible(False)
         self.verticalLayout.addWidget(self.lista_soluciones)
         self.regresar_btn = QtWidgets.QPushButton(Form)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
@@ -61,8 +67,8 @@ class Ui_Form(object):
         self.regresar_btn.setObjectName("regresar_btn")
         self.verticalLayout.addWidget(self.regresar_btn)
         self.horizontalLayout.addLayout(self.verticalLayout)
-        self.tabla_iteraciones = QtWidgets.QTableWidget(Form)
-        self.tabla_iteraciones.setStyleSheet("QTableWidget {\n"
+        self.tabla_iteraciones = QtWidgets.QTableView(Form)
+        self.tabla_iteraciones.setStyleSheet("QTableView {\n"
 "    background-color: #070B14;\n"
 "    color: white;\n"
 "    gridline-color: #1a1f2e;\n"
@@ -71,7 +77,7 @@ class Ui_Form(object):
 "}\n"
 "\n"
 "/* Encabezados horizontales (columnas) */\n"
-"QTableWidget QHeaderView::section {\n"
+"QTableView QHeaderView::section {\n"
 "    background-color: #161D37;\n"
 "    color: white;\n"
 "    padding: 10px;\n"
@@ -81,7 +87,7 @@ class Ui_Form(object):
 "}\n"
 "\n"
 "/* Encabezados verticales (filas) */\n"
-"QTableWidget QHeaderView::section:vertical {\n"
+"QTableView QHeaderView::section:vertical {\n"
 "    background-color: #0a0f1a;\n"
 "    color: white;\n"
 "    padding: 8px;\n"
@@ -90,7 +96,7 @@ class Ui_Form(object):
 "}\n"
 "\n"
 "/* Celdas de la tabla */\n"
-"QTableWidget::item {\n"
+"QTableView::item {\n"
 "    background-color: #070B14;\n"
 "    color: white;\n"
 "    padding: 8px;\n"
@@ -98,118 +104,82 @@ class Ui_Form(object):
 "}\n"
 "\n"
 "/* Celdas seleccionadas */\n"
-"QTableWidget::item:selected {\n"
+"QTableView::item:selected {\n"
 "    background-color: #2a2570;\n"
 "    color: white;\n"
 "}\n"
 "\n"
 "/* Celdas al pasar el mouse */\n"
-"QTableWidget::item:hover {\n"
+"QTableView::item:hover {\n"
 "    background-color: #0f1520;\n"
 "}\n"
 "\n"
 "/* Eliminar el borde de foco */\n"
-"QTableWidget::item:focus {\n"
+"QTableView::item:focus {\n"
 "    outline: none;\n"
 "    border: none;\n"
 "}\n"
 "\n"
 "/* Esquina superior izquierda (donde se cruzan los encabezados) */\n"
-"QTableWidget QTableCornerButton::section {\n"
+"QTableView QTableCornerButton::section {\n"
 "    background-color: #161D37;\n"
 "    border: none;\n"
 "}\n"
 "\n"
 "/* Scrollbar vertical */\n"
-"QTableWidget QScrollBar:vertical {\n"
+"QTableView QScrollBar:vertical {\n"
 "    border: none;\n"
 "    background: #0a0f1a;\n"
 "    width: 10px;\n"
 "    margin: 0px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::handle:vertical {\n"
+"QTableView QScrollBar::handle:vertical {\n"
 "    background: #2a2570;\n"
 "    min-height: 20px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::handle:vertical:hover {\n"
+"QTableView QScrollBar::handle:vertical:hover {\n"
 "    background: #3a3580;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::add-line:vertical,\n"
-"QTableWidget QScrollBar::sub-line:vertical {\n"
+"QTableView QScrollBar::add-line:vertical,\n"
+"QTableView QScrollBar::sub-line:vertical {\n"
 "    height: 0px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::add-page:vertical,\n"
-"QTableWidget QScrollBar::sub-page:vertical {\n"
+"QTableView QScrollBar::add-page:vertical,\n"
+"QTableView QScrollBar::sub-page:vertical {\n"
 "    background: none;\n"
 "}\n"
 "\n"
 "/* Scrollbar horizontal */\n"
-"QTableWidget QScrollBar:horizontal {\n"
+"QTableView QScrollBar:horizontal {\n"
 "    border: none;\n"
 "    background: #0a0f1a;\n"
 "    height: 10px;\n"
 "    margin: 0px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::handle:horizontal {\n"
+"QTableView QScrollBar::handle:horizontal {\n"
 "    background: #2a2570;\n"
 "    min-width: 20px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::handle:horizontal:hover {\n"
+"QTableView QScrollBar::handle:horizontal:hover {\n"
 "    background: #3a3580;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::add-line:horizontal,\n"
-"QTableWidget QScrollBar::sub-line:horizontal {\n"
+"QTableView QScrollBar::add-line:horizontal,\n"
+"QTableView QScrollBar::sub-line:horizontal {\n"
 "    width: 0px;\n"
 "}\n"
 "\n"
-"QTableWidget QScrollBar::add-page:horizontal,\n"
-"QTableWidget QScrollBar::sub-page:horizontal {\n"
+"QTableView QScrollBar::add-page:horizontal,\n"
+"QTableView QScrollBar::sub-page:horizontal {\n"
 "    background: none;\n"
 "}")
         self.tabla_iteraciones.setObjectName("tabla_iteraciones")
-        self.tabla_iteraciones.setColumnCount(8)
-        self.tabla_iteraciones.setRowCount(1)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setHorizontalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tabla_iteraciones.setItem(0, 7, item)
         self.horizontalLayout.addWidget(self.tabla_iteraciones)
         self.horizontalLayout.setStretch(1, 1)
 
@@ -221,43 +191,6 @@ class Ui_Form(object):
         Form.setWindowTitle(_translate("Form", "Form"))
         self.label.setText(_translate("Form", "Soluciones"))
         self.regresar_btn.setText(_translate("Form", "← Regresar"))
-        item = self.tabla_iteraciones.verticalHeaderItem(0)
-        item.setText(_translate("Form", "0"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(0)
-        item.setText(_translate("Form", "x1"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(1)
-        item.setText(_translate("Form", "x2"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(2)
-        item.setText(_translate("Form", "x3"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(3)
-        item.setText(_translate("Form", "x4"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(4)
-        item.setText(_translate("Form", "Xi1"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(5)
-        item.setText(_translate("Form", "Xi2"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(6)
-        item.setText(_translate("Form", "Xi3"))
-        item = self.tabla_iteraciones.horizontalHeaderItem(7)
-        item.setText(_translate("Form", "Xi4"))
-        __sortingEnabled = self.tabla_iteraciones.isSortingEnabled()
-        self.tabla_iteraciones.setSortingEnabled(False)
-        item = self.tabla_iteraciones.item(0, 0)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 1)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 2)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 3)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 4)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 5)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 6)
-        item.setText(_translate("Form", "1"))
-        item = self.tabla_iteraciones.item(0, 7)
-        item.setText(_translate("Form", "1"))
-        self.tabla_iteraciones.setSortingEnabled(__sortingEnabled)
 
 
 if __name__ == "__main__":
@@ -60,415 +60,68 @@ class Ui_solver_screen(object):
         self.label_5.setObjectName("label_5")
         self.horizontalLayout_4.addWidget(self.label_5)
         self.matrix_prototipe_layout.addLayout(self.horizontalLayout_4)
-        self.matriz_layout = QtWidgets.QGridLayout()
-        self.matriz_layout.setObjectName("matriz_layout")
-        self.a21_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a21_field.sizePolicy().hasHeightForWidth())
-        self.a21_field.setSizePolicy(sizePolicy)
-        self.a21_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a21_field.setFont(font)
-        self.a21_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a21_field.setText("")
-        self.a21_field.setFrame(True)
-        self.a21_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a21_field.setObjectName("a21_field")
-        self.matriz_layout.addWidget(self.a21_field, 1, 0, 1, 1)
-        self.a23_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a23_field.sizePolicy().hasHeightForWidth())
-        self.a23_field.setSizePolicy(sizePolicy)
-        self.a23_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a23_field.setFont(font)
-        self.a23_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a23_field.setText("")
-        self.a23_field.setFrame(True)
-        self.a23_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a23_field.setObjectName("a23_field")
-        self.matriz_layout.addWidget(self.a23_field, 1, 2, 1, 1)
-        self.c2_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.c2_field.sizePolicy().hasHeightForWidth())
-        self.c2_field.setSizePolicy(sizePolicy)
-        self.c2_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.c2_field.setFont(font)
-        self.c2_field.setStyleSheet("background: #1D1C56;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.c2_field.setText("")
-        self.c2_field.setFrame(True)
-        self.c2_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.c2_field.setObjectName("c2_field")
-        self.matriz_layout.addWidget(self.c2_field, 1, 4, 1, 1)
-        self.a22_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a22_field.sizePolicy().hasHeightForWidth())
-        self.a22_field.setSizePolicy(sizePolicy)
-        self.a22_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a22_field.setFont(font)
-        self.a22_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a22_field.setText("")
-        self.a22_field.setFrame(True)
-        self.a22_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a22_field.setObjectName("a22_field")
-        self.matriz_layout.addWidget(self.a22_field, 1, 1, 1, 1)
-        self.c4_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.c4_field.sizePolicy().hasHeightForWidth())
-        self.c4_field.setSizePolicy(sizePolicy)
-        self.c4_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.c4_field.setFont(font)
-        self.c4_field.setStyleSheet("background: #1D1C56;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.c4_field.setText("")
-        self.c4_field.setFrame(True)
-        self.c4_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.c4_field.setObjectName("c4_field")
-        self.matriz_layout.addWidget(self.c4_field, 3, 4, 1, 1)
-        self.a11_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a11_field.sizePolicy().hasHeightForWidth())
-        self.a11_field.setSizePolicy(sizePolicy)
-        self.a11_field.setMinimumSize(QtCore.QSize(80, 80))
+        self.tabla_matriz = QtWidgets.QTableView(solver_screen)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
         font.setPointSize(16)
-        self.a11_field.setFont(font)
-        self.a11_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a11_field.setText("")
-        self.a11_field.setFrame(True)
-        self.a11_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a11_field.setObjectName("a11_field")
-        self.matriz_layout.addWidget(self.a11_field, 0, 0, 1, 1)
-        self.a41_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a41_field.sizePolicy().hasHeightForWidth())
-        self.a41_field.setSizePolicy(sizePolicy)
-        self.a41_field.setMinimumSize(QtCore.QSize(80, 80))
+        self.tabla_matriz.setFont(font)
+        self.tabla_matriz.setStyleSheet("QTableView {\n"
+"    background: #070B14;\n"
+"    color: white;\n"
+"    gridline-color: #070B14;\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"QTableView::item {\n"
+"    background: #161D37;\n"
+"    border-radius: 15px;\n"
+"    margin: 4px;\n"
+"}\n"
+"\n"
+"QTableView::item:selected {\n"
+"    background: #2a2570;\n"
+"}\n"
+"\n"
+"QTableView QLineEdit {\n"
+"    background: #161D37;\n"
+"    color: white;\n"
+"    border: 0;\n"
+"    border-radius: 15px;\n"
+"}\n"
+"\n"
+"QTableView QHeaderView::section {\n"
+"    background: #070B14;\n"
+"    color: rgb(202, 202, 202);\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"QTableView QTableCornerButton::section {\n"
+"    background: #070B14;\n"
+"    border: none;\n"
+"}")
+        self.tabla_matriz.setEditTriggers(QtWidgets.QAbstractItemView.AnyKeyPressed|QtWidgets.QAbstractItemView.DoubleClicked|QtWidgets.QAbstractItemView.EditKeyPressed|QtWidgets.QAbstractItemView.SelectedClicked)
+        self.tabla_matriz.setShowGrid(False)
+        self.tabla_matriz.setObjectName("tabla_matriz")
+        self.tabla_matriz.horizontalHeader().setDefaultSectionSize(88)
+        self.tabla_matriz.verticalHeader().setDefaultSectionSize(88)
+        self.matrix_prototipe_layout.addWidget(self.tabla_matriz)
+        self.info_importacion = QtWidgets.QLabel(solver_screen)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a41_field.setFont(font)
-        self.a41_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a41_field.setText("")
-        self.a41_field.setFrame(True)
-        self.a41_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a41_field.setObjectName("a41_field")
-        self.matriz_layout.addWidget(self.a41_field, 3, 0, 1, 1)
-        self.c1_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.c1_field.sizePolicy().hasHeightForWidth())
-        self.c1_field.setSizePolicy(sizePolicy)
-        self.c1_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.c1_field.setFont(font)
-        self.c1_field.setStyleSheet("background: #1D1C56;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.c1_field.setText("")
-        self.c1_field.setFrame(True)
-        self.c1_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.c1_field.setObjectName("c1_field")
-        self.matriz_layout.addWidget(self.c1_field, 0, 4, 1, 1)
-        self.a42_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a42_field.sizePolicy().hasHeightForWidth())
-        self.a42_field.setSizePolicy(sizePolicy)
-        self.a42_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a42_field.setFont(font)
-        self.a42_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a42_field.setText("")
-        self.a42_field.setFrame(True)
-        self.a42_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a42_field.setObjectName("a42_field")
-        self.matriz_layout.addWidget(self.a42_field, 3, 1, 1, 1)
-        self.a12_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a12_field.sizePolicy().hasHeightForWidth())
-        self.a12_field.setSizePolicy(sizePolicy)
-        self.a12_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a12_field.setFont(font)
-        self.a12_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a12_field.setText("")
-        self.a12_field.setFrame(True)
-        self.a12_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a12_field.setObjectName("a12_field")
-        self.matriz_layout.addWidget(self.a12_field, 0, 1, 1, 1)
-        self.a13_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a13_field.sizePolicy().hasHeightForWidth())
-        self.a13_field.setSizePolicy(sizePolicy)
-        self.a13_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a13_field.setFont(font)
-        self.a13_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a13_field.setText("")
-        self.a13_field.setFrame(True)
-        self.a13_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a13_field.setObjectName("a13_field")
-        self.matriz_layout.addWidget(self.a13_field, 0, 2, 1, 1)
-        self.a33_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a33_field.sizePolicy().hasHeightForWidth())
-        self.a33_field.setSizePolicy(sizePolicy)
-        self.a33_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a33_field.setFont(font)
-        self.a33_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a33_field.setText("")
-        self.a33_field.setFrame(True)
-        self.a33_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a33_field.setObjectName("a33_field")
-        self.matriz_layout.addWidget(self.a33_field, 2, 2, 1, 1)
-        self.c3_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.c3_field.sizePolicy().hasHeightForWidth())
-        self.c3_field.setSizePolicy(sizePolicy)
-        self.c3_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.c3_field.setFont(font)
-        self.c3_field.setStyleSheet("background: #1D1C56;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.c3_field.setText("")
-        self.c3_field.setFrame(True)
-        self.c3_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.c3_field.setObjectName("c3_field")
-        self.matriz_layout.addWidget(self.c3_field, 2, 4, 1, 1)
-        self.a31_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a31_field.sizePolicy().hasHeightForWidth())
-        self.a31_field.setSizePolicy(sizePolicy)
-        self.a31_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a31_field.setFont(font)
-        self.a31_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a31_field.setText("")
-        self.a31_field.setFrame(True)
-        self.a31_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a31_field.setObjectName("a31_field")
-        self.matriz_layout.addWidget(self.a31_field, 2, 0, 1, 1)
-        self.a32_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a32_field.sizePolicy().hasHeightForWidth())
-        self.a32_field.setSizePolicy(sizePolicy)
-        self.a32_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a32_field.setFont(font)
-        self.a32_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a32_field.setText("")
-        self.a32_field.setFrame(True)
-        self.a32_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a32_field.setObjectName("a32_field")
-        self.matriz_layout.addWidget(self.a32_field, 2, 1, 1, 1)
-        self.a43_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a43_field.sizePolicy().hasHeightForWidth())
-        self.a43_field.setSizePolicy(sizePolicy)
-        self.a43_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a43_field.setFont(font)
-        self.a43_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a43_field.setText("")
-        self.a43_field.setFrame(True)
-        self.a43_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a43_field.setObjectName("a43_field")
-        self.matriz_layout.addWidget(self.a43_field, 3, 2, 1, 1)
-        self.a14_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a14_field.sizePolicy().hasHeightForWidth())
-        self.a14_field.setSizePolicy(sizePolicy)
-        self.a14_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a14_field.setFont(font)
-        self.a14_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a14_field.setText("")
-        self.a14_field.setFrame(True)
-        self.a14_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a14_field.setObjectName("a14_field")
-        self.matriz_layout.addWidget(self.a14_field, 0, 3, 1, 1)
-        self.a24_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a24_field.sizePolicy().hasHeightForWidth())
-        self.a24_field.setSizePolicy(sizePolicy)
-        self.a24_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a24_field.setFont(font)
-        self.a24_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a24_field.setText("")
-        self.a24_field.setFrame(True)
-        self.a24_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a24_field.setObjectName("a24_field")
-        self.matriz_layout.addWidget(self.a24_field, 1, 3, 1, 1)
-        self.a34_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a34_field.sizePolicy().hasHeightForWidth())
-        self.a34_field.setSizePolicy(sizePolicy)
-        self.a34_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a34_field.setFont(font)
-        self.a34_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a34_field.setText("")
-        self.a34_field.setFrame(True)
-        self.a34_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a34_field.setObjectName("a34_field")
-        self.matriz_layout.addWidget(self.a34_field, 2, 3, 1, 1)
-        self.a44_field = QtWidgets.QLineEdit(solver_screen)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.a44_field.sizePolicy().hasHeightForWidth())
-        self.a44_field.setSizePolicy(sizePolicy)
-        self.a44_field.setMinimumSize(QtCore.QSize(80, 80))
-        font = QtGui.QFont()
-        font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(16)
-        self.a44_field.setFont(font)
-        self.a44_field.setStyleSheet("background: #161D37;\n"
-"border: 0;\n"
-"border-radius: 15px;\n"
-"color: white;")
-        self.a44_field.setText("")
-        self.a44_field.setFrame(True)
-        self.a44_field.setAlignment(QtCore.Qt.AlignCenter)
-        self.a44_field.setObjectName("a44_field")
-        self.matriz_layout.addWidget(self.a44_field, 3, 3, 1, 1)
-        self.matrix_prototipe_layout.addLayout(self.matriz_layout)
+        font.setPointSize(12)
+        self.info_importacion.setFont(font)
+        self.info_importacion.setStyleSheet("color: rgb(202, 202, 202);\n"
+"background: rgba(0,0,0,0);")
+        self.info_importacion.setText("")
+        self.info_importacion.setWordWrap(True)
+        self.info_importacion.setObjectName("info_importacion")
+        self.matrix_prototipe_layout.addWidget(self.info_importacion)
         spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.matrix_prototipe_layout.addItem(spacerItem3)
         self.matrix_prototipe_layout.setStretch(0, 1)
         self.matrix_prototipe_layout.setStretch(1, 1)
         self.matrix_prototipe_layout.setStretch(2, 5)
-        self.matrix_prototipe_layout.setStretch(3, 1)
+        self.matrix_prototipe_layout.setStretch(4, 1)
         self.horizontalLayout_5.addLayout(self.matrix_prototipe_layout)
         self.config_widget = QtWidgets.QWidget(solver_screen)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
@@ -526,6 +179,14 @@ class Ui_solver_screen(object):
         self.seleccionar_metodo.addItem("")
         self.seleccionar_metodo.addItem("")
         self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
+        self.seleccionar_metodo.addItem("")
         self.layout_for_metodo.addWidget(self.seleccionar_metodo)
         self.verticalLayout_2.addLayout(self.layout_for_metodo)
         self.layout_for_presicion = QtWidgets.QVBoxLayout()
@@ -612,59 +273,70 @@ class Ui_solver_screen(object):
 "color: rgb(202, 202, 202);")
         self.tag_for_slider.setObjectName("tag_for_slider")
         self.layout_for_matrix_size.addWidget(self.tag_for_slider)
-        self.matrix_size_slider = QtWidgets.QSlider(self.config_widget)
-        self.matrix_size_slider.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-        self.matrix_size_slider.setStyleSheet("background: rgba(0,0,0,0);color: rgb(255, 255, 255);")
-        self.matrix_size_slider.setMinimum(2)
-        self.matrix_size_slider.setMaximum(4)
-        self.matrix_size_slider.setSliderPosition(4)
-        self.matrix_size_slider.setOrientation(QtCore.Qt.Horizontal)
-        self.matrix_size_slider.setObjectName("matrix_size_slider")
-        self.layout_for_matrix_size.addWidget(self.matrix_size_slider)
-        self.horizontalLayout = QtWidgets.QHBoxLayout()
-        self.horizontalLayout.setObjectName("horizontalLayout")
-        self.label_3 = QtWidgets.QLabel(self.config_widget)
+        self.matrix_size_spin = QtWidgets.QSpinBox(self.config_widget)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(12)
-        self.label_3.setFont(font)
-        self.label_3.setStyleSheet("color: rgb(202, 202, 202);\n"
-"background: rgba(0,0,0,0);")
-        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_3.setObjectName("label_3")
-        self.horizontalLayout.addWidget(self.label_3)
-        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout.addItem(spacerItem4)
-        self.label_2 = QtWidgets.QLabel(self.config_widget)
+        font.setPointSize(14)
+        self.matrix_size_spin.setFont(font)
+        self.matrix_size_spin.setStyleSheet("background: #161D37;\n"
+"border: 0;\n"
+"border-radius: 10px;\n"
+"color: white;")
+        self.matrix_size_spin.setAlignment(QtCore.Qt.AlignCenter)
+        self.matrix_size_spin.setMinimum(1)
+        self.matrix_size_spin.setMaximum(2000)
+        self.matrix_size_spin.setProperty("value", 4)
+        self.matrix_size_spin.setObjectName("matrix_size_spin")
+        self.layout_for_matrix_size.addWidget(self.matrix_size_spin)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.layout_for_matrix_size.addItem(spacerItem4)
+        self.verticalLayout_2.addLayout(self.layout_for_matrix_size)
+        self.layout_for_progreso = QtWidgets.QVBoxLayout()
+        self.layout_for_progreso.setObjectName("layout_for_progreso")
+        self.progreso_bar = QtWidgets.QProgressBar(self.config_widget)
+        self.progreso_bar.setMaximumSize(QtCore.QSize(16777215, 12))
+        self.progreso_bar.setStyleSheet("QProgressBar {\n"
+"border-radius: 6px;\n"
+"background: #D9D9D9;\n"
+"}\n"
+"QProgressBar::chunk {\n"
+"border-radius: 6px;\n"
+"background: #4F49CF;\n"
+"}")
+        self.progreso_bar.setProperty("value", 0)
+        self.progreso_bar.setTextVisible(False)
+        self.progreso_bar.setObjectName("progreso_bar")
+        self.layout_for_progreso.addWidget(self.progreso_bar)
+        self.progreso_label = QtWidgets.QLabel(self.config_widget)
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
         font.setPointSize(12)
-        self.label_2.setFont(font)
-        self.label_2.setStyleSheet("color: rgb(202, 202, 202);\n"
+        self.progreso_label.setFont(font)
+        self.progreso_label.setStyleSheet("color: rgb(202, 202, 202);\n"
 "background: rgba(0,0,0,0);")
-        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_2.setObjectName("label_2")
-        self.horizontalLayout.addWidget(self.label_2)
+        self.progreso_label.setText("")
+        self.progreso_label.setObjectName("progreso_label")
+        self.layout_for_progreso.addWidget(self.progreso_label)
+        self.verticalLayout_2.addLayout(self.layout_for_progreso)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
         spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout.addItem(spacerItem5)
-        self.label_4 = QtWidgets.QLabel(self.config_widget)
+        self.horizontalLayout_3.addItem(spacerItem5)
+        self.importar_btn = QtWidgets.QPushButton(self.config_widget)
+        self.importar_btn.setMinimumSize(QtCore.QSize(90, 0))
         font = QtGui.QFont()
         font.setFamily("Plus Jakarta Sans")
-        font.setPointSize(12)
-        self.label_4.setFont(font)
-        self.label_4.setStyleSheet("color: rgb(202, 202, 202);\n"
-"background: rgba(0,0,0,0);")
-        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_4.setObjectName("label_4")
-        self.horizontalLayout.addWidget(self.label_4)
-        self.layout_for_matrix_size.addLayout(self.horizontalLayout)
-        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.layout_for_matrix_size.addItem(spacerItem6)
-        self.verticalLayout_2.addLayout(self.layout_for_matrix_size)
-        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
-        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_3.addItem(spacerItem7)
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.importar_btn.setFont(font)
+        self.importar_btn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.importar_btn.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.importar_btn.setStyleSheet("border-radius: 10px;\n"
+"background: #D9D9D9;\n"
+"color: #222222;")
+        self.importar_btn.setObjectName("importar_btn")
+        self.horizontalLayout_3.addWidget(self.importar_btn)
         self.limpiar_matriz_btn = QtWidgets.QPushButton(self.config_widget)
         self.limpiar_matriz_btn.setMinimumSize(QtCore.QSize(90, 0))
         font = QtGui.QFont()
@@ -680,6 +352,22 @@ class Ui_solver_screen(object):
 "color: #222222;")
         self.limpiar_matriz_btn.setObjectName("limpiar_matriz_btn")
         self.horizontalLayout_3.addWidget(self.limpiar_matriz_btn)
+        self.cancelar_btn = QtWidgets.QPushButton(self.config_widget)
+        self.cancelar_btn.setEnabled(False)
+        self.cancelar_btn.setMinimumSize(QtCore.QSize(90, 0))
+        font = QtGui.QFont()
+        font.setFamily("Plus Jakarta Sans")
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.cancelar_btn.setFont(font)
+        self.cancelar_btn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.cancelar_btn.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.cancelar_btn.setStyleSheet("border-radius: 10px;\n"
+"background: #D9D9D9;\n"
+"color: #222222;")
+        self.cancelar_btn.setObjectName("cancelar_btn")
+        self.horizontalLayout_3.addWidget(self.cancelar_btn)
         self.resolver_btn = QtWidgets.QPushButton(self.config_widget)
         self.resolver_btn.setMinimumSize(QtCore.QSize(90, 0))
         font = QtGui.QFont()
@@ -706,41 +394,29 @@ class Ui_solver_screen(object):
         solver_screen.setWindowTitle(_translate("solver_screen", "Form"))
         self.label.setText(_translate("solver_screen", "Variables"))
         self.label_5.setText(_translate("solver_screen", "Termino ind."))
-        self.a21_field.setPlaceholderText(_translate("solver_screen", "a21"))
-        self.a23_field.setPlaceholderText(_translate("solver_screen", "a23"))
-        self.c2_field.setPlaceholderText(_translate("solver_screen", "c2"))
-        self.a22_field.setPlaceholderText(_translate("solver_screen", "a22"))
-        self.c4_field.setPlaceholderText(_translate("solver_screen", "c4"))
-        self.a11_field.setPlaceholderText(_translate("solver_screen", "a11"))
-        self.a41_field.setPlaceholderText(_translate("solver_screen", "a41"))
-        self.c1_field.setPlaceholderText(_translate("solver_screen", "c1"))
-        self.a42_field.setPlaceholderText(_translate("solver_screen", "a42"))
-        self.a12_field.setPlaceholderText(_translate("solver_screen", "a12"))
-        self.a13_field.setPlaceholderText(_translate("solver_screen", "a13"))
-        self.a33_field.setPlaceholderText(_translate("solver_screen", "a33"))
-        self.c3_field.setPlaceholderText(_translate("solver_screen", "c3"))
-        self.a31_field.setPlaceholderText(_translate("solver_screen", "a31"))
-        self.a32_field.setPlaceholderText(_translate("solver_screen", "a32"))
-        self.a43_field.setPlaceholderText(_translate("solver_screen", "a43"))
-        self.a14_field.setPlaceholderText(_translate("solver_screen", "a14"))
-        self.a24_field.setPlaceholderText(_translate("solver_screen", "a24"))
-        self.a34_field.setPlaceholderText(_translate("solver_screen", "a34"))
-        self.a44_field.setPlaceholderText(_translate("solver_screen", "a44"))
         self.title_for_config_widget.setText(_translate("solver_screen", "Ajustes"))
         self.label_for_metodo.setText(_translate("solver_screen", "Modelo"))
         self.seleccionar_metodo.setItemText(0, _translate("solver_screen", "Jacobi"))
         self.seleccionar_metodo.setItemText(1, _translate("solver_screen", "Gauss-Seidel"))
         self.seleccionar_metodo.setItemText(2, _translate("solver_screen", "Gauss-Jordan"))
+        self.seleccionar_metodo.setItemText(3, _translate("solver_screen", "SOR"))
+        self.seleccionar_metodo.setItemText(4, _translate("solver_screen", "Gauss-Seidel multicolor"))
+        self.seleccionar_metodo.setItemText(5, _translate("solver_screen", "LU"))
+        self.seleccionar_metodo.setItemText(6, _translate("solver_screen", "Gradiente conjugado"))
+        self.seleccionar_metodo.setItemText(7, _translate("solver_screen", "GMRES"))
+        self.seleccionar_metodo.setItemText(8, _translate("solver_screen", "BiCGSTAB"))
+        self.seleccionar_metodo.setItemText(9, _translate("solver_screen", "Auto"))
+        self.seleccionar_metodo.setItemText(10, _translate("solver_screen", "Carrera de métodos"))
         self.label_for_precision.setText(_translate("solver_screen", "Precision"))
         self.label_for_tolerancia.setText(_translate("solver_screen", "Tolerancia"))
         self.tolerancia_field.setText(_translate("solver_screen", "0.000000000001"))
         self.label_for_iteraciones_maximas.setText(_translate("solver_screen", "Iteraciones maximas"))
         self.iteraciones_maximas_field.setText(_translate("solver_screen", "100"))
         self.tag_for_slider.setText(_translate("solver_screen", "Tamaño"))
-        self.label_3.setText(_translate("solver_screen", "2x2"))
-        self.label_2.setText(_translate("solver_screen", "3x3"))
-        self.label_4.setText(_translate("solver_screen", "4x4"))
+        self.matrix_size_spin.setSuffix(_translate("solver_screen", " incógnitas"))
+        self.importar_btn.setText(_translate("solver_screen", "Importar"))
         self.limpiar_matriz_btn.setText(_translate("solver_screen", "Limpiar"))
+        self.cancelar_btn.setText(_translate("solver_screen", "Cancelar"))
         self.resolver_btn.setText(_translate("solver_screen", "Resolver"))
 
 